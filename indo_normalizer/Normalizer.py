@@ -1,86 +1,204 @@
 import re
-import pandas as pd
-import os
 import collections
+import collections.abc
+import concurrent.futures
+import functools
+import os
+import threading
+import time
 
 # Mengimpor semua fungsi dari file functions.py (impor relatif)
 from .functions import (
     tokenize_text,
+    retokenize,
     normalize_repetitions,
-    is_abbreviation,
     normalize_leet,
     normalize_forced_leet,
-    slang_to_formal,
-    is_typo
+    slang_to_formal
 )
+from .cache import TokenCache
+from .store import TokenStore
+from .metrics import StageMetrics
+from .stages import ALL_STAGES, LEET_STAGES, LEXICAL_STAGES, select_stages
+from .streaming import iter_batches, iter_micro_batches
+from .corpora import Corpus, build_corpus, bundled_paths, load_corpus
+
+# Pengklasifikasi token tahap 1, dikompilasi sekali dan dipakai untuk setiap token
+_WORD_CHAR_PATTERN = re.compile(r'[a-zA-Z0-9]')
+_FORCED_LEET_CHAR_PATTERN = re.compile(r'[0-9!@$]')
+
+# Reload korpus dijalankan satu per satu agar korpus yang lebih lama tidak menimpa yang baru
+_RELOAD_LOCK = threading.Lock()
+
+
+def _memoize(resolve):
+    """Membungkus fungsi resolusi token dengan memo dict (dipakai dalam satu batch)."""
+    memo = {}
+
+    def memoized(token):
+        result = memo.get(token)
+        if result is None:
+            result = memo[token] = resolve(token)
+        return result
+
+    return memoized
+
+
+def _materialize(source):
+    """Menyalin sumber korpus in-memory (iterable sekali pakai) agar bisa dibaca ulang saat reload."""
+    if source is None or isinstance(source, (str, os.PathLike)):
+        return source
+    if isinstance(source, collections.abc.Mapping):
+        return dict(source)
+    return list(source)
+
 
 class Normalizer:
     """
     Kelas untuk menormalisasi teks Bahasa Indonesia dan menghitung statistik terkait.
     Memuat korpus dari common_words.txt dan slangs.csv.
+
+    Korpus adalah objek `Corpus` yang tidak bisa diubah dan dimiliki setiap instance.
+    Korpus dari file dimuat secara lazy saat pertama kali dibutuhkan lewat registry
+    (`corpora.load_corpus`), sehingga setiap file hanya dibaca sekali per proses dan
+    semua instance dengan sumber yang sama memakai satu salinan. Korpus bisa dibangun
+    dari file atau data in-memory sendiri, berlapis, dan dimuat ulang dengan `reload`.
     """
-    _COMMON_WORDS = set()
-    _SLANG_TO_FORMAL_MAP = {}
-    _COMMON_WORDS_SORTED = []
-
-    def __init__(self):
-        """
-        Inisialisasi Normalizer dan memuat korpus yang diperlukan.
-        File korpus diasumsikan berada di subfolder 'corpus/' di dalam package 'text_normalizer'.
-        """
-        # Dapatkan direktori dari file Normalizer.py ini
-        base_dir = os.path.dirname(os.path.abspath(__file__))
-        corpus_dir = os.path.join(base_dir, 'corpus')
-
-        self.common_words_path = os.path.join(corpus_dir, 'common_words.txt')
-        self.slangs_csv_path = os.path.join(corpus_dir, 'slangs.csv')
-
-        # Load COMMON_WORDS
-        try:
-            with open(self.common_words_path, "r", encoding="utf-8") as f:
-                # Read line by line to preserve order and handle each word
-                # Also, strip whitespace and convert to lowercase for each word
-                words = [line.strip().lower() for line in f if line.strip()]
-
-                # Assign to the class-level sorted list (preserving order)
-                Normalizer._COMMON_WORDS_SORTED = words 
-                
-                # Also assign to the set for faster O(1) lookups later
-                Normalizer._COMMON_WORDS = set(words) 
-                
-            print(f"Korpus '{self.common_words_path}' berhasil dimuat. ({len(Normalizer._COMMON_WORDS_SORTED)} kata)")
-        except FileNotFoundError:
-            print(f"WARNING: '{self.common_words_path}' not found. Some normalization features may not work.")
-            Normalizer._COMMON_WORDS = set()
-            Normalizer._COMMON_WORDS_SORTED = [] # Ensure it's empty if file not found
-        except Exception as e:
-            print(f"WARNING: Error loading '{self.common_words_path}': {e}. Some normalization features may not work.")
-            Normalizer._COMMON_WORDS = set()
-            Normalizer._COMMON_WORDS_SORTED = [] # Ensure it's empty if error occurs
-
-        # Load SLANG_TO_FORMAL_MAP
-        if os.path.exists(self.slangs_csv_path):
+
+    def __init__(self, cache_size: int = None, max_leet_expansions: int = 10_000,
+                 instrument: bool = False, metrics_callback=None, stages=None, corpus: Corpus = None,
+                 common_words=None, slangs=None, overrides=None, max_rank: int = None, store=None):
+        """
+        Inisialisasi Normalizer. Korpus tidak dibaca di sini, melainkan saat pertama kali
+        dibutuhkan (lihat `_ensure_corpus`).
+        File korpus diasumsikan berada di subfolder 'corpus/' di dalam package 'indo_normalizer'.
+
+        Args:
+            cache_size (int): Jika diisi, aktifkan cache LRU per token dengan kapasitas
+                sebanyak ini (lihat `cache_stats`). Default None (tanpa cache).
+            max_leet_expansions (int): Batas jumlah simpul yang ditelusuri `normalize_leet`
+                per token, agar token penuh angka/simbol tidak meledak secara eksponensial.
+                None = tanpa batas.
+            instrument (bool): Jika True, catat waktu dan jumlah pemanggilan setiap tahap
+                (lihat `stage_metrics`). Default False (tanpa overhead pengukuran).
+            metrics_callback (callable): Dipanggil dengan dict metrik (lihat
+                `StageMetrics.as_dict`) setelah setiap panggilan `normalize_text` atau
+                `normalize_many`. Memberikan callback otomatis mengaktifkan `instrument`.
+            stages (iterable of str): Tahap yang dijalankan secara default (lihat
+                `stages.ALL_STAGES`), misalnya `ALL_STAGES - {'abbreviation', 'typo'}`
+                untuk melewati pemindaian korpus. None = semua tahap. Bisa ditimpa per panggilan.
+            corpus (Corpus): Korpus yang dipakai. None = dibangun dari `common_words`,
+                `slangs`, dan `overrides`.
+            common_words: Kata baku: path file atau iterable kata. None = bawaan package.
+            slangs: Peta slang: path CSV, dict, atau iterable pasangan (slang, formal).
+                None = bawaan package.
+            overrides (iterable of dict): Lapisan di atas korpus dasar, misalnya
+                `[{'slangs': 'slang_domain.csv'}]` (lihat `corpora.build_corpus`).
+            max_rank (int): Batas kedalaman pencarian singkatan dan typo: hanya `max_rank`
+                kata pertama korpus (urutan frekuensi) yang diperiksa. Lebih kecil = lebih
+                cepat tetapi kata yang jarang tidak lagi ditemukan. None = seluruh korpus.
+            store (str or TokenStore): Penyimpanan persisten hasil resolusi token (path
+                database SQLite atau objek `store.TokenStore`), dipakai bersama antar run dan
+                antar proses worker (lihat `store_stats`). Default None (tanpa penyimpanan).
+
+        Raises:
+            ValueError: Jika `corpus` diberikan bersama sumber korpus lain.
+        """
+        if corpus is not None and (common_words is not None or slangs is not None or overrides):
+            raise ValueError("pass either corpus or common_words/slangs/overrides, not both")
+        self._token_cache = TokenCache(cache_size) if cache_size else None
+        if store is not None and not isinstance(store, TokenStore):
+            store = TokenStore(store)
+        self._token_store = store
+        self.max_leet_expansions = max_leet_expansions
+        self.max_rank = max_rank
+        self.stages = select_stages(stages)
+        self._metrics = StageMetrics() if instrument or metrics_callback is not None else None
+        self.metrics_callback = metrics_callback
+        # Metrik panggilan terakhir (dict), atau None; dengan banyak thread gunakan metrics_callback
+        self.last_metrics = None
+        # Dibuat saat pertama kali API async dipakai (lihat `configure_async`)
+        self._async_batcher = None
+
+        self._corpus = corpus
+        # Korpus yang diberikan langsung hanya bisa dimuat ulang jika berasal dari file
+        self._given_corpus = corpus
+        self._common_words = _materialize(common_words)
+        self._slangs = _materialize(slangs)
+        self._overrides = [{key: _materialize(value) for key, value in dict(layer).items()}
+                           for layer in overrides or ()]
+
+        # Snapshot biner opsional; jika tidak ada atau basi, file teks yang dimuat
+        self.common_words_path, self.slangs_csv_path, self.snapshot_path = bundled_paths()
+
+    def __getstate__(self):
+        state = self.__dict__.copy()
+        # Callback hanya berlaku di proses pembuatnya (dan belum tentu bisa di-pickle)
+        state['metrics_callback'] = None
+        # Antrean async terikat ke event loop proses ini
+        state['_async_batcher'] = None
+        return state
+
+    @property
+    def corpus(self) -> Corpus:
+        """Korpus yang dipakai Normalizer ini (dimuat jika belum)."""
+        return self._ensure_corpus()
+
+    def _ensure_corpus(self) -> Corpus:
+        """Mengembalikan korpus instance ini, memuatnya dari registry jika belum ada."""
+        corpus = self._corpus
+        if corpus is None:
+            corpus = self._corpus = self._load_corpus()
+        return corpus
+
+    def _load_corpus(self, refresh=False):
+        if self._given_corpus is not None:
+            return load_corpus(*self._given_corpus.source, refresh=refresh)
+        if self._common_words is None and self._slangs is None:
+            # Snapshot hanya berlaku untuk file korpus bawaan
+            return build_corpus(self.common_words_path, self.slangs_csv_path, self._overrides,
+                                self.snapshot_path, refresh=refresh)
+        return build_corpus(
+            self.common_words_path if self._common_words is None else self._common_words,
+            self.slangs_csv_path if self._slangs is None else self._slangs,
+            self._overrides, refresh=refresh,
+        )
+
+    def reload(self) -> concurrent.futures.Future:
+        """
+        Membaca ulang sumber korpus dan membangun ulang semua indeksnya di thread latar
+        belakang, lalu menggantikan korpus lama sekaligus. Panggilan yang sedang berjalan
+        selesai dengan korpus lama dan panggilan berikutnya memakai korpus baru, tanpa
+        ada lalu lintas yang dijeda. Cache token otomatis dikosongkan saat korpus berganti.
+
+        Returns:
+            concurrent.futures.Future: Selesai dengan Corpus baru (`reload().result()` untuk
+            menunggu), atau dengan exception jika pemuatan gagal (korpus lama tetap dipakai).
+
+        Raises:
+            ValueError: Jika Normalizer dibuat dari objek Corpus yang tidak berasal dari file.
+        """
+        if self._given_corpus is not None and self._given_corpus.source is None:
+            raise ValueError("corpus was built in memory and has no sources to reload")
+        future = concurrent.futures.Future()
+
+        def run():
             try:
-                df_slang = pd.read_csv(self.slangs_csv_path)
-                if 'slang' in df_slang.columns and 'formal' in df_slang.columns:
-                    # Convert both slang and formal to lowercase for consistency
-                    # This ensures your map keys and values are ready for matching
-                    Normalizer._SLANG_TO_FORMAL_MAP = dict(zip(df_slang['slang'].str.lower(), df_slang['formal'].str.lower()))
-                    print(f"Korpus '{self.slangs_csv_path}' berhasil dimuat. ({len(Normalizer._SLANG_TO_FORMAL_MAP)} pasangan)")
-                else:
-                    print(f"WARNING: '{self.slangs_csv_path}' must have 'slang' and 'formal' columns. Slang map empty.")
-                    Normalizer._SLANG_TO_FORMAL_MAP = {} # Ensure it's empty if columns missing
-            except Exception as e:
-                print(f"WARNING: Error loading '{self.slangs_csv_path}': {e}. Slang map empty.")
-                Normalizer._SLANG_TO_FORMAL_MAP = {} # Ensure it's empty on error
-        else:
-            print(f"WARNING: '{self.slangs_csv_path}' not found. Slang map empty.")
-            Normalizer._SLANG_TO_FORMAL_MAP = {} # Ensure it's empty if file not found
+                with _RELOAD_LOCK:
+                    new_corpus = self._load_corpus(refresh=True)
+                    self._corpus = new_corpus
+            except BaseException as e:
+                future.set_exception(e)
+            else:
+                future.set_result(new_corpus)
+
+        threading.Thread(target=run, name="indo-normalizer-reload", daemon=True).start()
+        return future
 
     def text_to_words(self, s: str) -> list[str]:
         return re.findall(r"\w+|[^\w\s]", s, re.UNICODE)
 
-    def normalize_text(self, s: str) -> tuple[str, dict]:
+    def normalize_text(self, s: str, stages=None) -> tuple[str, dict]:
         """
         2) Normalisasi teks input 's' melalui serangkaian langkah:
            - Tokenisasi
@@ -91,108 +209,317 @@ class Normalizer:
            - Normalisasi slang
            - Koreksi typo (terhadap common_words)
 
+        `stages` memilih tahap yang dijalankan untuk panggilan ini (default: `self.stages`);
+        tahap yang tidak dijalankan tidak pernah muncul di counts.
+
         Mengembalikan teks yang dinormalisasi dan dictionary counts dari setiap operasi.
         """
         if not s:
             return "", collections.defaultdict(int)
 
+        return self._run(s, self._stages(stages))
+
+    def analyze(self, s: str, stages=None) -> dict:
+        """
+        Normalisasi dan seluruh statistik teks 's' dalam satu kali jalan pipeline.
+
+        Mengembalikan dict berisi 'normalized_text', 'counts' (sama seperti `normalize_text`),
+        'alay_count' (sama seperti `count_alays`), dan 'slang_count' (sama seperti `count_slangs`).
+        """
+        normalized_text, counts = self.normalize_text(s, stages)
+        return {
+            'normalized_text': normalized_text,
+            'counts': dict(counts),
+            'alay_count': counts.get('known_leet_words', 0) + counts.get('random_leet_words', 0),
+            'slang_count': counts.get('slangs', 0),
+        }
+
+    def normalize_many(self, texts, workers: int = 1, chunksize: int = 256, start_method: str = None,
+                       stages=None) -> list[tuple[str, dict]]:
+        """
+        Normalisasi banyak teks sekaligus (list atau iterable of str).
+
+        Token yang sama di dalam satu batch hanya diproses sekali untuk setiap tahap
+        (leet, singkatan, slang, typo); hasilnya dipakai ulang saat menyusun kembali
+        setiap teks. Hasilnya identik dengan memanggil `normalize_text` per item.
+
+        Jika `workers` > 1, teks dibagi menjadi chunk berukuran `chunksize` dan diproses
+        di process pool (lihat `parallel.iter_normalize_parallel`); `start_method`
+        memilih 'fork', 'spawn', atau 'forkserver'. `stages` sama seperti di `normalize_text`.
+
+        Jika instrumentasi aktif, seluruh batch dicatat sebagai satu panggilan; metrik
+        dari proses worker (`workers` > 1) tidak ikut tercatat.
+
+        Mengembalikan list (teks yang dinormalisasi, counts) sesuai urutan input.
+        """
+        stages = self._stages(stages)
+        if workers > 1:
+            # Diimpor di sini agar multiprocessing tidak ikut dimuat saat import package
+            from .parallel import iter_normalize_parallel
+            return list(iter_normalize_parallel(self, texts, workers, chunksize, start_method, stages))
+
+        metrics = StageMetrics() if self._metrics is not None else None
+        resolve_leet, resolve_lexical = self._resolvers(metrics, stages)
+        if resolve_leet is not None:
+            resolve_leet = _memoize(resolve_leet)
+        if resolve_lexical is not None:
+            resolve_lexical = _memoize(resolve_lexical)
+
+        results = []
+        for s in texts:
+            if not s:
+                results.append(("", collections.defaultdict(int)))
+            else:
+                results.append(self._normalize(s, resolve_leet, resolve_lexical, metrics))
+        if metrics is not None:
+            self._publish_metrics(metrics)
+        if self._token_store is not None:
+            self._token_store.flush()
+        return results
+
+    def normalize_stream(self, texts, batch_size: int = 256, prefetch: int = 0,
+                         workers: int = 1, start_method: str = None, stages=None):
+        """
+        Normalisasi lazy untuk iterable panjang atau tanpa akhir (misalnya baris file
+        besar atau pesan dari message queue). Menghasilkan (teks yang dinormalisasi, counts)
+        satu per satu sesuai urutan input.
+
+        Teks diproses per micro-batch berukuran paling banyak `batch_size` melalui
+        `normalize_many`, sehingga deduplikasi token per batch dan cache token tetap
+        dipakai. Memori yang dipakai hanya sebanding dengan ukuran batch, berapa pun
+        panjang stream-nya.
+
+        Args:
+            texts (iterable of str): Teks input.
+            batch_size (int): Jumlah teks maksimum per micro-batch.
+            prefetch (int): Jika > 0, `texts` dibaca di thread latar belakang ke antrean
+                berkapasitas sebanyak ini, sehingga I/O sumber berjalan bersamaan dengan
+                normalisasi. Batch lalu dibentuk dari teks yang sudah tersedia tanpa
+                menunggu batch penuh. Default 0 (dibaca langsung, batch menunggu penuh).
+            workers (int): Jika > 1, micro-batch diproses di process pool
+                (lihat `parallel.iter_normalize_batches`).
+            start_method (str): Start method process pool ('fork', 'spawn', 'forkserver').
+            stages (iterable of str): Tahap yang dijalankan (lihat `normalize_text`).
+        """
+        if batch_size < 1:
+            raise ValueError("batch_size must be >= 1")
+        if prefetch < 0:
+            raise ValueError("prefetch must be >= 0")
+        return self._iter_stream(texts, batch_size, prefetch, workers, start_method, self._stages(stages))
+
+    def _iter_stream(self, texts, batch_size, prefetch, workers, start_method, stages):
+        if prefetch:
+            batches = iter_micro_batches(texts, batch_size, prefetch)
+        else:
+            batches = iter_batches(texts, batch_size)
+
+        if workers > 1:
+            # Micro-batch dikirim ke worker apa adanya, tanpa dipecah ulang menjadi batch penuh
+            from .parallel import iter_normalize_batches
+            yield from iter_normalize_batches(self, batches, workers, start_method, stages)
+            return
+
+        for batch in batches:
+            yield from self.normalize_many(batch, stages=stages)
+
+    def configure_async(self, executor=None, max_batch_size: int = 64, max_wait: float = 0.002,
+                        max_queue: int = 1024, concurrency: int = 1, stages=None):
+        """
+        Mengatur API async (`anormalize_text`, `anormalize_many`): executor tempat
+        normalisasi dijalankan, ukuran dan jendela waktu micro-batch, batas antrean,
+        jumlah batch yang berjalan bersamaan, dan tahap yang dijalankan (`stages`, lihat
+        `normalize_text`; None = tahap default). Lihat `aio.AsyncBatcher`.
+        """
+        from .aio import AsyncBatcher
+        if stages is not None:
+            stages = select_stages(stages)
+        self._async_batcher = AsyncBatcher(self, executor, max_batch_size, max_wait, max_queue, concurrency, stages)
+        return self._async_batcher
+
+    async def anormalize_text(self, s: str) -> tuple[str, dict]:
+        """
+        Versi async `normalize_text` untuk layanan asyncio. Permintaan yang datang
+        bersamaan digabung menjadi micro-batch dan dijalankan di executor, sehingga
+        event loop tidak terblokir.
+
+        Raises:
+            aio.QueueFullError: Jika antrean permintaan sudah penuh.
+        """
+        if not s:
+            return "", collections.defaultdict(int)
+        if self._async_batcher is None:
+            self.configure_async()
+        (result,) = await self._async_batcher.submit([s])
+        return result
+
+    async def anormalize_many(self, texts) -> list[tuple[str, dict]]:
+        """Versi async `normalize_many`; seluruh `texts` dikirim sebagai satu permintaan."""
+        if self._async_batcher is None:
+            self.configure_async()
+        return await self._async_batcher.submit(list(texts))
+
+    def cache_stats(self) -> dict:
+        """
+        Statistik cache token (hits, misses, evictions, size, maxsize),
+        atau None jika cache tidak diaktifkan.
+        """
+        if self._token_cache is None:
+            return None
+        return self._token_cache.stats()
+
+    def store_stats(self) -> dict:
+        """
+        Statistik penyimpanan token persisten (hits, misses, size),
+        atau None jika penyimpanan tidak diaktifkan.
+        """
+        if self._token_store is None:
+            return None
+        return self._token_store.stats()
+
+    def clear_cache(self):
+        """Mengosongkan cache token (jika diaktifkan)."""
+        if self._token_cache is not None:
+            self._token_cache.clear()
+
+    def stage_metrics(self) -> dict:
+        """
+        Metrik agregat semua panggilan sejak Normalizer dibuat (atau sejak `reset_metrics`):
+        jumlah teks, serta waktu dan jumlah pemanggilan per tahap (lihat `StageMetrics`).
+        Token yang diambil dari cache tidak menjalankan tahapnya sehingga tidak tercatat.
+        Mengembalikan None jika instrumentasi tidak diaktifkan.
+        """
+        if self._metrics is None:
+            return None
+        return self._metrics.as_dict()
+
+    def reset_metrics(self):
+        """Mengosongkan metrik agregat (jika instrumentasi diaktifkan)."""
+        if self._metrics is not None:
+            self._metrics.reset()
+        self.last_metrics = None
+
+    def _publish_metrics(self, metrics):
+        """Menggabungkan metrik satu panggilan ke agregat dan meneruskannya ke callback."""
+        self._metrics.merge(metrics)
+        self.last_metrics = metrics.as_dict()
+        if self.metrics_callback is not None:
+            self.metrics_callback(self.last_metrics)
+
+    def _stages(self, stages):
+        """Tahap untuk satu panggilan: `self.stages` jika `stages` None."""
+        return self.stages if stages is None else select_stages(stages)
+
+    def _run(self, s, stages):
+        """Menjalankan `_normalize` untuk satu teks, dengan instrumentasi jika diaktifkan."""
+        if self._metrics is None:
+            result = self._normalize(s, *self._resolvers(stages=stages))
+        else:
+            metrics = StageMetrics()
+            result = self._normalize(s, *self._resolvers(metrics, stages), metrics=metrics)
+            self._publish_metrics(metrics)
+        if self._token_store is not None:
+            self._token_store.flush()
+        return result
+
+    def _resolvers(self, metrics=None, stages=ALL_STAGES):
+        """
+        Fungsi resolusi token untuk tahap 1 dan 2, melalui cache token dan penyimpanan
+        token persisten jika diaktifkan (cache di memori diperiksa lebih dulu).
+        Korpus diambil sekali di sini, sehingga satu panggilan selalu memakai satu korpus.
+        Jika `metrics` diberikan, setiap tahap per token dicatat ke dalamnya.
+
+        Hanya tahap di `stages` yang dijalankan. Resolver untuk tahap 1 atau 2 adalah None
+        jika tidak ada satu pun tahapnya yang aktif. Kunci cache menyertakan tahap yang
+        aktif serta `max_leet_expansions` / `max_rank`, sehingga hasil dari konfigurasi
+        yang berbeda tidak tercampur.
+        """
+        corpus = self._ensure_corpus()
+        leet_stages = stages & LEET_STAGES
+        lexical_stages = stages & LEXICAL_STAGES
+        resolve_leet = resolve_lexical = None
+        if leet_stages:
+            resolve_leet = functools.partial(self._resolve_leet_stage, corpus=corpus, metrics=metrics)
+            if leet_stages != LEET_STAGES:
+                resolve_leet = functools.partial(resolve_leet, stages=leet_stages)
+        if lexical_stages:
+            resolve_lexical = functools.partial(self._resolve_lexical_stage, corpus=corpus, metrics=metrics)
+            if lexical_stages != LEXICAL_STAGES:
+                resolve_lexical = functools.partial(resolve_lexical, stages=lexical_stages)
+
+        if self._token_store is not None:
+            # Hasil bergantung pada tahap aktif dan batas pencarian, jadi keduanya ikut menjadi kunci
+            if resolve_leet is not None:
+                resolve_leet = self._token_store.wrap(
+                    corpus.version, f"leet:{','.join(sorted(leet_stages))}:{self.max_leet_expansions}", resolve_leet
+                )
+            if resolve_lexical is not None:
+                resolve_lexical = self._token_store.wrap(
+                    corpus.version, f"lexical:{','.join(sorted(lexical_stages))}:{self.max_rank}", resolve_lexical
+                )
+        if self._token_cache is None:
+            return resolve_leet, resolve_lexical
+        self._token_cache.bind(corpus.version)
+        if resolve_leet is not None:
+            resolve_leet = self._token_cache.wrap(
+                ('leet', leet_stages, self.max_leet_expansions, corpus.version), resolve_leet
+            )
+        if resolve_lexical is not None:
+            resolve_lexical = self._token_cache.wrap(
+                ('lexical', lexical_stages, self.max_rank, corpus.version), resolve_lexical
+            )
+        return resolve_leet, resolve_lexical
+
+    def _normalize(self, s, resolve_leet, resolve_lexical, metrics=None):
+        """
+        Menjalankan pipeline normalisasi untuk satu teks. `resolve_leet` dan
+        `resolve_lexical` memetakan satu token ke (hasil, kunci counts yang bertambah).
+        Jika `resolve_leet` None, tahap 1 dan tokenisasi ulang dilewati; jika `resolve_lexical`
+        None, pipeline berhenti setelah tahap 1 (tanpa tokenisasi ulang).
+        Jika `metrics` diberikan, tokenisasi dan tokenisasi ulang dicatat ke dalamnya.
+        """
         counts = collections.defaultdict(int)
         # Tokenisasi awal
-        initial_tokens = tokenize_text(s)
-        
+        if metrics is None:
+            initial_tokens = tokenize_text(s)
+        else:
+            metrics.texts += 1
+            start = time.perf_counter()
+            initial_tokens = tokenize_text(s)
+            metrics.record('tokenize', time.perf_counter() - start)
+
         # --- Tahap 1: Normalisasi Pengulangan dan Leet ---
-        # Kita akan kumpulkan hasil sementara dari tahap ini di sini
-        temp_tokens_after_leet_stage = []
-
-        for token in initial_tokens:
-            original_token_for_leet = token # Simpan original_token khusus untuk tahap leet
-            processed_token_for_leet_stage = token
-
-            # Hanya proses token yang kemungkinan adalah kata (mengandung huruf atau angka)
-            if re.search(r'[a-zA-Z0-9]', token, re.UNICODE):
-                # 1. Panggil normalize_repetitions
-                temp_rep_token = normalize_repetitions(processed_token_for_leet_stage)
-                if temp_rep_token != processed_token_for_leet_stage:
-                    counts['double_letters_words'] += 1
-                processed_token_for_leet_stage = temp_rep_token
-
-                # 2. Panggil normalize_leet (meneruskan common_words_set) dan normalize_forced_leet
-                processed_token_after_soft_leet = normalize_leet(processed_token_for_leet_stage, self._COMMON_WORDS)
-                
-                # Default: anggap token tidak berubah dulu
-                final_token_for_this_stage = processed_token_for_leet_stage
-
-                # Jika normalize_leet berhasil mengubah token
-                if processed_token_after_soft_leet != processed_token_for_leet_stage:
-                    final_token_for_this_stage = processed_token_after_soft_leet
-                    counts['known_leet_words'] += 1
-                else:
-                    # Jika normalize_leet TIDAK mengubah token, maka coba FORCED LEET
-                    if re.search(r'[0-9!@$]', original_token_for_leet):
-                        
-                        # Asumsi normalize_forced_leet sekarang mengembalikan list[str]
-                        # (Jika itu yang kamu inginkan untuk "bgt2" -> "bgt bgt")
-                        temp_forced_leet_result_list = normalize_forced_leet(processed_token_for_leet_stage)
-                        
-                        # Jika forced leet berhasil mengubah token
-                        # Kita cek elemen pertama atau apakah listnya lebih dari satu
-                        if temp_forced_leet_result_list[0] != processed_token_for_leet_stage or len(temp_forced_leet_result_list) > 1:
-                            # Jika ada perubahan atau pecah jadi banyak token
-                            temp_tokens_after_leet_stage.extend(temp_forced_leet_result_list)
-                            counts['random_leet_words'] += 1
-                            # Lanjutkan ke token berikutnya di loop awal, karena ini sudah ditambahkan
-                            continue 
-                        else:
-                            # Forced leet tidak mengubahnya, biarkan token aslinya dari tahap ini
-                            final_token_for_this_stage = processed_token_for_leet_stage
-                    else:
-                        # Kondisi forced leet tidak terpenuhi, biarkan token aslinya dari tahap ini
-                        final_token_for_this_stage = processed_token_for_leet_stage
-                
-                # Jika token diproses dan tidak di-extend oleh forced leet multi-token, tambahkan di sini
-                temp_tokens_after_leet_stage.append(final_token_for_this_stage)
-            else:
-                # Jika token bukan kata (hanya tanda baca), tambahkan langsung
-                temp_tokens_after_leet_stage.append(token)
+        if resolve_leet is None:
+            # Tidak ada tahap 1 yang aktif: token tidak berubah sehingga tidak perlu tokenisasi ulang
+            if resolve_lexical is None:
+                return "".join(initial_tokens), dict(counts)
+            retokenized_tokens = initial_tokens
+        else:
+            temp_tokens_after_leet_stage = []
+            for token in initial_tokens:
+                processed_token, changes = resolve_leet(token)
+                for key in changes:
+                    counts[key] += 1
+                temp_tokens_after_leet_stage.append(processed_token)
+
+            if resolve_lexical is None:
+                return "".join(temp_tokens_after_leet_stage), dict(counts)
 
-        # --- Titik Krusial: Gabungkan dan Tokenisasi Ulang ---
-        # Gabungkan token-token yang sudah dinormalisasi leet
-        temp_joined_text = "".join(temp_tokens_after_leet_stage)
+            # --- Titik Krusial: Tokenisasi Ulang ---
+            # Hanya token yang diubah tahap leet yang ditokenisasi ulang (misalnya 'ada2' -> 'ada-ada');
+            # hasilnya sama dengan menokenisasi ulang gabungan seluruh token
+            if metrics is None:
+                retokenized_tokens = retokenize(initial_tokens, temp_tokens_after_leet_stage)
+            else:
+                start = time.perf_counter()
+                retokenized_tokens = retokenize(initial_tokens, temp_tokens_after_leet_stage)
+                metrics.record('retokenize', time.perf_counter() - start)
 
-        # Tokenisasi ulang teks yang sudah bersih dari leet
-        retokenized_tokens = tokenize_text(temp_joined_text)
-        
         # --- Tahap 2: Normalisasi Singkatan, Slang, dan Typo ---
         final_normalized_tokens = []
         for token_after_leet in retokenized_tokens:
-            processed_token = token_after_leet # Token baru untuk tahap ini
-
-            # 3. Cek is_abbreviation (terhadap COMMON_WORDS)
-            if processed_token.lower() not in self._COMMON_WORDS:
-                # found_abbr_conversion = False # Tidak lagi dibutuhkan jika langsung break
-                for common_word in self._COMMON_WORDS_SORTED:
-                    if is_abbreviation(processed_token, common_word):
-                        if processed_token.lower() != common_word.lower():
-                            processed_token = common_word
-                            counts['abbreviated_words'] += 1
-                        break # Hentikan setelah menemukan kecocokan
-
-            # 4. Panggil slang_to_formal (meneruskan slang_map)
-            temp_token_slang = slang_to_formal(processed_token, self._SLANG_TO_FORMAL_MAP)
-            if temp_token_slang != processed_token:
-                counts['slangs'] += 1
-            processed_token = temp_token_slang
-
-            # 5. Panggil is_typo (terhadap COMMON_WORDS)
-            if processed_token.lower() not in self._COMMON_WORDS:
-                alpha_chars = sum(c.isalpha() for c in processed_token)
-                if len(processed_token) // 2 < alpha_chars:
-                    for common_word_target in self._COMMON_WORDS_SORTED:
-                        if is_typo(processed_token.lower(), common_word_target):
-                            processed_token = common_word_target
-                            counts['typo_words'] += 1
-                            break # Hentikan setelah menemukan kecocokan
-            
+            processed_token, changes = resolve_lexical(token_after_leet)
+            for key in changes:
+                counts[key] += 1
             final_normalized_tokens.append(processed_token)
 
         # Gabungkan kembali token final menjadi string
@@ -200,20 +527,142 @@ class Normalizer:
 
         return final_text, dict(counts)
 
+    def _resolve_leet_stage(self, token: str, corpus: Corpus, metrics: StageMetrics = None,
+                            stages: frozenset = LEET_STAGES) -> tuple[str, tuple]:
+        """
+        Tahap 1 untuk satu token: normalisasi pengulangan, leet (korpus), dan leet paksa,
+        masing-masing hanya jika namanya ada di `stages`.
+        Mengembalikan token hasil dan tuple kunci counts yang bertambah (urut sesuai kejadian).
+        Jika `metrics` diberikan, waktu setiap langkah dicatat ke dalamnya.
+        """
+        # Hanya proses token yang kemungkinan adalah kata (mengandung huruf atau angka)
+        if not _WORD_CHAR_PATTERN.search(token):
+            # Jika token bukan kata (hanya tanda baca), kembalikan langsung
+            return token, ()
+
+        changes = []
+        # 1. Panggil normalize_repetitions
+        if 'repetitions' not in stages:
+            processed_token = token
+        elif metrics is None:
+            processed_token = normalize_repetitions(token)
+        else:
+            start = time.perf_counter()
+            processed_token = normalize_repetitions(token)
+            metrics.record('repetitions', time.perf_counter() - start)
+        if processed_token != token:
+            changes.append('double_letters_words')
+
+        # 2. Panggil normalize_leet (meneruskan set kata baku korpus) dan normalize_forced_leet
+        # Penelusuran dipangkas dengan prefiks kata korpus dan dibatasi max_leet_expansions
+        if 'leet' in stages:
+            if metrics is not None:
+                start = time.perf_counter()
+            processed_token_after_soft_leet = normalize_leet(
+                processed_token, corpus.word_set, corpus.prefixes, self.max_leet_expansions
+            )
+            if metrics is not None:
+                metrics.record('leet', time.perf_counter() - start)
+
+            # Jika normalize_leet berhasil mengubah token
+            if processed_token_after_soft_leet != processed_token:
+                changes.append('known_leet_words')
+                return processed_token_after_soft_leet, tuple(changes)
+
+        # Jika normalize_leet TIDAK mengubah token, maka coba FORCED LEET
+        # (syarat forced leet dicek pada token asli, sebelum normalisasi pengulangan)
+        if 'forced_leet' in stages and _FORCED_LEET_CHAR_PATTERN.search(token):
+            if metrics is None:
+                forced_leet_result = normalize_forced_leet(processed_token)
+            else:
+                start = time.perf_counter()
+                forced_leet_result = normalize_forced_leet(processed_token)
+                metrics.record('forced_leet', time.perf_counter() - start)
+
+            # Jika forced leet berhasil mengubah token
+            # Kita cek karakter pertama atau apakah hasilnya lebih dari satu karakter
+            if forced_leet_result[0] != processed_token or len(forced_leet_result) > 1:
+                changes.append('random_leet_words')
+                return forced_leet_result, tuple(changes)
+
+        # Forced leet tidak mengubahnya, biarkan token dari tahap ini
+        return processed_token, tuple(changes)
+
+    def _resolve_lexical_stage(self, token: str, corpus: Corpus, metrics: StageMetrics = None,
+                               stages: frozenset = LEXICAL_STAGES) -> tuple[str, tuple]:
+        """
+        Tahap 2 untuk satu token: cek singkatan, slang, dan typo, masing-masing hanya
+        jika namanya ada di `stages`.
+        Mengembalikan token hasil dan tuple kunci counts yang bertambah (urut sesuai kejadian).
+        Jika `metrics` diberikan, waktu dan jumlah perbandingan korpus dicatat ke dalamnya.
+        """
+        changes = []
+        processed_token = token
+
+        # 3. Cek is_abbreviation (terhadap kata baku korpus)
+        if 'abbreviation' in stages and processed_token.lower() not in corpus.word_set:
+            # Indeks mengembalikan kecocokan pertama sesuai urutan korpus
+            if metrics is None:
+                common_word, _ = corpus.abbreviation_index.lookup(processed_token, self.max_rank)
+            else:
+                start = time.perf_counter()
+                common_word, checked = corpus.abbreviation_index.lookup(processed_token, self.max_rank)
+                metrics.record('abbreviation', time.perf_counter() - start, checked)
+            if common_word is not None and processed_token.lower() != common_word.lower():
+                processed_token = common_word
+                changes.append('abbreviated_words')
+
+        # 4. Panggil slang_to_formal (meneruskan slang_map)
+        if 'slang' in stages:
+            if metrics is None:
+                temp_token_slang = slang_to_formal(processed_token, corpus.slang_map)
+            else:
+                start = time.perf_counter()
+                temp_token_slang = slang_to_formal(processed_token, corpus.slang_map)
+                metrics.record('slang', time.perf_counter() - start)
+            if temp_token_slang != processed_token:
+                changes.append('slangs')
+            processed_token = temp_token_slang
+
+        # 5. Panggil is_typo (terhadap kata baku korpus)
+        if 'typo' in stages and processed_token.lower() not in corpus.word_set:
+            alpha_chars = sum(c.isalpha() for c in processed_token)
+            if len(processed_token) // 2 < alpha_chars:
+                # Indeks hanya memeriksa kandidat yang lolos filter panjang dan karakter
+                if metrics is None:
+                    common_word_target, _ = corpus.typo_index.lookup(processed_token.lower(), self.max_rank)
+                else:
+                    start = time.perf_counter()
+                    common_word_target, checked = corpus.typo_index.lookup(processed_token.lower(), self.max_rank)
+                    metrics.record('typo', time.perf_counter() - start, checked)
+                if common_word_target is not None:
+                    processed_token = common_word_target
+                    changes.append('typo_words')
+
+        return processed_token, tuple(changes)
+
     def count_alays(self, s: str) -> int:
         """
         3) Menghitung total kemunculan normalisasi alay
-           dalam teks 's'. Memanggil `normalize_text` secara internal.
+           dalam teks 's'. Hanya menjalankan tahap 1 (pengulangan dan leet), karena
+           tahap singkatan, slang, dan typo tidak memengaruhi hitungan alay.
+           Gunakan `analyze` untuk mendapatkan teks dan seluruh statistik sekaligus.
         """
-        _, counts = self.normalize_text(s) # Panggil metode dari instance kelas
+        if not s:
+            return 0
+        _, counts = self._run(s, self.stages & LEET_STAGES)
         return counts.get('known_leet_words', 0) + counts.get('random_leet_words', 0)
 
     def count_slangs(self, s: str) -> int:
         """
         4) Menghitung total kemunculan normalisasi slang (slang_to_formal) dalam teks 's'.
-           Memanggil `normalize_text` secara internal.
+           Koreksi typo dilewati karena dijalankan setelah slang; tahap leet dan singkatan
+           tetap dijalankan karena keduanya mengubah token sebelum dicocokkan ke peta slang.
+           Gunakan `analyze` untuk mendapatkan teks dan seluruh statistik sekaligus.
         """
-        _, counts = self.normalize_text(s) # Panggil metode dari instance kelas
+        if not s:
+            return 0
+        _, counts = self._run(s, self.stages - {'typo'})
         return counts.get('slangs', 0)
 
 if __name__ == "__main__":
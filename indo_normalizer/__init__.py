@@ -1,7 +1,7 @@
 # __init__.py
 
 # Metadata
-__version__ = '0.1.0'
+__version__ = '1.2.0'
 __author__ = 'Drestanto Muhammad Dyasputro'
 __author_email__ = 'dyas@live.com'
 __license__ = 'MIT'
@@ -0,0 +1,153 @@
+import asyncio
+import collections
+import functools
+from concurrent.futures import ProcessPoolExecutor
+
+from .parallel import WorkerPool, _normalize_batch
+
+
+class QueueFullError(RuntimeError):
+    """
+    Dilempar ketika antrean permintaan async sudah penuh. Layanan sebaiknya menolak
+    permintaan (misalnya HTTP 503) daripada membiarkan latensi terus bertambah.
+    """
+
+
+class AsyncBatcher:
+    """
+    Menggabungkan permintaan normalisasi async yang datang bersamaan menjadi
+    micro-batch, lalu menjalankan `Normalizer.normalize_many` di executor
+    sehingga event loop tidak pernah terblokir oleh pekerjaan CPU.
+
+    Permintaan yang belum dikirim ke executor menunggu di antrean berukuran paling
+    banyak `max_queue`; permintaan baru saat antrean penuh langsung ditolak dengan
+    `QueueFullError` (load shedding).
+
+    Args:
+        normalizer (Normalizer): Normalizer yang dipakai.
+        executor (concurrent.futures.Executor): Thread pool, atau `parallel.WorkerPool` untuk
+            normalizer ini. None = default executor event loop (thread pool). WorkerPool memberi
+            paralelisme sungguhan karena normalisasi terikat CPU; setiap workernya memegang
+            salinan Normalizer sendiri (termasuk cache dan penyimpanan token) sepanjang umurnya.
+            ProcessPoolExecutor biasa ditolak karena Normalizer harus di-pickle ulang per batch.
+        max_batch_size (int): Jumlah teks maksimum per micro-batch.
+        max_wait (float): Detik menunggu permintaan lain sebelum batch yang belum penuh dikirim.
+        max_queue (int): Jumlah permintaan maksimum yang menunggu di antrean.
+        concurrency (int): Jumlah batch maksimum yang berjalan bersamaan di executor.
+        stages (iterable of str): Tahap yang dijalankan untuk setiap batch (lihat
+            `Normalizer.normalize_text`). None = tahap default Normalizer.
+
+    Raises:
+        ValueError: Jika `executor` adalah ProcessPoolExecutor biasa, atau WorkerPool milik
+            Normalizer lain.
+    """
+
+    def __init__(self, normalizer, executor=None, max_batch_size=64, max_wait=0.002, max_queue=1024, concurrency=1,
+                 stages=None):
+        if max_batch_size < 1:
+            raise ValueError("max_batch_size must be >= 1")
+        if max_queue < 1:
+            raise ValueError("max_queue must be >= 1")
+        if concurrency < 1:
+            raise ValueError("concurrency must be >= 1")
+        if isinstance(executor, WorkerPool):
+            if executor.normalizer is not normalizer:
+                raise ValueError("WorkerPool was created for a different normalizer")
+        elif isinstance(executor, ProcessPoolExecutor):
+            raise ValueError("use parallel.WorkerPool(normalizer, workers) instead of a plain ProcessPoolExecutor")
+        self.normalizer = normalizer
+        self.executor = executor
+        self.max_batch_size = max_batch_size
+        self.max_wait = max_wait
+        self.max_queue = max_queue
+        self.concurrency = concurrency
+        self.stages = stages
+        self._loop = None
+
+    def __len__(self):
+        """Jumlah permintaan yang menunggu di antrean (belum dikirim ke executor)."""
+        return len(self._pending) if self._loop is not None else 0
+
+    def _bind(self, loop):
+        # Antrean dan task dispatcher terikat ke satu event loop; buat ulang untuk loop baru
+        if self._loop is not loop:
+            self._loop = loop
+            self._pending = collections.deque()
+            self._wakeup = asyncio.Event()
+            self._slots = asyncio.Semaphore(self.concurrency)
+            self._dispatcher = loop.create_task(self._dispatch_forever())
+
+    async def submit(self, texts):
+        """
+        Menormalisasi list `texts` sebagai satu permintaan dan mengembalikan list
+        (teks yang dinormalisasi, counts) sesuai urutan.
+
+        Raises:
+            QueueFullError: Jika antrean sudah berisi `max_queue` permintaan.
+        """
+        if not texts:
+            return []
+        loop = asyncio.get_running_loop()
+        self._bind(loop)
+        if len(self._pending) >= self.max_queue:
+            raise QueueFullError(f"normalization queue is full ({self.max_queue} pending requests)")
+        future = loop.create_future()
+        self._pending.append((texts, future))
+        self._wakeup.set()
+        return await future
+
+    def _take_batch(self):
+        """Mengambil permintaan dari antrean hingga batch berisi `max_batch_size` teks (minimal satu permintaan)."""
+        batch = []
+        size = 0
+        while self._pending and (not batch or size + len(self._pending[0][0]) <= self.max_batch_size):
+            texts, future = self._pending.popleft()
+            if future.done():
+                # Pemanggil sudah membatalkan permintaannya
+                continue
+            batch.append((texts, future))
+            size += len(texts)
+        if not self._pending:
+            self._wakeup.clear()
+        return batch
+
+    def _pending_texts(self):
+        return sum(len(texts) for texts, _ in self._pending)
+
+    async def _dispatch_forever(self):
+        while True:
+            await self._wakeup.wait()
+            await self._slots.acquire()
+            # Beri kesempatan permintaan lain bergabung jika batch belum penuh
+            if self.max_wait and self._pending_texts() < self.max_batch_size:
+                await asyncio.sleep(self.max_wait)
+            batch = self._take_batch()
+            if not batch:
+                self._slots.release()
+                continue
+            self._loop.create_task(self._run_batch(batch))
+
+    async def _run_batch(self, batch):
+        try:
+            texts = [text for request, _ in batch for text in request]
+            try:
+                if isinstance(self.executor, WorkerPool):
+                    payload = await self._loop.run_in_executor(self.executor, _normalize_batch, texts, self.stages)
+                    results = self.executor.collect(payload)
+                else:
+                    normalize_many = self.normalizer.normalize_many
+                    if self.stages is not None:
+                        normalize_many = functools.partial(normalize_many, stages=self.stages)
+                    results = await self._loop.run_in_executor(self.executor, normalize_many, texts)
+            except Exception as e:
+                for _, future in batch:
+                    if not future.done():
+                        future.set_exception(e)
+                return
+            position = 0
+            for request, future in batch:
+                if not future.done():
+                    future.set_result(results[position:position + len(request)])
+                position += len(request)
+        finally:
+            self._slots.release()
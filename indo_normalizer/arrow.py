@@ -0,0 +1,122 @@
+import pyarrow as pa
+import pyarrow.parquet as pq
+
+from .columnar import default_normalizer, normalize_column, worker_pool
+from .stages import COUNT_KEYS
+
+
+def _output_type(array_type):
+    # Pertahankan large_string agar offset kolom besar tidak meluap; tipe lain menjadi string
+    return array_type if pa.types.is_large_string(array_type) else pa.string()
+
+
+def normalize_array(array, normalizer=None, batch_size=65536, workers=1, stages=None, pool=None):
+    """
+    Menormalisasi array string Arrow per potongan berukuran `batch_size`.
+
+    Args:
+        array (pyarrow.Array or pyarrow.ChunkedArray): Kolom teks (string atau large_string).
+        normalizer (Normalizer): Normalizer yang dipakai. None = Normalizer bawaan.
+        batch_size (int): Jumlah baris yang diubah ke objek Python sekaligus.
+        workers (int): Jumlah proses worker. Satu worker pool dibuat untuk seluruh panggilan
+            dan dipakai oleh semua potongan.
+        stages (iterable of str): Tahap yang dijalankan (lihat `Normalizer.normalize_text`).
+        pool (parallel.WorkerPool): Worker pool yang sudah ada (lihat `columnar.normalize_column`).
+
+    Returns:
+        pyarrow.Table: Kolom 'normalized_text' dan satu kolom int64 per kunci counts
+        (`stages.COUNT_KEYS`), sepanjang dan seurut `array`; null tetap null dengan counts 0.
+    """
+    if isinstance(array, pa.Array):
+        array = pa.chunked_array([array], type=array.type)
+    normalizer = normalizer or (pool.normalizer if pool is not None else default_normalizer())
+    with worker_pool(normalizer, workers, pool) as pool:
+        batches = [
+            _normalize_slice(chunk.slice(offset, batch_size), normalizer, pool, stages, names=None)
+            for chunk in array.chunks
+            for offset in range(0, len(chunk), batch_size)
+        ]
+    if not batches:
+        batches = [_empty_result(array.type, names=None)]
+    return pa.Table.from_batches(batches)
+
+
+def normalize_record_batch(batch, column, normalizer=None, workers=1, stages=None, pool=None):
+    """
+    Menormalisasi kolom `column` dari satu RecordBatch dan mengembalikan RecordBatch yang
+    sama ditambah kolom '<column>_normalized' dan '<column>_<kunci counts>' (int64).
+    Untuk banyak batch dengan `workers` > 1, berikan `pool` (lihat `columnar.worker_pool`)
+    agar worker tidak dibuat ulang di setiap batch.
+
+    Raises:
+        KeyError: Jika `column` tidak ada di batch.
+    """
+    if column not in batch.schema.names:
+        raise KeyError(f"column {column!r} not found in record batch")
+    normalizer = normalizer or (pool.normalizer if pool is not None else default_normalizer())
+    with worker_pool(normalizer, workers, pool) as pool:
+        result = _normalize_slice(batch.column(column), normalizer, pool, stages, names=_column_names(column))
+    arrays = list(batch.columns) + list(result.columns)
+    names = list(batch.schema.names) + list(result.schema.names)
+    return pa.RecordBatch.from_arrays(arrays, names=names)
+
+
+def normalize_parquet(input_path, output_path, column, normalizer=None, batch_size=65536,
+                      workers=1, stages=None, compression="snappy", pool=None):
+    """
+    Menormalisasi kolom `column` dari file Parquet dan menulis hasilnya ke `output_path`
+    dengan kolom tambahan seperti `normalize_record_batch`.
+
+    File dibaca dan ditulis per record batch berukuran paling banyak `batch_size` baris,
+    sehingga memori yang dipakai sebanding dengan ukuran batch, bukan ukuran file.
+    Dengan `workers` > 1, satu worker pool dibuat untuk seluruh file (atau `pool` dipakai).
+
+    Returns:
+        int: Jumlah baris yang ditulis.
+
+    Raises:
+        KeyError: Jika `column` tidak ada di file.
+    """
+    source = pq.ParquetFile(input_path)
+    if column not in source.schema_arrow.names:
+        raise KeyError(f"column {column!r} not found in {input_path!r}")
+
+    rows = 0
+    writer = None
+    normalizer = normalizer or (pool.normalizer if pool is not None else default_normalizer())
+    try:
+        with worker_pool(normalizer, workers, pool) as pool:
+            for batch in source.iter_batches(batch_size=batch_size):
+                result = normalize_record_batch(batch, column, normalizer, stages=stages, pool=pool)
+                if writer is None:
+                    writer = pq.ParquetWriter(output_path, result.schema, compression=compression)
+                writer.write_batch(result)
+                rows += result.num_rows
+        if writer is None:
+            # File tanpa baris: tetap tulis file dengan skema lengkap
+            empty = _empty_result(source.schema_arrow.field(column).type, names=_column_names(column))
+            schema = pa.schema(list(source.schema_arrow) + list(empty.schema))
+            writer = pq.ParquetWriter(output_path, schema, compression=compression)
+    finally:
+        if writer is not None:
+            writer.close()
+    return rows
+
+
+def _column_names(column):
+    return [f"{column}_normalized"] + [f"{column}_{key}" for key in COUNT_KEYS]
+
+
+def _result_batch(normalized, counts, array_type, names):
+    arrays = [pa.array(normalized, type=_output_type(array_type))]
+    arrays += [pa.array(counts[key], type=pa.int64()) for key in COUNT_KEYS]
+    return pa.RecordBatch.from_arrays(arrays, names=names or ["normalized_text", *COUNT_KEYS])
+
+
+def _normalize_slice(array, normalizer, pool, stages, names):
+    normalized, counts = normalize_column(array.to_pylist(), normalizer, stages=stages, pool=pool)
+    return _result_batch(normalized, counts, array.type, names)
+
+
+def _empty_result(array_type, names):
+    return _result_batch([], {key: [] for key in COUNT_KEYS}, array_type, names)
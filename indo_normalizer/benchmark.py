@@ -0,0 +1,266 @@
+import argparse
+import datetime
+import json
+import platform
+import random
+import time
+import tracemalloc
+
+from . import __version__
+from .Normalizer import Normalizer
+from .functions import tokenize_text, normalize_leet
+
+# Jenis teks sintetis yang dibangkitkan untuk setiap benchmark
+KINDS = ("short", "long", "leet", "url")
+
+# Nilai max_rank yang diukur untuk tahap singkatan dan typo
+RANK_CUTOFFS = (1000, 5000)
+
+# Kebalikan FORCED_LEET_MAP: huruf -> karakter leet yang umum dipakai
+_LEETIFY = {"a": "4", "i": "1", "e": "3", "o": "0", "s": "5", "g": "9", "t": "7", "b": "8", "l": "!"}
+_DOMAINS = ("detik.com", "kompas.id", "unimelb.edu.au", "t.co", "bit.ly", "instagram.com")
+_PUNCTUATION = (",", ".", "!", "?", "!!!", "...", " :)", " wkwk")
+
+
+def _leetify(word, rng):
+    """Mengganti sebagian huruf dengan karakter leet dan kadang menambah pengulangan huruf."""
+    chars = [_LEETIFY[c] if c in _LEETIFY and rng.random() < 0.5 else c for c in word]
+    if chars and rng.random() < 0.3:
+        i = rng.randrange(len(chars))
+        chars[i] = chars[i] * rng.randint(3, 5)
+    return "".join(chars)
+
+
+def _url(rng, words):
+    choice = rng.random()
+    if choice < 0.4:
+        return f"https://www.{rng.choice(_DOMAINS)}/{rng.choice(words)}/{rng.randint(1, 99999)}"
+    if choice < 0.7:
+        return f"{rng.choice(words)}{rng.randint(1, 99)}@{rng.choice(_DOMAINS)}"
+    return rng.choice(("@", "#")) + rng.choice(words)
+
+
+def synthetic_corpus(kind, count, common_words, slang_map, seed=0):
+    """
+    Membangkitkan `count` teks media sosial sintetis dari kata korpus dan slang bawaan.
+
+    Args:
+        kind (str): 'short' (tweet 5-20 token), 'long' (postingan 80-200 token),
+            'leet' (sebagian besar kata ditulis alay) atau 'url' (banyak URL, email, mention).
+        count (int): Jumlah teks.
+        common_words (list of str): Kata baku (urutan korpus).
+        slang_map (dict): Peta slang -> formal; kuncinya dipakai sebagai kata slang.
+        seed (int): Seed generator acak; teks yang sama dihasilkan untuk seed yang sama.
+    """
+    if kind not in KINDS:
+        raise ValueError(f"unknown corpus kind {kind!r}, expected one of {KINDS}")
+    rng = random.Random(f"{kind}:{seed}")
+    # Kata yang sering dipakai (awal korpus) lebih mungkin muncul, seperti teks sungguhan
+    frequent = common_words[:2000] or ["kata"]
+    slangs = sorted(slang_map) or ["gw"]
+    length = {"short": (5, 20), "long": (80, 200), "leet": (5, 30), "url": (5, 30)}[kind]
+
+    texts = []
+    for _ in range(count):
+        words = []
+        for _ in range(rng.randint(*length)):
+            word = rng.choice(slangs) if rng.random() < 0.2 else rng.choice(frequent)
+            if kind == "leet" and rng.random() < 0.7:
+                word = _leetify(word, rng)
+            elif kind == "url" and rng.random() < 0.25:
+                word = _url(rng, frequent)
+            elif rng.random() < 0.05:
+                word = _leetify(word, rng)
+            if rng.random() < 0.1:
+                word += rng.choice(_PUNCTUATION)
+            words.append(word)
+        texts.append(" ".join(words))
+    return texts
+
+
+def _percentile(sorted_values, fraction):
+    if not sorted_values:
+        return 0.0
+    index = min(len(sorted_values) - 1, int(round(fraction * (len(sorted_values) - 1))))
+    return sorted_values[index]
+
+
+def measure(func, inputs, tokens=None, repeat=1):
+    """
+    Menjalankan `func(item)` untuk setiap item dan mengukur latensi per item,
+    throughput, dan puncak alokasi memori (tracemalloc, pada putaran terpisah agar
+    tidak memengaruhi waktu).
+
+    Args:
+        func (callable): Fungsi yang diukur, menerima satu item.
+        inputs (list): Item input.
+        tokens (int): Jumlah token di seluruh `inputs`, untuk menghitung token/s. Opsional.
+        repeat (int): Jumlah putaran pengukuran waktu.
+
+    Returns:
+        dict: items, tokens, total_s, items_per_s, tokens_per_s, p50_us, p99_us,
+        max_us, peak_memory_kb.
+    """
+    latencies = []
+    total = 0.0
+    for _ in range(repeat):
+        for item in inputs:
+            start = time.perf_counter()
+            func(item)
+            elapsed = time.perf_counter() - start
+            latencies.append(elapsed)
+            total += elapsed
+
+    was_tracing = tracemalloc.is_tracing()
+    if not was_tracing:
+        tracemalloc.start()
+    tracemalloc.reset_peak()
+    baseline, _ = tracemalloc.get_traced_memory()
+    for item in inputs:
+        func(item)
+    _, peak = tracemalloc.get_traced_memory()
+    if not was_tracing:
+        tracemalloc.stop()
+
+    latencies.sort()
+    items = len(inputs) * repeat
+    return {
+        "items": items,
+        "tokens": tokens * repeat if tokens is not None else None,
+        "total_s": total,
+        "items_per_s": items / total if total else 0.0,
+        "tokens_per_s": tokens * repeat / total if tokens is not None and total else None,
+        "p50_us": _percentile(latencies, 0.50) * 1e6,
+        "p99_us": _percentile(latencies, 0.99) * 1e6,
+        "max_us": (latencies[-1] if latencies else 0.0) * 1e6,
+        "peak_memory_kb": (peak - baseline) / 1024,
+    }
+
+
+def run_benchmarks(count=200, seed=0, repeat=1, normalizer=None):
+    """
+    Menjalankan seluruh benchmark pada korpus sintetis dan mengembalikan hasil
+    dalam bentuk dict yang siap disimpan sebagai JSON (lihat `main`).
+
+    Benchmark: tokenize_text dan normalize_text untuk setiap jenis teks, normalize_leet
+    pada token alay, serta tahap singkatan dan typo (lookup indeks) pada token yang
+    tidak ada di korpus.
+    """
+    normalizer = normalizer or Normalizer()
+    start = time.perf_counter()
+    corpus = normalizer.corpus
+    load_s = time.perf_counter() - start
+
+    common_words = list(corpus.words)
+    slang_map = corpus.slang_map
+    results = {}
+
+    for kind in KINDS:
+        texts = synthetic_corpus(kind, count, common_words, slang_map, seed)
+        tokens = sum(len(tokenize_text(s)) for s in texts)
+        results[f"tokenize_text[{kind}]"] = measure(tokenize_text, texts, tokens, repeat)
+        results[f"normalize_text[{kind}]"] = measure(normalizer.normalize_text, texts, tokens, repeat)
+
+    leet_texts = synthetic_corpus("leet", count, common_words, slang_map, seed)
+    leet_tokens = [token for s in leet_texts for token in tokenize_text(s) if not token.isalpha() and token.strip()]
+    results["normalize_leet"] = measure(
+        lambda token: normalize_leet(token, corpus.word_set, corpus.prefixes, normalizer.max_leet_expansions),
+        leet_tokens, len(leet_tokens), repeat,
+    )
+
+    short_texts = synthetic_corpus("short", count, common_words, slang_map, seed)
+    unknown_tokens = [
+        token.lower() for s in short_texts for token in tokenize_text(s)
+        if token.isalpha() and token.lower() not in corpus.word_set
+    ]
+    results["abbreviation_stage"] = measure(
+        corpus.abbreviation_index.lookup, unknown_tokens, len(unknown_tokens), repeat
+    )
+    results["typo_stage"] = measure(corpus.typo_index.lookup, unknown_tokens, len(unknown_tokens), repeat)
+    # Batas kedalaman frekuensi (Normalizer(max_rank=...)) untuk jalur real-time
+    for max_rank in RANK_CUTOFFS:
+        results[f"abbreviation_stage[max_rank={max_rank}]"] = measure(
+            lambda token: corpus.abbreviation_index.lookup(token, max_rank), unknown_tokens, len(unknown_tokens), repeat
+        )
+        results[f"typo_stage[max_rank={max_rank}]"] = measure(
+            lambda token: corpus.typo_index.lookup(token, max_rank), unknown_tokens, len(unknown_tokens), repeat
+        )
+
+    return {
+        "metadata": {
+            "indo_normalizer_version": __version__,
+            "python": platform.python_version(),
+            "implementation": platform.python_implementation(),
+            "platform": platform.platform(),
+            "timestamp": datetime.datetime.now(datetime.timezone.utc).isoformat(),
+            "count": count,
+            "seed": seed,
+            "repeat": repeat,
+            "corpus_load_s": load_s,
+        },
+        "results": results,
+    }
+
+
+def compare(baseline, current):
+    """
+    Membandingkan dua hasil `run_benchmarks` (misalnya dari dua versi).
+    Mengembalikan dict nama benchmark -> rasio p50, p99, dan throughput (current / baseline).
+    """
+    ratios = {}
+    for name, result in current["results"].items():
+        old = baseline.get("results", {}).get(name)
+        if old is None:
+            continue
+        ratios[name] = {
+            key: (result[key] / old[key] if old[key] else None)
+            for key in ("p50_us", "p99_us", "items_per_s")
+        }
+    return ratios
+
+
+def _format_results(report):
+    lines = [f"{'benchmark':<36} {'items/s':>12} {'tokens/s':>12} {'p50 us':>10} {'p99 us':>10} {'peak KiB':>10}"]
+    for name, result in report["results"].items():
+        tokens_per_s = result["tokens_per_s"]
+        lines.append(
+            f"{name:<36} {result['items_per_s']:>12.1f} "
+            f"{(f'{tokens_per_s:.1f}' if tokens_per_s is not None else '-'):>12} "
+            f"{result['p50_us']:>10.1f} {result['p99_us']:>10.1f} {result['peak_memory_kb']:>10.1f}"
+        )
+    return "\n".join(lines)
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(
+        prog="python -m indo_normalizer.benchmark",
+        description="Benchmark the normalization pipeline on a synthetic Indonesian social-media corpus.",
+    )
+    parser.add_argument("-n", "--count", type=int, default=200, help="texts per corpus kind (default: 200)")
+    parser.add_argument("--seed", type=int, default=0, help="seed for the synthetic corpus (default: 0)")
+    parser.add_argument("--repeat", type=int, default=1, help="timing rounds per benchmark (default: 1)")
+    parser.add_argument("-o", "--output", help="write the results to this JSON file")
+    parser.add_argument("--compare", metavar="BASELINE", help="compare against a previously saved JSON result")
+    args = parser.parse_args(argv)
+
+    report = run_benchmarks(count=args.count, seed=args.seed, repeat=args.repeat)
+    print(_format_results(report))
+
+    if args.output:
+        with open(args.output, "w", encoding="utf-8") as f:
+            json.dump(report, f, indent=2)
+        print(f"Hasil benchmark disimpan ke '{args.output}'.")
+
+    if args.compare:
+        with open(args.compare, encoding="utf-8") as f:
+            baseline = json.load(f)
+        print(f"\nRasio terhadap '{args.compare}' (current / baseline):")
+        for name, ratio in compare(baseline, report).items():
+            formatted = "  ".join(
+                f"{key}={value:.2f}" if value is not None else f"{key}=-" for key, value in ratio.items()
+            )
+            print(f"{name:<36} {formatted}")
+
+
+if __name__ == "__main__":
+    main()
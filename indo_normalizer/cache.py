@@ -0,0 +1,91 @@
+import collections
+import threading
+
+
+class TokenCache:
+    """
+    Cache LRU berukuran terbatas yang memetakan token mentah ke hasil normalisasinya
+    (token hasil, kunci counts yang bertambah).
+
+    Cache terikat pada versi korpus: jika korpus berubah, `bind` mengosongkan cache
+    agar tidak ada hasil lama yang terpakai. Aman dipakai dari beberapa thread.
+    """
+
+    def __init__(self, maxsize: int = 100_000):
+        if maxsize < 1:
+            raise ValueError("maxsize must be >= 1")
+        self.maxsize = maxsize
+        self._entries = collections.OrderedDict()
+        self._lock = threading.Lock()
+        self._version = None
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    def __len__(self):
+        return len(self._entries)
+
+    def __getstate__(self):
+        # Lock tidak bisa di-pickle; salinan cache (misalnya untuk worker proses) dimulai kosong
+        return {'maxsize': self.maxsize}
+
+    def __setstate__(self, state):
+        self.__init__(state['maxsize'])
+
+    def bind(self, version):
+        """Mengosongkan cache jika `version` korpus berbeda dari versi isi cache saat ini."""
+        if version != self._version:
+            with self._lock:
+                if version != self._version:
+                    self._entries.clear()
+                    self._version = version
+
+    def get(self, key):
+        """Mengembalikan nilai untuk `key` (dan menandainya baru dipakai), atau None."""
+        with self._lock:
+            value = self._entries.get(key)
+            if value is None:
+                self.misses += 1
+            else:
+                self._entries.move_to_end(key)
+                self.hits += 1
+            return value
+
+    def put(self, key, value):
+        """Menyimpan `key`; entri yang paling lama tidak dipakai dibuang jika cache penuh."""
+        with self._lock:
+            self._entries[key] = value
+            self._entries.move_to_end(key)
+            if len(self._entries) > self.maxsize:
+                self._entries.popitem(last=False)
+                self.evictions += 1
+
+    def clear(self):
+        """Mengosongkan cache dan mereset statistik."""
+        with self._lock:
+            self._entries.clear()
+            self.hits = 0
+            self.misses = 0
+            self.evictions = 0
+
+    def stats(self) -> dict:
+        """Statistik cache: hits, misses, evictions, size, dan maxsize."""
+        return {
+            'hits': self.hits,
+            'misses': self.misses,
+            'evictions': self.evictions,
+            'size': len(self._entries),
+            'maxsize': self.maxsize,
+        }
+
+    def wrap(self, stage, resolve):
+        """Membungkus fungsi resolusi token `resolve` untuk tahap `stage` dengan cache ini."""
+        def cached(token):
+            key = (stage, token)
+            result = self.get(key)
+            if result is None:
+                result = resolve(token)
+                self.put(key, result)
+            return result
+
+        return cached
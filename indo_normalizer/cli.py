@@ -0,0 +1,172 @@
+import argparse
+import collections
+import contextlib
+import csv
+import io
+import json
+import sys
+
+from .Normalizer import Normalizer
+
+FORMATS = ("text", "csv", "jsonl")
+
+
+class InputError(ValueError):
+    """Dilempar ketika sebuah baris input tidak bisa dibaca sesuai format yang dipilih."""
+
+
+@contextlib.contextmanager
+def _open_stream(path, mode, encoding):
+    """Membuka file, atau stdin/stdout jika `path` adalah '-' (tanpa menutup stream aslinya)."""
+    if path != "-":
+        with open(path, mode, encoding=encoding, newline="") as f:
+            yield f
+        return
+    stream = sys.stdin if mode == "r" else sys.stdout
+    if mode == "w":
+        stream.flush()
+    wrapper = io.TextIOWrapper(stream.buffer, encoding=encoding, newline="")
+    try:
+        yield wrapper
+    finally:
+        if mode == "w":
+            wrapper.flush()
+        wrapper.detach()
+
+
+def _text_of(value, where):
+    if value is None:
+        return ""
+    if not isinstance(value, str):
+        raise InputError(f"{where}: expected a string, got {type(value).__name__}")
+    return value
+
+
+def _normalize_records(normalizer, records, get_text, workers, batch_size):
+    """
+    Menghasilkan (record, teks yang dinormalisasi, counts) sesuai urutan input, lewat
+    `Normalizer.normalize_stream`. Hanya record yang hasilnya belum kembali (paling
+    banyak beberapa batch) yang ditahan di memori.
+    """
+    pending = collections.deque()
+
+    def texts():
+        for record in records:
+            pending.append(record)
+            yield get_text(record)
+
+    for normalized, counts in normalizer.normalize_stream(texts(), batch_size=batch_size, workers=workers):
+        yield pending.popleft(), normalized, counts
+
+
+def _run_text(normalizer, source, sink, args):
+    lines = (line.rstrip("\r\n") for line in source)
+    for _, normalized, counts in _normalize_records(normalizer, lines, lambda line: line, args.workers, args.batch_size):
+        if args.counts:
+            sink.write(f"{normalized}\t{json.dumps(dict(counts), ensure_ascii=False)}\n")
+        else:
+            sink.write(normalized + "\n")
+
+
+def _run_csv(normalizer, source, sink, args):
+    reader = csv.DictReader(source, delimiter=args.delimiter)
+    if args.column not in (reader.fieldnames or []):
+        raise InputError(f"column {args.column!r} not found in CSV header")
+    output_column = args.output_column or f"{args.column}_normalized"
+    fieldnames = list(reader.fieldnames)
+    for name in [output_column] + ([f"{args.column}_counts"] if args.counts else []):
+        if name not in fieldnames:
+            fieldnames.append(name)
+    writer = csv.DictWriter(sink, fieldnames=fieldnames, delimiter=args.delimiter, extrasaction="ignore")
+    writer.writeheader()
+
+    def get_text(row):
+        return _text_of(row[args.column], f"line {reader.line_num}")
+
+    for row, normalized, counts in _normalize_records(normalizer, reader, get_text, args.workers, args.batch_size):
+        row[output_column] = normalized
+        if args.counts:
+            row[f"{args.column}_counts"] = json.dumps(dict(counts), ensure_ascii=False)
+        writer.writerow(row)
+
+
+def _run_jsonl(normalizer, source, sink, args):
+    output_field = args.output_field or f"{args.field}_normalized"
+
+    def objects():
+        for number, line in enumerate(source, 1):
+            if not line.strip():
+                continue
+            try:
+                obj = json.loads(line)
+            except json.JSONDecodeError as e:
+                raise InputError(f"line {number}: invalid JSON: {e}") from e
+            if not isinstance(obj, dict) or args.field not in obj:
+                raise InputError(f"line {number}: missing field {args.field!r}")
+            yield obj, _text_of(obj[args.field], f"line {number}")
+
+    for (obj, _), normalized, counts in _normalize_records(
+        normalizer, objects(), lambda item: item[1], args.workers, args.batch_size
+    ):
+        obj[output_field] = normalized
+        if args.counts:
+            obj[f"{args.field}_counts"] = dict(counts)
+        sink.write(json.dumps(obj, ensure_ascii=False) + "\n")
+
+
+def build_parser():
+    parser = argparse.ArgumentParser(
+        prog="indo-normalize",
+        description="Normalize Indonesian informal text from plain-text, CSV or JSONL input, streaming in bounded memory.",
+    )
+    parser.add_argument("input", nargs="?", default="-", help="input file (default: stdin)")
+    parser.add_argument("-o", "--output", default="-", help="output file (default: stdout)")
+    parser.add_argument("-f", "--format", choices=FORMATS, default="text",
+                        help="input format: one text per line, a CSV column, or a JSONL field (default: text)")
+    parser.add_argument("--column", help="CSV column to normalize (required for --format csv)")
+    parser.add_argument("--output-column", help="CSV column for the result (default: <column>_normalized)")
+    parser.add_argument("--delimiter", default=",", help="CSV delimiter (default: ',')")
+    parser.add_argument("--field", help="JSONL field to normalize (required for --format jsonl)")
+    parser.add_argument("--output-field", help="JSONL field for the result (default: <field>_normalized)")
+    parser.add_argument("--counts", action="store_true", help="also emit the normalization counts of every text")
+    parser.add_argument("-w", "--workers", type=int, default=1, help="worker processes (default: 1)")
+    parser.add_argument("-b", "--batch-size", type=int, default=256, help="texts per batch (default: 256)")
+    parser.add_argument("--cache-size", type=int, help="enable a token cache with this many entries")
+    parser.add_argument("--store", metavar="PATH",
+                        help="persistent SQLite token store shared across runs and workers")
+    parser.add_argument("--max-rank", type=int,
+                        help="only search the N most frequent corpus words for abbreviations and typos")
+    parser.add_argument("--encoding", default="utf-8", help="input and output encoding (default: utf-8)")
+    return parser
+
+
+def main(argv=None):
+    parser = build_parser()
+    args = parser.parse_args(argv)
+    if args.format == "csv" and not args.column:
+        parser.error("--column is required for --format csv")
+    if args.format == "jsonl" and not args.field:
+        parser.error("--field is required for --format jsonl")
+    if args.workers < 1:
+        parser.error("--workers must be >= 1")
+    if args.batch_size < 1:
+        parser.error("--batch-size must be >= 1")
+
+    normalizer = Normalizer(cache_size=args.cache_size, max_rank=args.max_rank, store=args.store)
+    # Pesan pemuatan korpus ditulis ke stderr agar tidak tercampur dengan output di stdout
+    with contextlib.redirect_stdout(sys.stderr):
+        normalizer._ensure_corpus()
+
+    run = {"text": _run_text, "csv": _run_csv, "jsonl": _run_jsonl}[args.format]
+    try:
+        with _open_stream(args.input, "r", args.encoding) as source, \
+                _open_stream(args.output, "w", args.encoding) as sink:
+            run(normalizer, source, sink, args)
+    except InputError as e:
+        print(f"indo-normalize: error: {e}", file=sys.stderr)
+        return 1
+    except BrokenPipeError:
+        # Output ditutup lebih awal (misalnya `| head`): berhenti tanpa traceback
+        sys.stderr.close()
+        return 1
+    return 0
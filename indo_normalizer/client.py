@@ -0,0 +1,115 @@
+import http.client
+import json
+import socket
+import threading
+import urllib.parse
+
+from .aio import QueueFullError
+
+
+class ServerError(RuntimeError):
+    """Dilempar ketika server normalisasi mengembalikan kesalahan yang bukan kesalahan input."""
+
+
+class _UnixHTTPConnection(http.client.HTTPConnection):
+    """HTTPConnection lewat Unix domain socket."""
+
+    def __init__(self, path, timeout):
+        super().__init__("localhost", timeout=timeout)
+        self._path = path
+
+    def connect(self):
+        sock = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+        sock.settimeout(self.timeout)
+        sock.connect(self._path)
+        self.sock = sock
+
+
+class NormalizerClient:
+    """
+    Klien tipis untuk `python -m indo_normalizer.serve`, dengan signature yang sama seperti
+    `Normalizer.normalize_text` dan `Normalizer.normalize_many` sehingga bisa menggantikan
+    Normalizer lokal tanpa mengubah pemanggil. Setiap thread memakai koneksi keep-alive sendiri.
+
+    Args:
+        url (str): Alamat server, misalnya 'http://127.0.0.1:8080'.
+        unix_socket (str): Path Unix domain socket server (menggantikan `url`).
+        timeout (float): Batas waktu per permintaan dalam detik.
+    """
+
+    def __init__(self, url: str = "http://127.0.0.1:8080", unix_socket: str = None, timeout: float = 30.0):
+        parsed = urllib.parse.urlsplit(url)
+        if unix_socket is None and parsed.scheme != "http":
+            raise ValueError(f"unsupported URL scheme {parsed.scheme!r}, expected 'http'")
+        self.url = url
+        self.unix_socket = unix_socket
+        self.timeout = timeout
+        self._host = parsed.hostname or "127.0.0.1"
+        self._port = parsed.port or 80
+        self._local = threading.local()
+
+    def _connection(self):
+        connection = getattr(self._local, "connection", None)
+        if connection is None:
+            if self.unix_socket is not None:
+                connection = _UnixHTTPConnection(self.unix_socket, self.timeout)
+            else:
+                connection = http.client.HTTPConnection(self._host, self._port, timeout=self.timeout)
+            self._local.connection = connection
+        return connection
+
+    def _request(self, method, path, body=None):
+        data = json.dumps(body, ensure_ascii=False).encode("utf-8") if body is not None else None
+        headers = {"Content-Type": "application/json"} if data is not None else {}
+        for attempt in range(2):
+            connection = self._connection()
+            try:
+                connection.request(method, path, body=data, headers=headers)
+                response = connection.getresponse()
+                payload = json.loads(response.read() or b"null")
+                break
+            except (http.client.RemoteDisconnected, BrokenPipeError, ConnectionResetError):
+                # Koneksi keep-alive ditutup server: coba sekali lagi dengan koneksi baru
+                connection.close()
+                self._local.connection = None
+                if attempt:
+                    raise
+        if response.status == 503:
+            raise QueueFullError(payload.get("error", "server queue is full"))
+        if response.status == 400:
+            raise ValueError(payload.get("error", "bad request"))
+        if response.status != 200:
+            raise ServerError(f"server returned {response.status}: {payload.get('error') if payload else ''}")
+        return payload
+
+    def normalize_text(self, s: str, stages=None) -> tuple[str, dict]:
+        """Sama seperti `Normalizer.normalize_text`, dijalankan di server."""
+        if not s:
+            return "", {}
+        body = {"text": s}
+        if stages is not None:
+            body["stages"] = sorted(stages) if not isinstance(stages, str) else stages
+        result = self._request("POST", "/normalize", body)
+        return result["normalized_text"], result["counts"]
+
+    def normalize_many(self, texts, stages=None) -> list[tuple[str, dict]]:
+        """Sama seperti `Normalizer.normalize_many`; seluruh `texts` dikirim sebagai satu permintaan."""
+        texts = list(texts)
+        if not texts:
+            return []
+        body = {"texts": texts}
+        if stages is not None:
+            body["stages"] = sorted(stages) if not isinstance(stages, str) else stages
+        return [(result["normalized_text"], result["counts"])
+                for result in self._request("POST", "/normalize", body)["results"]]
+
+    def stats(self) -> dict:
+        """Statistik server (lihat `serve.NormalizationService.stats`)."""
+        return self._request("GET", "/stats")
+
+    def close(self):
+        """Menutup koneksi milik thread ini."""
+        connection = getattr(self._local, "connection", None)
+        if connection is not None:
+            connection.close()
+            self._local.connection = None
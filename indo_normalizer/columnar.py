@@ -0,0 +1,78 @@
+import contextlib
+
+from .stages import COUNT_KEYS
+
+# Normalizer bersama untuk API kolom (pandas, Polars, Arrow) jika pemanggil tidak memberikannya
+_default_normalizer = None
+
+
+def default_normalizer():
+    """Normalizer bawaan yang dibuat sekali dan dipakai ulang oleh API kolom."""
+    global _default_normalizer
+    if _default_normalizer is None:
+        from .Normalizer import Normalizer
+        _default_normalizer = Normalizer()
+    return _default_normalizer
+
+
+@contextlib.contextmanager
+def worker_pool(normalizer, workers, pool=None):
+    """
+    Worker pool untuk satu panggilan API kolom yang memproses banyak batch: `pool` jika
+    diberikan, `parallel.WorkerPool` baru (ditutup di akhir blok) jika `workers` > 1,
+    selain itu None. Dengan begitu worker dibuat sekali per panggilan, bukan per batch.
+    """
+    if pool is not None or workers <= 1:
+        yield pool
+        return
+    from .parallel import WorkerPool
+    with WorkerPool(normalizer or default_normalizer(), workers) as pool:
+        yield pool
+
+
+def normalize_column(texts, normalizer=None, workers=1, chunksize=2048, stages=None, pool=None):
+    """
+    Menormalisasi satu kolom teks sekaligus dan mengembalikan hasilnya per kolom.
+
+    Teks yang sama di dalam kolom hanya dinormalisasi sekali, dan token yang sama di
+    antara teks yang berbeda hanya diproses sekali per tahap (lihat `Normalizer.normalize_many`).
+    Nilai yang bukan string (None, NaN) menghasilkan None dengan counts 0.
+
+    Args:
+        texts (sequence): Nilai kolom.
+        normalizer (Normalizer): Normalizer yang dipakai. None = `default_normalizer()`.
+        workers (int): Jumlah proses worker; > 1 membagi teks unik ke beberapa core.
+        chunksize (int): Jumlah teks per chunk untuk setiap worker.
+        stages (iterable of str): Tahap yang dijalankan (lihat `Normalizer.normalize_text`).
+        pool (parallel.WorkerPool): Worker pool yang dipakai ulang antar panggilan (lihat
+            `worker_pool`). Jika diisi, `workers` diabaikan dan `normalizer` default-nya
+            adalah Normalizer milik pool.
+
+    Returns:
+        tuple: (list teks yang dinormalisasi, dict kunci counts -> list int), dengan kunci
+        counts sesuai `stages.COUNT_KEYS`, sepanjang dan seurut `texts`.
+    """
+    unique = list(dict.fromkeys(text for text in texts if isinstance(text, str)))
+    if pool is not None:
+        if normalizer is not None and normalizer is not pool.normalizer:
+            raise ValueError("WorkerPool was created for a different normalizer")
+        results = dict(zip(unique, pool.normalize_many(unique, chunksize=chunksize, stages=stages)))
+    else:
+        normalizer = normalizer or default_normalizer()
+        results = dict(zip(unique, normalizer.normalize_many(
+            unique, workers=workers, chunksize=chunksize, stages=stages
+        )))
+
+    normalized = []
+    counts = {key: [] for key in COUNT_KEYS}
+    for text in texts:
+        result = results.get(text) if isinstance(text, str) else None
+        if result is None:
+            normalized.append(None)
+            for key in COUNT_KEYS:
+                counts[key].append(0)
+            continue
+        normalized.append(result[0])
+        for key in COUNT_KEYS:
+            counts[key].append(result[1].get(key, 0))
+    return normalized, counts
@@ -0,0 +1,334 @@
+import collections.abc
+import csv
+import hashlib
+import os
+import threading
+import types
+
+from .indexes import AbbreviationIndex, TypoIndex, as_word_sequence, word_prefixes
+
+
+def read_common_words(path):
+    """
+    Membaca common_words.txt: satu kata per baris. Setiap baris di-strip dan
+    di-lowercase, baris kosong dilewati, dan urutan file dipertahankan.
+    """
+    with open(path, "r", encoding="utf-8") as f:
+        return [line.strip().lower() for line in f if line.strip()]
+
+
+def read_slang_map(path):
+    """
+    Membaca slangs.csv (kolom 'slang' dan 'formal') menjadi dict slang -> formal,
+    keduanya di-lowercase. Hanya memakai modul csv bawaan.
+
+    Raises:
+        ValueError: Jika kolom 'slang' atau 'formal' tidak ada.
+    """
+    with open(path, "r", encoding="utf-8", newline="") as f:
+        reader = csv.DictReader(f)
+        if 'slang' not in (reader.fieldnames or []) or 'formal' not in reader.fieldnames:
+            raise ValueError("must have 'slang' and 'formal' columns")
+        return {row['slang'].lower(): row['formal'].lower() for row in reader}
+
+
+def snapshot_cache_dir():
+    """
+    Folder cache snapshot korpus yang dibuat otomatis: $INDO_NORMALIZER_CACHE_DIR, atau
+    $XDG_CACHE_HOME/indo_normalizer, atau ~/.cache/indo_normalizer.
+    """
+    cache_dir = os.environ.get('INDO_NORMALIZER_CACHE_DIR')
+    if cache_dir:
+        return cache_dir
+    cache_home = os.environ.get('XDG_CACHE_HOME') or os.path.join(os.path.expanduser('~'), '.cache')
+    return os.path.join(cache_home, 'indo_normalizer')
+
+
+def bundled_paths():
+    """
+    Path common_words.txt, slangs.csv, dan corpus.snapshot bawaan package (folder 'corpus/').
+    Jika package tidak menyertakan snapshot, path snapshot berada di `snapshot_cache_dir()`
+    dan dibuat otomatis saat korpus pertama kali dimuat.
+    """
+    corpus_dir = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'corpus')
+    snapshot_path = os.path.join(corpus_dir, 'corpus.snapshot')
+    if not os.path.exists(snapshot_path):
+        snapshot_path = os.path.join(snapshot_cache_dir(), 'corpus.snapshot')
+    return (
+        os.path.join(corpus_dir, 'common_words.txt'),
+        os.path.join(corpus_dir, 'slangs.csv'),
+        snapshot_path,
+    )
+
+
+def _in_cache_dir(path):
+    return os.path.dirname(os.path.abspath(path)) == os.path.abspath(snapshot_cache_dir())
+
+
+def corpus_version(words, slang_map):
+    """Hash SHA-256 isi korpus (kata dan pasangan slang); sama untuk isi yang sama."""
+    digest = hashlib.sha256()
+    digest.update("\n".join(words).encode("utf-8"))
+    digest.update(b"\0")
+    digest.update("\n".join(f"{slang}\t{formal}" for slang, formal in slang_map.items()).encode("utf-8"))
+    return digest.hexdigest()
+
+
+def _load_common_words_file(path):
+    """read_common_words dengan pesan pemuatan; file yang tidak ada atau rusak menghasilkan list kosong."""
+    # Urutan baris dipertahankan, setiap kata di-strip dan di-lowercase
+    try:
+        words = read_common_words(path)
+        print(f"Korpus '{path}' berhasil dimuat. ({len(words)} kata)")
+    except FileNotFoundError:
+        print(f"WARNING: '{path}' not found. Some normalization features may not work.")
+        words = [] # Ensure it's empty if file not found
+    except Exception as e:
+        print(f"WARNING: Error loading '{path}': {e}. Some normalization features may not work.")
+        words = [] # Ensure it's empty if error occurs
+    return words
+
+
+def _load_slang_file(path):
+    """read_slang_map dengan pesan pemuatan; file yang tidak ada atau rusak menghasilkan dict kosong."""
+    if not os.path.exists(path):
+        print(f"WARNING: '{path}' not found. Slang map empty.")
+        return {} # Ensure it's empty if file not found
+    # Cukup dengan modul csv bawaan, tanpa pandas
+    try:
+        slang_map = read_slang_map(path)
+        print(f"Korpus '{path}' berhasil dimuat. ({len(slang_map)} pasangan)")
+    except Exception as e:
+        print(f"WARNING: Error loading '{path}': {e}. Slang map empty.")
+        slang_map = {} # Ensure it's empty on error
+    return slang_map
+
+
+def _is_path(source):
+    return isinstance(source, (str, os.PathLike))
+
+
+def read_words_source(source):
+    """
+    Kata baku dari satu sumber: path file (str atau PathLike) atau iterable kata.
+    Setiap kata di-strip dan di-lowercase, kata kosong dilewati, urutan dipertahankan.
+    """
+    if _is_path(source):
+        return _load_common_words_file(os.fspath(source))
+    return [word.strip().lower() for word in source if word.strip()]
+
+
+def read_slangs_source(source):
+    """
+    Peta slang -> formal dari satu sumber: path file CSV (str atau PathLike), Mapping,
+    atau iterable pasangan (slang, formal). Keduanya di-lowercase.
+    """
+    if _is_path(source):
+        return _load_slang_file(os.fspath(source))
+    if isinstance(source, collections.abc.Mapping):
+        source = source.items()
+    return {slang.lower(): formal.lower() for slang, formal in source}
+
+
+class Corpus:
+    """
+    Korpus yang tidak bisa diubah: kata baku (urutan korpus), peta slang, dan indeks
+    turunannya (singkatan, typo, prefiks leet). Aman dipakai bersama oleh banyak thread
+    dan banyak Normalizer sekaligus.
+
+    Atribut:
+        words (Sequence): Kata baku lowercase, urutan file. Jika dimuat dari snapshot, kata
+            dibaca langsung dari mmap yang dipakai bersama antar proses.
+        word_set (frozenset): Kata baku untuk lookup O(1).
+        slang_map (Mapping): Peta slang -> formal (read-only).
+        abbreviation_index (AbbreviationIndex), typo_index (TypoIndex),
+        prefixes (frozenset): Indeks yang dibangun sekali per korpus.
+        version (str): Hash isi korpus (lihat `corpus_version`), untuk cache yang terikat korpus.
+        source (tuple): (common_words_path, slangs_csv_path, snapshot_path) jika dimuat dari
+            file lewat `load_corpus`, selain itu None.
+    """
+
+    __slots__ = ('words', 'word_set', 'slang_map', 'abbreviation_index', 'typo_index',
+                 'prefixes', 'version', 'source')
+
+    def __init__(self, words, slang_map, abbreviation_index=None, typo_index=None, prefixes=None, source=None):
+        words = as_word_sequence(words)
+        slang_map = dict(slang_map)
+        _set = object.__setattr__
+        _set(self, 'words', words)
+        _set(self, 'word_set', frozenset(words))
+        _set(self, 'slang_map', types.MappingProxyType(slang_map))
+        if abbreviation_index is None:
+            abbreviation_index = AbbreviationIndex(words)
+        if typo_index is None:
+            # Indeks typo memakai bitmask yang sama dengan indeks singkatan
+            typo_index = TypoIndex(words, masks=abbreviation_index.masks)
+        _set(self, 'abbreviation_index', abbreviation_index)
+        _set(self, 'typo_index', typo_index)
+        _set(self, 'prefixes', prefixes if prefixes is not None else word_prefixes(words))
+        _set(self, 'version', corpus_version(words, slang_map))
+        _set(self, 'source', source)
+
+    def __setattr__(self, name, value):
+        raise AttributeError("Corpus is immutable")
+
+    def __delattr__(self, name):
+        raise AttributeError("Corpus is immutable")
+
+    def __repr__(self):
+        return f"Corpus({len(self.words)} words, {len(self.slang_map)} slangs, version={self.version[:12]})"
+
+    def __reduce__(self):
+        # Korpus dari file di-pickle sebagai referensi ke registry: proses penerima
+        # memuatnya sekali (atau memakai salinan yang sudah ada) daripada menyalin indeksnya
+        if self.source is not None:
+            return load_corpus, self.source
+        return Corpus, (self.words, dict(self.slang_map))
+
+    def layered(self, common_words=None, slangs=None):
+        """
+        Korpus baru dengan lapisan di atas korpus ini: kata dari `common_words` yang belum
+        ada ditambahkan di akhir (urutan korpus dasar dipertahankan), dan pasangan dari
+        `slangs` menimpa slang yang sama di korpus dasar. Sumber diterima dalam bentuk yang
+        sama dengan `read_words_source` dan `read_slangs_source`.
+        """
+        words = list(self.words)
+        if common_words is not None:
+            seen = set(self.word_set)
+            for word in read_words_source(common_words):
+                if word not in seen:
+                    seen.add(word)
+                    words.append(word)
+        slang_map = dict(self.slang_map)
+        if slangs is not None:
+            slang_map.update(read_slangs_source(slangs))
+        return Corpus(words, slang_map)
+
+    @classmethod
+    def from_files(cls, common_words_path, slangs_csv_path, snapshot_path=None):
+        """
+        Memuat korpus dari file teks, atau dari snapshot biner jika ada dan masih sesuai
+        (lihat `indo_normalizer.snapshot`). File yang tidak ada atau gagal dibaca
+        menghasilkan bagian korpus yang kosong disertai peringatan.
+
+        Snapshot di `snapshot_cache_dir()` dikelola otomatis: jika belum ada atau basi,
+        snapshot ditulis ulang dari korpus yang baru dimuat dari file teks.
+        """
+        from . import snapshot
+
+        # Snapshot dibuka dan diverifikasi sekali untuk kedua bagian korpus
+        loaded_words, slang_map = snapshot.load(snapshot_path, common_words_path, slangs_csv_path)
+        sources = None
+        if snapshot_path and (loaded_words is None or slang_map is None) and _in_cache_dir(snapshot_path):
+            try:
+                # Digest diambil sebelum file teks dibaca agar snapshot tidak mengklaim isi yang lebih baru
+                sources = {"common_words": snapshot.file_digest(common_words_path),
+                           "slangs": snapshot.file_digest(slangs_csv_path)}
+            except OSError:
+                sources = None
+
+        if loaded_words is not None:
+            words, abbreviation_index, typo_index, prefixes = loaded_words
+            print(f"Korpus '{common_words_path}' berhasil dimuat dari snapshot. ({len(words)} kata)")
+        else:
+            abbreviation_index = typo_index = prefixes = None
+            words = _load_common_words_file(common_words_path)
+
+        if slang_map is not None:
+            print(f"Korpus '{slangs_csv_path}' berhasil dimuat dari snapshot. ({len(slang_map)} pasangan)")
+        else:
+            slang_map = _load_slang_file(slangs_csv_path)
+
+        corpus = cls(words, slang_map, abbreviation_index, typo_index, prefixes,
+                     source=(common_words_path, slangs_csv_path, snapshot_path))
+        if sources is not None:
+            try:
+                snapshot.write_corpus(corpus, common_words_path, slangs_csv_path, snapshot_path, sources)
+            except (OSError, ValueError) as e:
+                print(f"WARNING: Cannot write snapshot '{snapshot_path}': {e}")
+        return corpus
+
+
+# Registry korpus per proses: path sumber -> Corpus, sehingga setiap file hanya dimuat sekali
+_REGISTRY = {}
+_REGISTRY_LOCK = threading.Lock()
+
+
+def load_corpus(common_words_path=None, slangs_csv_path=None, snapshot_path=None, refresh=False):
+    """
+    Mengembalikan Corpus untuk file-file ini dari registry proses, dan memuatnya hanya
+    jika belum pernah dimuat. Path yang None memakai file bawaan package. Semua
+    Normalizer dengan sumber yang sama memakai satu objek Corpus yang sama.
+
+    Dengan `refresh=True` file selalu dibaca ulang dan korpus baru menggantikan entri
+    registry; objek Corpus lama tetap utuh bagi yang masih memakainya.
+    """
+    default_common_words, default_slangs, default_snapshot = bundled_paths()
+    if common_words_path is None:
+        common_words_path = default_common_words
+    if slangs_csv_path is None:
+        slangs_csv_path = default_slangs
+    if snapshot_path is None and (common_words_path, slangs_csv_path) == (default_common_words, default_slangs):
+        snapshot_path = default_snapshot
+    key = (os.path.abspath(common_words_path), os.path.abspath(slangs_csv_path),
+           os.path.abspath(snapshot_path) if snapshot_path else None)
+
+    if refresh:
+        # Dibangun di luar lock agar pemuatan sumber lain tidak ikut menunggu
+        corpus = Corpus.from_files(*key)
+        with _REGISTRY_LOCK:
+            _REGISTRY[key] = corpus
+        return corpus
+
+    corpus = _REGISTRY.get(key)
+    if corpus is None:
+        with _REGISTRY_LOCK:
+            corpus = _REGISTRY.get(key)
+            if corpus is None:
+                corpus = _REGISTRY[key] = Corpus.from_files(*key)
+    return corpus
+
+
+def build_corpus(common_words=None, slangs=None, overrides=(), snapshot_path=None, refresh=False):
+    """
+    Membangun Corpus dari sumber dasar ditambah lapisan override, misalnya kamus dasar
+    ditambah slang khusus domain.
+
+    Args:
+        common_words: Sumber kata baku dasar: path file atau iterable kata. None = bawaan package.
+        slangs: Sumber slang dasar: path CSV, Mapping, atau iterable pasangan (slang, formal).
+            None = bawaan package.
+        overrides (iterable of dict): Lapisan yang diterapkan berurutan di atas sumber dasar
+            (lihat `Corpus.layered`), masing-masing dict dengan kunci opsional
+            'common_words' dan 'slangs'.
+        snapshot_path (str): Snapshot biner untuk sumber dasar berupa file.
+        refresh (bool): Baca ulang semua file, abaikan korpus yang sudah ada di registry.
+
+    Sumber dasar yang keduanya berupa file dimuat lewat registry (`load_corpus`);
+    sumber lain dibaca setiap kali fungsi ini dipanggil.
+
+    Raises:
+        ValueError: Jika lapisan override berisi kunci selain 'common_words' dan 'slangs'.
+    """
+    layers = [dict(layer) for layer in overrides]
+    for layer in layers:
+        unknown = set(layer) - {'common_words', 'slangs'}
+        if unknown:
+            raise ValueError(f"unknown corpus override keys {sorted(unknown)}, expected 'common_words' and 'slangs'")
+
+    if all(source is None or _is_path(source) for source in (common_words, slangs)):
+        corpus = load_corpus(
+            os.fspath(common_words) if common_words is not None else None,
+            os.fspath(slangs) if slangs is not None else None,
+            snapshot_path, refresh=refresh,
+        )
+    else:
+        default_common_words, default_slangs, _ = bundled_paths()
+        corpus = Corpus(
+            read_words_source(default_common_words if common_words is None else common_words),
+            read_slangs_source(default_slangs if slangs is None else slangs),
+        )
+
+    for layer in layers:
+        corpus = corpus.layered(layer.get('common_words'), layer.get('slangs'))
+    return corpus
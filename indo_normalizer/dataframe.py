@@ -0,0 +1,111 @@
+import threading
+import weakref
+
+from .columnar import default_normalizer, normalize_column
+from .stages import COUNT_KEYS
+
+# pandas dan Polars opsional; namespace `indo` hanya didaftarkan untuk library yang terpasang
+try:
+    import pandas as pd
+except ImportError:
+    pd = None
+
+try:
+    import polars as pl
+except ImportError:
+    pl = None
+
+
+if pd is not None:
+    @pd.api.extensions.register_series_accessor("indo")
+    class IndoSeriesAccessor:
+        """Namespace `Series.indo` untuk menormalisasi satu kolom teks tanpa loop per baris."""
+
+        def __init__(self, series):
+            self._series = series
+
+        def normalize(self, normalizer=None, counts=True, workers=1, chunksize=2048, stages=None, pool=None):
+            """
+            Menormalisasi seluruh Series sekaligus (lihat `columnar.normalize_column`).
+
+            Args:
+                normalizer (Normalizer): Normalizer yang dipakai. None = Normalizer bawaan.
+                counts (bool): Jika True, kembalikan DataFrame dengan kolom 'normalized_text'
+                    dan satu kolom int per kunci counts (`stages.COUNT_KEYS`). Jika False,
+                    kembalikan Series teks yang dinormalisasi saja.
+                workers (int): Jumlah proses worker; > 1 membagi kolom ke beberapa core.
+                chunksize (int): Jumlah teks per chunk untuk setiap worker.
+                stages (iterable of str): Tahap yang dijalankan (lihat `Normalizer.normalize_text`).
+                pool (parallel.WorkerPool): Worker pool yang dipakai ulang antar panggilan;
+                    jika diisi, `workers` diabaikan (lihat `columnar.normalize_column`).
+
+            Index hasil sama dengan index Series; nilai kosong (NaN/None) tetap kosong.
+            """
+            normalized, columns = normalize_column(
+                self._series.tolist(), normalizer, workers=workers, chunksize=chunksize, stages=stages, pool=pool
+            )
+            index = self._series.index
+            if not counts:
+                return pd.Series(normalized, index=index, name=self._series.name, dtype=object)
+            frame = pd.DataFrame({"normalized_text": pd.Series(normalized, index=index, dtype=object)})
+            for key in COUNT_KEYS:
+                frame[key] = pd.Series(columns[key], index=index, dtype="int64")
+            return frame
+
+
+class _ExpressionPool:
+    """
+    WorkerPool milik satu ekspresi Polars: dibuat saat batch pertama dievaluasi, lalu dipakai
+    oleh semua batch berikutnya (Polars memanggil fungsi `map_batches` sekali per batch pada
+    frame lazy/streaming). Pool ditutup ketika ekspresinya dibuang atau saat interpreter keluar.
+    """
+
+    def __init__(self, normalizer, workers):
+        self._normalizer = normalizer
+        self._workers = workers
+        self._pool = None
+        self._lock = threading.Lock()
+
+    def get(self):
+        with self._lock:
+            if self._pool is None:
+                from .parallel import WorkerPool
+                self._pool = WorkerPool(self._normalizer or default_normalizer(), self._workers)
+                weakref.finalize(self, self._pool.shutdown)
+            return self._pool
+
+
+if pl is not None:
+    @pl.api.register_expr_namespace("indo")
+    class IndoExprNamespace:
+        """Namespace ekspresi `pl.col(...).indo` untuk menormalisasi kolom teks."""
+
+        def __init__(self, expr):
+            self._expr = expr
+
+        def normalize(self, normalizer=None, workers=1, chunksize=2048, stages=None, pool=None):
+            """
+            Ekspresi yang menormalisasi kolom teks per batch (lihat `columnar.normalize_column`)
+            dan menghasilkan Struct berisi 'normalized_text' dan satu field Int64 per kunci
+            counts (`stages.COUNT_KEYS`); gunakan `.struct.field(...)` atau `unnest` untuk
+            mengambil kolomnya. Argumen sama seperti `Series.indo.normalize`.
+
+            Dengan `workers` > 1 tanpa `pool`, ekspresi ini membuat satu worker pool saat
+            pertama kali dievaluasi dan memakainya untuk semua batch (juga pada frame lazy
+            atau streaming), bukan satu pool per batch.
+            """
+            dtype = pl.Struct({"normalized_text": pl.String, **{key: pl.Int64 for key in COUNT_KEYS}})
+            shared = _ExpressionPool(normalizer, workers) if pool is None and workers > 1 else None
+
+            def normalize_batch(series):
+                normalized, columns = normalize_column(
+                    series.to_list(), normalizer, chunksize=chunksize, stages=stages,
+                    pool=shared.get() if shared is not None else pool
+                )
+                frame = pl.DataFrame(
+                    [pl.Series("normalized_text", normalized, dtype=pl.String)]
+                    + [pl.Series(key, columns[key], dtype=pl.Int64) for key in COUNT_KEYS]
+                )
+                return frame.to_struct(series.name)
+
+            return self._expr.map_batches(normalize_batch, return_dtype=dtype, is_elementwise=True)
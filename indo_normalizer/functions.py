@@ -1,3 +1,6 @@
+import itertools
+import re
+
 from rapidfuzz.distance import DamerauLevenshtein
 
 LEET_MAP = {
@@ -32,6 +35,39 @@ FORCED_LEET_MAP = {
     "0": "o"
 }
 
+# Email atau domain (contoh: user@mail.id, unimelb.edu.au) selalu menjadi satu token utuh
+EMAIL_OR_DOMAIN_PATTERN = re.compile(
+    r"\b[\w\.-]+@[\w\.-]+\.\w+\b|\b[\w\-]+\.(?:[\w\-]+\.)*[\w\-]+\b"
+)
+
+# Satu token non-domain, dicoba berurutan sesuai aturan tokenize_text:
+#   - ' ! ' / ' @ ' / ' $ '                         (aturan 3)
+#   - digit yang diapit spasi / awal / akhir teks      (aturan 3)
+#   - '!' setelah non-spasi dan sebelum spasi / akhir  (aturan 6)
+#   - kata: huruf, digit, dan ! @ $, berhenti sebelum '!' yang diikuti spasi / akhir (aturan 1, 4, 5)
+#   - run karakter selain huruf/digit/! @ $            (aturan 2)
+# "Huruf atau digit" ditulis sebagai (?!_)\w; ini sama dengan c.isalpha() or c.isdigit()
+# kecuali untuk karakter numerik khusus (lihat _has_ambiguous_chars).
+TOKEN_PATTERN = re.compile(
+    r" [!@$] "
+    r"|(?<![^ ])\d(?![^ ])"
+    r"|(?<=\S)!(?!\S)"
+    r"|(?!_)[\w!@$](?:(?!_|!(?!\S))[\w!@$])*"
+    r"|(?:[^\w!@$]|_)+"
+)
+
+
+def _has_ambiguous_chars(s):
+    """
+    True jika `s` memuat karakter yang diklasifikasikan berbeda oleh regex dan oleh
+    str.isalpha()/str.isdigit() (misalnya '²' atau '½'). Teks seperti ini ditokenisasi
+    dengan pemindaian per karakter agar hasilnya tetap sama persis.
+    """
+    if s.isascii():
+        return False
+    return any(c.isalnum() and not c.isalpha() and not c.isdecimal() for c in set(s) if c > "\x7f")
+
+
 def tokenize_text(s):
     """
     Tokenize string `s` dengan aturan:
@@ -46,34 +82,150 @@ def tokenize_text(s):
        (bag1! → ['bag1', '!']).
     7. Domain (contoh: unimelb.edu.au) harus jadi satu token utuh.
     8. Email (contoh: user@mail.id) juga harus jadi satu token utuh.
+
+    Token dipindai dengan satu regex terkompilasi (TOKEN_PATTERN); posisi awal
+    domain/email disimpan di dict sehingga pengecekannya O(1) per token.
     """
-    import re
-    ascii_symbols = "!@$"
+    # posisi awal -> posisi akhir setiap domain/email
+    domain_ends = {m.start(): m.end() for m in EMAIL_OR_DOMAIN_PATTERN.finditer(s)}
+
+    if _has_ambiguous_chars(s):
+        return _tokenize_text_by_char(s, domain_ends)
+
+    if not domain_ends:
+        return TOKEN_PATTERN.findall(s)
+
     tokens = []
     n = len(s)
+    idx = 0
+    while idx < n:
+        end = domain_ends.get(idx)
+        if end is None:
+            end = TOKEN_PATTERN.match(s, idx).end()
+        tokens.append(s[idx:end])
+        idx = end
+    return tokens
+
+
+# Karakter yang bisa menjadi bagian domain/email. Setiap kecocokan EMAIL_OR_DOMAIN_PATTERN
+# memuat titik yang diapit karakter seperti _DOMAIN_DOT_PATTERN; rentang tanpa pola
+# tersebut tidak mungkin menjadi domain/email.
+_DOMAIN_CHAR_PATTERN = re.compile(r"[\w.@-]")
+_DOMAIN_DOT_PATTERN = re.compile(r"[\w.-]\.[\w-]")
+# Token pengganti yang mengandung karakter ini selalu ditokenisasi ulang bersama seluruh teks
+_UNSAFE_REPLACEMENT_PATTERN = re.compile(r"[\s.@!$]")
+
+
+# Tiga karakter sama berturut-turut (tanpa membedakan huruf besar/kecil); token tanpa pola
+# ini tidak diubah normalize_repetitions. Backreference IGNORECASE menganggap sama setiap
+# pasangan karakter yang lower()-nya sama, jadi tidak ada pengulangan yang terlewat.
+_REPETITION_PATTERN = re.compile(r"(.)\1\1", re.IGNORECASE | re.DOTALL)
+
+
+def _is_word_char(c):
+    return c.isalpha() or c.isdigit()
+
+
+def _is_letterlike(c):
+    return c.isalpha() or c.isdigit() or c in "!@$"
+
+
+def _domain_run(tokens, i):
+    """Rentang karakter domain/email yang bersambung dengan tokens[i], termasuk token itu sendiri."""
+    left = []
+    j = i - 1
+    while j >= 0:
+        token = tokens[j]
+        k = len(token)
+        while k > 0 and _DOMAIN_CHAR_PATTERN.match(token[k - 1]):
+            k -= 1
+        left.append(token[k:])
+        if k > 0:
+            break
+        j -= 1
+
+    right = []
+    j = i + 1
+    while j < len(tokens):
+        token = tokens[j]
+        k = 0
+        while k < len(token) and _DOMAIN_CHAR_PATTERN.match(token[k]):
+            k += 1
+        right.append(token[:k])
+        if k < len(token):
+            break
+        j += 1
+
+    return "".join(reversed(left)) + tokens[i] + "".join(right)
+
+
+def _retokenizes_alone(tokens, new_tokens, i):
+    """
+    True jika hasil tokenize_text(new_tokens[i]) dijamin sama dengan token-token yang
+    dihasilkan untuk rentang tersebut saat seluruh teks gabungan ditokenisasi ulang.
+
+    Syaratnya: token lama adalah token kata, token baru diawali dan diakhiri huruf/digit
+    tanpa spasi atau simbol . @ ! $, tetangganya (sebelum maupun sesudah perubahan)
+    bukan huruf/digit/simbol kecuali token '!' yang berdiri sendiri, dan tidak ada
+    domain/email yang mungkin terbentuk di sekitar token tersebut.
+    """
+    token, new_token = tokens[i], new_tokens[i]
+    if not new_token or _UNSAFE_REPLACEMENT_PATTERN.search(new_token):
+        return False
+    if not (_is_letterlike(token[0]) and _is_letterlike(token[-1])):
+        return False
+    if not (_is_word_char(new_token[0]) and _is_word_char(new_token[-1])):
+        return False
+    if i > 0 and (_is_letterlike(tokens[i - 1][-1]) or _is_letterlike(new_tokens[i - 1][-1])):
+        return False
+    if i + 1 < len(tokens):
+        next_token, new_next_token = tokens[i + 1], new_tokens[i + 1]
+        if not (next_token == new_next_token == "!"):
+            if _is_letterlike(next_token[0]) or _is_letterlike(new_next_token[0]):
+                return False
+    return not (_DOMAIN_DOT_PATTERN.search(_domain_run(tokens, i)) or _DOMAIN_DOT_PATTERN.search(_domain_run(new_tokens, i)))
+
 
-    email_or_domain_pattern = re.compile(
-        r"\b[\w\.-]+@[\w\.-]+\.\w+\b|\b[\w\-]+\.(?:[\w\-]+\.)*[\w\-]+\b"
-    )
-    domain_spans = {m.span(): m.group() for m in email_or_domain_pattern.finditer(s)}
+def retokenize(tokens, new_tokens):
+    """
+    Menghasilkan tokenize_text("".join(new_tokens)), dengan `tokens` adalah hasil
+    tokenize_text dari teks asli dan `new_tokens[i]` adalah pengganti `tokens[i]`.
+
+    Token yang tidak berubah dipakai apa adanya dan hanya token yang berubah yang
+    ditokenisasi ulang. Jika sebuah perubahan bisa memengaruhi tokenisasi tetangganya
+    (misalnya di sekitar domain/email), seluruh teks gabungan ditokenisasi ulang.
+    """
+    result = []
+    for i, (token, new_token) in enumerate(zip(tokens, new_tokens)):
+        if new_token == token:
+            result.append(token)
+        elif _retokenizes_alone(tokens, new_tokens, i):
+            result.extend(tokenize_text(new_token))
+        else:
+            return tokenize_text("".join(new_tokens))
+    return result
+
+
+def _tokenize_text_by_char(s, domain_ends):
+    """
+    Pemindaian per karakter untuk tokenize_text, dipakai untuk teks yang memuat
+    karakter numerik khusus yang tidak bisa diklasifikasikan dengan tepat oleh regex.
+    """
+    ascii_symbols = "!@$"
+    tokens = []
+    n = len(s)
 
     def is_letter(c):        return c.isalpha()
     def is_letterlike(c):    return c.isdigit() or c in ascii_symbols
 
-    # sort by position
-    domain_pos = sorted(domain_spans.items())
     idx = 0
 
     while idx < n:
         # domain/email check
-        matched = False
-        for (start, end), val in domain_pos:
-            if idx == start:
-                tokens.append(val)
-                idx = end
-                matched = True
-                break
-        if matched:
+        end = domain_ends.get(idx)
+        if end is not None:
+            tokens.append(s[idx:end])
+            idx = end
             continue
 
         # aturan 3: ' ! ' / ' @ ' / ' $ '
@@ -129,29 +281,30 @@ def normalize_repetitions(word):
     Returns:
         str: Kata yang telah dinormalisasi.
     """
-    if not word:
+    # Kebanyakan token tidak punya pengulangan 3 karakter: kembalikan tanpa membangun ulang
+    if not word or not _REPETITION_PATTERN.search(word):
         return word
 
-    result_word = ""
-    i = 0
-    while i < len(word):
-        result_word += word[i]  # Tambahkan karakter saat ini ke hasil
-        count = 1
-        # Hitung berapa kali karakter ini berulang (case-insensitive)
-        while i + count < len(word) and word[i + count].lower() == word[i].lower():
-            count += 1
-
-        # Jika karakter berulang 3 kali atau lebih, lewati semua pengulangan
-        # (karena kita sudah menambahkan 1 instance di awal loop)
-        if count >= 3:
-            i += count
-        else:
-            # Jika berulang 2 kali atau kurang, pindah ke karakter berikutnya
-            # (kita hanya bergerak 1 karakter karena pengulangan <= 2 tetap dibiarkan)
-            i += 1
-    return result_word
+    # Kelompokkan karakter berurutan yang sama (case-insensitive), dalam waktu linear
+    parts = []
+    for _, group in itertools.groupby(word, key=str.lower):
+        run = "".join(group)
+        # Pengulangan 3 kali atau lebih dipotong menjadi karakter pertamanya;
+        # pengulangan 2 kali atau kurang dibiarkan apa adanya
+        parts.append(run[0] if len(run) >= 3 else run)
+    return "".join(parts)
+
+def normalize_leet(word, common_words, prefixes=None, max_expansions=None):
+    """
+    Mengganti karakter leet (lihat LEET_MAP) sehingga token menjadi kata di `common_words`.
 
-def normalize_leet(word, common_words):
+    Kombinasi substitusi ditelusuri secara depth-first dengan stack eksplisit.
+    Jika `prefixes` (set semua prefiks lowercase kata korpus, lihat `indexes.word_prefixes`)
+    diberikan, cabang yang prefiksnya tidak mungkin menjadi kata korpus langsung dipangkas;
+    hasilnya tetap sama dengan penelusuran penuh. `max_expansions` membatasi jumlah simpul
+    yang dikunjungi: jika batas tercapai, penelusuran berhenti dan hanya kandidat yang
+    sudah ditemukan yang dipertimbangkan.
+    """
     # Jika kata sudah murni alfabet, kembalikan seperti aslinya (tidak diubah case-nya)
     if word.isalpha():
         return word
@@ -159,31 +312,34 @@ def normalize_leet(word, common_words):
     has_trailing_2 = word.endswith("2")
     core_word = word[:-1] if has_trailing_2 else word
 
-    results = set() # Untuk menyimpan hasil yang ditemukan, dengan case yang sudah terbentuk
+    # Lowercase per karakter hanya berbeda dari lowercase seluruh kata untuk sigma akhir
+    # Yunani ('Σ' -> 'ς'); pemangkasan prefiks dimatikan agar hasilnya tetap sama persis
+    if prefixes is not None and "Σ" in core_word:
+        prefixes = None
 
-    def backtrack(index, path):
+    results = set() # Untuk menyimpan hasil yang ditemukan, dengan case yang sudah terbentuk
+    expansions = 0
+    # Setiap entri: (indeks karakter berikutnya, kandidat sejauh ini, kandidat dalam lowercase)
+    stack = [(0, "", "")]
+    while stack:
+        expansions += 1
+        if max_expansions is not None and expansions > max_expansions:
+            break
+        index, path, lowered = stack.pop()
         if index == len(core_word):
-            candidate = ''.join(path)
             # Lakukan pemeriksaan case-insensitive terhadap common_words
-            if candidate.lower() in common_words:
-                results.add(candidate)
-            return
+            if path.lower() in common_words:
+                results.add(path)
+            continue
 
         char = core_word[index]
-        # Periksa apakah karakter saat ini adalah kunci di LEET_MAP (pencarian kunci peka kasus)
-        if char in LEET_MAP:
-            for sub in LEET_MAP[char]:
-                # Gunakan substitusi dari LEET_MAP persis seperti adanya (termasuk case-nya)
-                path.append(sub)
-                backtrack(index + 1, path)
-                path.pop()
-        else:
-            # Jika bukan kunci LEET_MAP, pertahankan karakter aslinya (dengan case aslinya)
-            path.append(char)
-            backtrack(index + 1, path)
-            path.pop()
-
-    backtrack(0, [])
+        # Gunakan substitusi dari LEET_MAP persis seperti adanya (termasuk case-nya);
+        # karakter yang bukan kunci LEET_MAP dipertahankan dengan case aslinya
+        for sub in LEET_MAP.get(char, (char,)):
+            next_lowered = lowered + sub.lower()
+            if prefixes is not None and next_lowered not in prefixes:
+                continue
+            stack.append((index + 1, path + sub, next_lowered))
 
     if not results:
         return word
@@ -0,0 +1,264 @@
+import collections
+import collections.abc
+
+from rapidfuzz.distance import DamerauLevenshtein
+
+from .functions import is_abbreviation
+
+
+def _mask_from_ranks(ranks, size):
+    """
+    Membentuk bitmask (int Python) dari daftar peringkat kata.
+    Bit ke-i menyala jika kata ke-i (urutan korpus) termasuk dalam daftar.
+    """
+    bits = bytearray((size + 7) // 8)
+    for rank in ranks:
+        bits[rank >> 3] |= 1 << (rank & 7)
+    return int.from_bytes(bytes(bits), "little")
+
+
+def word_prefixes(words):
+    """
+    Set semua prefiks tidak kosong dari setiap kata (termasuk kata itu sendiri),
+    dipakai `normalize_leet` untuk memangkas kandidat yang tidak mungkin menjadi kata korpus.
+    """
+    return frozenset(word[:i] for word in words for i in range(1, len(word) + 1))
+
+
+def as_word_sequence(words):
+    """
+    Kata korpus sebagai Sequence yang tidak bisa diubah. Sequence immutable (tuple, atau
+    kata yang dibaca langsung dari snapshot yang di-mmap) dipakai apa adanya tanpa disalin.
+    """
+    if isinstance(words, collections.abc.Sequence) and not isinstance(words, (str, collections.abc.MutableSequence)):
+        return words
+    return tuple(words)
+
+
+def _query_keys(word):
+    """Kunci (karakter, jumlah minimum) untuk setiap karakter `word`, termasuk pengulangannya."""
+    return [(char, k) for char, count in collections.Counter(word).items() for k in range(1, count + 1)]
+
+
+class WordMasks:
+    """
+    Bitmask kata korpus, dipakai bersama oleh `AbbreviationIndex` dan `TypoIndex`.
+
+    Setiap kata korpus diberi satu bit sesuai urutannya di korpus. Disimpan bitmask per
+    panjang kata (kumulatif) dan per (karakter, jumlah minimum kemunculan), sehingga
+    himpunan kandidat cukup didapat dengan operasi AND/OR.
+    """
+
+    def __init__(self, words):
+        words = list(words)
+        size = len(words)
+
+        ranks_by_length = collections.defaultdict(list)
+        ranks_by_char = collections.defaultdict(list)
+        for rank, word in enumerate(words):
+            ranks_by_length[len(word)].append(rank)
+            for char, count in collections.Counter(word).items():
+                for k in range(1, count + 1):
+                    ranks_by_char[(char, k)].append(rank)
+
+        # _length_upto[L] = bitmask kata dengan panjang <= L
+        max_length = max(ranks_by_length, default=0)
+        length_upto = []
+        cumulative = 0
+        for length in range(max_length + 1):
+            if length in ranks_by_length:
+                cumulative |= _mask_from_ranks(ranks_by_length[length], size)
+            length_upto.append(cumulative)
+
+        self._set_state(length_upto, {key: _mask_from_ranks(ranks, size) for key, ranks in ranks_by_char.items()})
+
+    def _set_state(self, length_upto, char_masks):
+        self._length_upto = length_upto
+        self._max_length = len(length_upto) - 1
+        self._char_masks = char_masks
+
+    def state(self):
+        """
+        Bitmask dalam bentuk yang bisa diserialisasi (lihat `snapshot`):
+        (list bitmask panjang kumulatif, dict (karakter, jumlah) -> bitmask).
+        """
+        return list(self._length_upto), dict(self._char_masks)
+
+    @classmethod
+    def from_state(cls, length_upto, char_masks):
+        """
+        Membuat bitmask dari hasil `state` tanpa membangun ulang. `length_upto` boleh berupa
+        Sequence dan `char_masks` Mapping apa pun (misalnya view atas snapshot yang di-mmap);
+        keduanya dipakai tanpa disalin.
+        """
+        masks = cls.__new__(cls)
+        masks._set_state(length_upto, char_masks)
+        return masks
+
+    def length_mask(self, low, high):
+        """Bitmask kata dengan panjang di rentang [low, high]."""
+        high = min(high, self._max_length)
+        if low > high:
+            return 0
+        mask = self._length_upto[high]
+        if low > 0:
+            mask &= ~self._length_upto[low - 1]
+        return mask
+
+    def char_mask(self, key):
+        """Bitmask kata yang memuat karakter `key[0]` paling sedikit `key[1]` kali."""
+        return self._char_masks.get(key, 0)
+
+
+class AbbreviationIndex:
+    """
+    Indeks untuk mencari ekspansi singkatan tanpa memindai seluruh korpus.
+
+    Kandidat untuk sebuah singkatan didapat dengan operasi AND atas bitmask panjang dan
+    (karakter, jumlah) dari `WordMasks`. Kandidat lalu diverifikasi dengan
+    `is_abbreviation` dari bit terendah (urutan korpus), jadi hasilnya sama persis
+    dengan pemindaian linear.
+    """
+
+    def __init__(self, words, masks=None):
+        self._words = as_word_sequence(words)
+        self.masks = masks if masks is not None else WordMasks(self._words)
+
+    def __len__(self):
+        return len(self._words)
+
+    def state(self):
+        """Bitmask indeks dalam bentuk yang bisa diserialisasi (lihat `WordMasks.state`)."""
+        return self.masks.state()
+
+    @classmethod
+    def from_state(cls, words, length_upto, char_masks):
+        """Membuat indeks dari bitmask yang sudah dihitung sebelumnya, tanpa membangun ulang."""
+        return cls(words, WordMasks.from_state(length_upto, char_masks))
+
+    def lookup(self, abbr, max_rank=None):
+        """
+        Mencari kata pertama (urutan korpus) yang cocok sebagai ekspansi `abbr`
+        menurut `is_abbreviation`.
+
+        Args:
+            abbr (str): Singkatan yang dicari.
+            max_rank (int): Hanya periksa `max_rank` kata pertama korpus (kata paling sering).
+                None = seluruh korpus.
+
+        Returns:
+            tuple: (kata yang cocok atau None, jumlah kandidat yang diperiksa).
+        """
+        n = len(abbr)
+        if n == 0:
+            return None, 0
+
+        # is_abbreviation mensyaratkan len(abbr) >= (len(word) + 1) // 2,
+        # dan abbr harus subsequence dari word sehingga len(word) >= len(abbr).
+        mask = self.masks.length_mask(n, 2 * n)
+        if max_rank is not None:
+            mask &= (1 << max(max_rank, 0)) - 1
+        for char, count in collections.Counter(abbr).items():
+            if not mask:
+                break
+            mask &= self.masks.char_mask((char, count))
+
+        checked = 0
+        while mask:
+            lowest = mask & -mask
+            mask ^= lowest
+            word = self._words[lowest.bit_length() - 1]
+            checked += 1
+            if is_abbreviation(abbr, word):
+                return word, checked
+        return None, checked
+
+
+class TypoIndex:
+    """
+    Indeks kandidat untuk koreksi typo (lihat `is_typo`).
+
+    Jarak Damerau-Levenshtein tidak pernah lebih kecil dari selisih multiset karakter
+    kedua kata: sisip dan hapus mengubah satu karakter, substitusi satu karakter di tiap
+    sisi, dan transposisi tidak mengubah multiset. Jadi kata korpus hanya perlu dicek jika
+    panjangnya berselisih <= `max_distance` dan, dihitung dengan bitmask (karakter, jumlah)
+    dari `WordMasks`, karakter yang tidak dimiliki bersama di tiap sisi paling banyak
+    `max_distance`. Kandidat yang tersisa diverifikasi dari bit terendah (urutan korpus)
+    dan pencarian berhenti pada kecocokan pertama, sama seperti pemindaian linear.
+    """
+
+    def __init__(self, words, max_distance=2, masks=None):
+        self._words = as_word_sequence(words)
+        self._max_distance = max_distance
+        self.masks = masks if masks is not None else WordMasks(self._words)
+
+    def state(self):
+        """Parameter indeks yang perlu diserialisasi selain bitmask (lihat `snapshot`): max_distance."""
+        return self._max_distance
+
+    @classmethod
+    def from_state(cls, words, max_distance, masks):
+        """Membuat indeks dari bitmask `WordMasks` yang sudah ada."""
+        return cls(words, max_distance, masks)
+
+    def _candidate_mask(self, word, max_rank):
+        masks = self.masks
+        n = len(word)
+        d = self._max_distance
+        window = masks.length_mask(max(n - d, 0), n + d)
+        if max_rank is not None:
+            window &= (1 << max(max_rank, 0)) - 1
+        if not window:
+            return 0
+
+        # missing[j] = kata yang tidak memuat paling sedikit j + 1 kunci karakter `word`
+        missing = [0] * (d + 1)
+        for key in _query_keys(word):
+            absent = window & ~masks.char_mask(key)
+            if absent:
+                for j in range(d, 0, -1):
+                    missing[j] |= missing[j - 1] & absent
+                missing[0] |= absent
+
+        # Kata sepanjang n + e memiliki e karakter lebih, jadi hanya boleh kehilangan d - e kunci
+        mask = masks.length_mask(max(n - d, 0), n) & ~missing[d]
+        for extra in range(1, d + 1):
+            mask |= masks.length_mask(n + extra, n + extra) & ~missing[d - extra]
+        return mask & window
+
+    def candidates(self, word, max_rank=None):
+        """
+        Daftar kandidat (urutan korpus) yang mungkin berjarak <= max_distance dari `word`,
+        hanya dari `max_rank` kata pertama korpus jika diisi.
+        """
+        mask = self._candidate_mask(word, max_rank)
+        candidates = []
+        while mask:
+            lowest = mask & -mask
+            mask ^= lowest
+            candidates.append(self._words[lowest.bit_length() - 1])
+        return candidates
+
+    def lookup(self, word, max_rank=None):
+        """
+        Mencari kata pertama (urutan korpus) dengan jarak Damerau-Levenshtein
+        1 sampai `max_distance` dari `word`, sama seperti `is_typo`.
+
+        Args:
+            word (str): Kata yang dicari koreksinya.
+            max_rank (int): Hanya periksa `max_rank` kata pertama korpus (kata paling sering).
+                None = seluruh korpus.
+
+        Returns:
+            tuple: (kata yang cocok atau None, jumlah kandidat yang diperiksa).
+        """
+        mask = self._candidate_mask(word, max_rank)
+        checked = 0
+        while mask:
+            lowest = mask & -mask
+            mask ^= lowest
+            target = self._words[lowest.bit_length() - 1]
+            checked += 1
+            if 1 <= DamerauLevenshtein.distance(word, target, score_cutoff=self._max_distance) <= self._max_distance:
+                return target, checked
+        return None, checked
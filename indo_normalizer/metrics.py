@@ -0,0 +1,90 @@
+import threading
+
+# Tahap pipeline yang diukur, sesuai urutan eksekusinya di Normalizer
+STAGES = (
+    'tokenize',
+    'repetitions',
+    'leet',
+    'forced_leet',
+    'retokenize',
+    'abbreviation',
+    'slang',
+    'typo',
+)
+
+# Tahap yang memindai korpus; jumlah kata korpus yang dibandingkan ikut dicatat
+SCAN_STAGES = ('abbreviation', 'typo')
+
+
+class StageMetrics:
+    """
+    Waktu (wall time) dan jumlah pemanggilan setiap tahap pipeline normalisasi,
+    serta jumlah perbandingan terhadap korpus untuk tahap singkatan dan typo.
+
+    Satu objek dipakai untuk satu panggilan `normalize_text`/`normalize_many`
+    (tanpa lock), lalu digabungkan ke agregat milik Normalizer lewat `merge`.
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self.texts = 0
+        self.calls = dict.fromkeys(STAGES, 0)
+        self.seconds = dict.fromkeys(STAGES, 0.0)
+        self.comparisons = dict.fromkeys(SCAN_STAGES, 0)
+
+    def __getstate__(self):
+        # Lock tidak bisa di-pickle; salinan (misalnya untuk worker proses) dimulai kosong
+        return {}
+
+    def __setstate__(self, state):
+        self.__init__()
+
+    @classmethod
+    def from_dict(cls, data):
+        """Kebalikan `as_dict`, misalnya untuk metrik yang dikirim dari proses worker."""
+        metrics = cls()
+        metrics.texts = data['texts']
+        for stage, values in data['stages'].items():
+            metrics.calls[stage] = values['calls']
+            metrics.seconds[stage] = values['seconds']
+            if stage in metrics.comparisons:
+                metrics.comparisons[stage] = values.get('comparisons', 0)
+        return metrics
+
+    def record(self, stage, seconds, comparisons=0):
+        """Mencatat satu pemanggilan `stage` yang memakan `seconds` detik."""
+        self.calls[stage] += 1
+        self.seconds[stage] += seconds
+        if comparisons:
+            self.comparisons[stage] += comparisons
+
+    def merge(self, other):
+        """Menambahkan isi `other` ke objek ini (aman dipanggil dari beberapa thread)."""
+        with self._lock:
+            self.texts += other.texts
+            for stage in STAGES:
+                self.calls[stage] += other.calls[stage]
+                self.seconds[stage] += other.seconds[stage]
+            for stage in SCAN_STAGES:
+                self.comparisons[stage] += other.comparisons[stage]
+
+    def reset(self):
+        """Mengosongkan semua catatan."""
+        with self._lock:
+            self.texts = 0
+            self.calls = dict.fromkeys(STAGES, 0)
+            self.seconds = dict.fromkeys(STAGES, 0.0)
+            self.comparisons = dict.fromkeys(SCAN_STAGES, 0)
+
+    def as_dict(self) -> dict:
+        """
+        Catatan dalam bentuk dict biasa, siap diekspor ke sistem metrik:
+        {'texts': n, 'stages': {tahap: {'calls', 'seconds'[, 'comparisons']}}}.
+        """
+        with self._lock:
+            stages = {}
+            for stage in STAGES:
+                stages[stage] = {'calls': self.calls[stage], 'seconds': self.seconds[stage]}
+                if stage in self.comparisons:
+                    stages[stage]['comparisons'] = self.comparisons[stage]
+            return {'texts': self.texts, 'stages': stages}
@@ -0,0 +1,208 @@
+import contextlib
+import multiprocessing
+import os
+import queue
+import sys
+import threading
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+
+from .metrics import StageMetrics
+from .streaming import _DONE, _Failure, iter_batches
+
+# Normalizer milik proses worker, diisi sekali oleh _init_worker
+_worker_normalizer = None
+
+
+class WorkerError(RuntimeError):
+    """Dilempar ketika proses worker mati sebelum menyelesaikan chunk-nya."""
+
+
+def _init_worker(normalizer):
+    """
+    Initializer untuk setiap proses worker. Dengan start method 'fork', registry korpus
+    yang sudah dimuat terwarisi (copy-on-write) dari proses induk; dengan 'spawn'/'forkserver',
+    korpus dimuat sekali di sini (lewat registry) untuk seumur hidup worker.
+    Pesan pemuatan korpus dari worker ditulis ke stderr agar tidak tercampur dengan
+    output proses induk di stdout.
+    """
+    global _worker_normalizer
+    with contextlib.redirect_stdout(sys.stderr):
+        normalizer._ensure_corpus()
+    # Callback metrik hanya berlaku di proses induk (dengan 'fork' objeknya ikut terwarisi)
+    normalizer.metrics_callback = None
+    _worker_normalizer = normalizer
+
+
+def _normalize_chunk(texts, stages):
+    return _worker_normalizer.normalize_many(texts, stages=stages)
+
+
+def _normalize_batch(texts, stages):
+    """
+    Menormalisasi satu micro-batch di worker `WorkerPool`. Selain hasilnya, mengembalikan
+    metrik batch ini dan statistik cache/penyimpanan worker agar bisa dilaporkan proses induk.
+    """
+    normalizer = _worker_normalizer
+    normalizer.last_metrics = None
+    results = normalizer.normalize_many(texts, stages=stages)
+    return results, normalizer.last_metrics, (os.getpid(), normalizer.cache_stats(), normalizer.store_stats())
+
+
+def _sum_stats(stats, shared=()):
+    """Menjumlahkan dict statistik beberapa worker; kunci di `shared` diambil nilai terbesarnya."""
+    stats = [item for item in stats if item is not None]
+    if not stats:
+        return None
+    return {key: (max if key in shared else sum)(item[key] for item in stats) for key in stats[0]}
+
+
+class WorkerPool(ProcessPoolExecutor):
+    """
+    Process pool yang setiap workernya memegang satu salinan `normalizer`, dibuat sekali
+    per proses (lihat `_init_worker`), sehingga cache token, penyimpanan token, dan korpus
+    tetap hidup di worker antar batch alih-alih Normalizer di-pickle ulang untuk setiap batch.
+    Dipakai oleh `aio.AsyncBatcher`, server normalisasi, dan API kolom (`columnar`).
+
+    Metrik tahap dari worker digabungkan ke `normalizer` di proses induk (lihat
+    `Normalizer.stage_metrics`); statistik cache dan penyimpanan tiap worker dijumlahkan
+    oleh `worker_stats`.
+
+    Args:
+        normalizer (Normalizer): Normalizer yang disalin ke setiap worker.
+        max_workers (int): Jumlah proses worker.
+        start_method (str): 'fork', 'spawn', atau 'forkserver'. None = default platform.
+    """
+
+    def __init__(self, normalizer, max_workers, start_method=None):
+        context = multiprocessing.get_context(start_method)
+        if context.get_start_method() == "fork":
+            # Muat korpus di proses induk sebelum worker dibuat agar semua worker mewarisinya
+            # (copy-on-write) alih-alih masing-masing memuat file korpus sendiri
+            with contextlib.redirect_stdout(sys.stderr):
+                normalizer._ensure_corpus()
+        super().__init__(max_workers=max_workers, mp_context=context,
+                         initializer=_init_worker, initargs=(normalizer,))
+        self.normalizer = normalizer
+        self._stats_lock = threading.Lock()
+        self._worker_stats = {}
+
+    def collect(self, payload):
+        """Memproses hasil `_normalize_batch` di proses induk dan mengembalikan hasil normalisasinya."""
+        results, metrics, (pid, cache, store) = payload
+        if metrics is not None and self.normalizer._metrics is not None:
+            self.normalizer._publish_metrics(StageMetrics.from_dict(metrics))
+        with self._stats_lock:
+            self._worker_stats[pid] = (cache, store)
+        return results
+
+    def normalize_many(self, texts, chunksize=256, stages=None) -> list:
+        """
+        Menormalisasi `texts` di worker pool ini per chunk berukuran `chunksize` dan
+        mengembalikan list (teks yang dinormalisasi, counts) sesuai urutan input.
+
+        Raises:
+            WorkerError: Jika proses worker mati (misalnya kehabisan memori atau dibunuh OS).
+        """
+        if chunksize < 1:
+            raise ValueError("chunksize must be >= 1")
+        try:
+            futures = [self.submit(_normalize_batch, chunk, stages) for chunk in iter_batches(texts, chunksize)]
+            return [result for future in futures for result in self.collect(future.result())]
+        except BrokenProcessPool as e:
+            raise WorkerError(f"A normalizer worker process terminated abruptly: {e}") from e
+
+    def worker_stats(self) -> tuple:
+        """
+        (statistik cache, statistik penyimpanan) dijumlahkan dari semua worker, per batch
+        terakhir setiap worker; masing-masing None jika tidak diaktifkan.
+        """
+        with self._stats_lock:
+            stats = list(self._worker_stats.values())
+        return (_sum_stats(cache for cache, _ in stats),
+                _sum_stats((store for _, store in stats), shared=('size',)))
+
+
+def iter_normalize_parallel(normalizer, texts, workers, chunksize=256, start_method=None, stages=None):
+    """
+    Menormalisasi `texts` secara paralel di process pool dan menghasilkan
+    (teks yang dinormalisasi, counts) satu per satu sesuai urutan input.
+
+    Input dibaca per chunk sehingga paling banyak `2 * workers` chunk yang
+    menunggu di pool; iterable panjang tidak pernah dimuat seluruhnya ke memori.
+
+    Args:
+        normalizer (Normalizer): Normalizer yang akan dipakai setiap worker.
+        texts (iterable of str): Teks input.
+        workers (int): Jumlah proses worker.
+        chunksize (int): Jumlah teks per chunk yang dikirim ke worker.
+        start_method (str): 'fork', 'spawn', atau 'forkserver'. None = default platform.
+        stages (iterable of str): Tahap yang dijalankan. None = `normalizer.stages`.
+
+    Raises:
+        WorkerError: Jika proses worker mati (misalnya kehabisan memori atau dibunuh OS).
+    """
+    if chunksize < 1:
+        raise ValueError("chunksize must be >= 1")
+    return iter_normalize_batches(normalizer, iter_batches(texts, chunksize), workers, start_method, stages)
+
+
+def iter_normalize_batches(normalizer, batches, workers, start_method=None, stages=None):
+    """
+    Seperti `iter_normalize_parallel`, tetapi input sudah berupa batch (list teks) yang
+    masing-masing dikirim ke worker apa adanya, misalnya micro-batch dari
+    `streaming.iter_micro_batches`.
+
+    Batch dibaca dan dikirim ke pool oleh thread latar belakang, dengan paling banyak
+    `2 * workers` batch yang menunggu. Hasil batch terdepan dihasilkan begitu batch itu
+    selesai, walaupun sumber input sedang menunggu data berikutnya.
+
+    Raises:
+        WorkerError: Jika proses worker mati (misalnya kehabisan memori atau dibunuh OS).
+    """
+    if workers < 1:
+        raise ValueError("workers must be >= 1")
+
+    executor = WorkerPool(normalizer, workers, start_method)
+    futures = queue.Queue(maxsize=2 * workers)
+    stop = threading.Event()
+
+    def put(item):
+        # put dengan timeout agar thread berhenti jika generator ditutup lebih awal
+        while not stop.is_set():
+            try:
+                futures.put(item, timeout=0.1)
+                return True
+            except queue.Full:
+                continue
+        return False
+
+    def submit():
+        try:
+            for batch in batches:
+                if stop.is_set():
+                    return
+                future = executor.submit(_normalize_chunk, batch, stages)
+                if not put(future):
+                    future.cancel()
+                    return
+            put(_DONE)
+        except BaseException as e:
+            put(_Failure(e))
+
+    submitter = threading.Thread(target=submit, name="indo-normalizer-submit", daemon=True)
+    submitter.start()
+    try:
+        while True:
+            item = futures.get()
+            if item is _DONE:
+                return
+            if isinstance(item, _Failure):
+                raise item.error
+            yield from item.result()
+    except BrokenProcessPool as e:
+        raise WorkerError(f"A normalizer worker process terminated abruptly: {e}") from e
+    finally:
+        stop.set()
+        # Batalkan batch yang belum berjalan jika terjadi error atau generator ditutup lebih awal
+        executor.shutdown(wait=True, cancel_futures=True)
@@ -0,0 +1,318 @@
+import argparse
+import asyncio
+import collections
+import contextlib
+import json
+import os
+import socketserver
+import sys
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+from .Normalizer import Normalizer
+from .aio import AsyncBatcher, QueueFullError
+from .parallel import WorkerPool
+from .stages import select_stages
+
+# Jumlah latensi terakhir yang dipakai untuk menghitung persentil di /stats
+_LATENCY_WINDOW = 10_000
+
+
+class NormalizationService:
+    """
+    Inti server normalisasi: satu Normalizer (korpus dimuat sekali) dan satu event loop
+    di thread latar belakang yang menggabungkan permintaan dari semua thread handler
+    menjadi micro-batch (lihat `aio.AsyncBatcher`). Satu batcher dibuat per pilihan tahap.
+
+    Args:
+        normalizer (Normalizer): Normalizer yang dipakai.
+        executor (concurrent.futures.Executor): Tempat `normalize_many` dijalankan: thread pool
+            atau `parallel.WorkerPool` untuk `normalizer`. None = default executor event loop.
+        max_batch_size, max_wait, max_queue, concurrency: Lihat `aio.AsyncBatcher`.
+    """
+
+    def __init__(self, normalizer, executor=None, max_batch_size=64, max_wait=0.002, max_queue=1024, concurrency=1):
+        self.normalizer = normalizer
+        self.executor = executor
+        self._batcher_options = dict(max_batch_size=max_batch_size, max_wait=max_wait,
+                                     max_queue=max_queue, concurrency=concurrency)
+        self._batchers = {}
+        self._lock = threading.Lock()
+        self._loop = asyncio.new_event_loop()
+        self._thread = threading.Thread(target=self._loop.run_forever, name="indo-normalizer-serve", daemon=True)
+        self._thread.start()
+
+        self.started = time.time()
+        self.requests = 0
+        self.texts = 0
+        self.rejected = 0
+        self.errors = 0
+        self._latencies = collections.deque(maxlen=_LATENCY_WINDOW)
+
+    def _batcher(self, stages):
+        batcher = self._batchers.get(stages)
+        if batcher is None:
+            with self._lock:
+                batcher = self._batchers.get(stages)
+                if batcher is None:
+                    batcher = self._batchers[stages] = AsyncBatcher(
+                        self.normalizer, self.executor, stages=stages, **self._batcher_options
+                    )
+        return batcher
+
+    def normalize(self, texts, stages=None):
+        """
+        Menormalisasi `texts` lewat micro-batch dan menunggu hasilnya (dipanggil dari thread handler).
+
+        Raises:
+            aio.QueueFullError: Jika antrean batch sudah penuh.
+        """
+        stages = select_stages(stages) if stages is not None else None
+        start = time.perf_counter()
+        try:
+            future = asyncio.run_coroutine_threadsafe(self._batcher(stages).submit(texts), self._loop)
+            results = future.result()
+        except QueueFullError:
+            with self._lock:
+                self.rejected += 1
+            raise
+        except Exception:
+            with self._lock:
+                self.errors += 1
+            raise
+        elapsed = time.perf_counter() - start
+        with self._lock:
+            self.requests += 1
+            self.texts += len(texts)
+            self._latencies.append(elapsed)
+        return results
+
+    def stats(self) -> dict:
+        """
+        Throughput, latensi (ms, dari permintaan terakhir), antrean, serta statistik cache,
+        penyimpanan token, dan tahap. Dengan `WorkerPool`, statistik cache dan penyimpanan
+        dijumlahkan dari semua worker, dan metrik tahap worker sudah digabung ke `normalizer`.
+        """
+        with self._lock:
+            latencies = sorted(self._latencies)
+            uptime = time.time() - self.started
+            stats = {
+                'uptime_s': uptime,
+                'requests': self.requests,
+                'texts': self.texts,
+                'rejected': self.rejected,
+                'errors': self.errors,
+                'texts_per_s': self.texts / uptime if uptime else 0.0,
+                'queue': sum(len(batcher) for batcher in self._batchers.values()),
+            }
+
+        def percentile(fraction):
+            if not latencies:
+                return 0.0
+            return latencies[min(len(latencies) - 1, int(round(fraction * (len(latencies) - 1))))] * 1000
+
+        stats['latency_ms'] = {'p50': percentile(0.50), 'p99': percentile(0.99), 'max': percentile(1.0)}
+        if isinstance(self.executor, WorkerPool):
+            stats['cache'], stats['store'] = self.executor.worker_stats()
+        else:
+            stats['cache'] = self.normalizer.cache_stats()
+            stats['store'] = self.normalizer.store_stats()
+        stats['stages'] = self.normalizer.stage_metrics()
+        return stats
+
+    def close(self):
+        """Menghentikan dispatcher batch dan event loop-nya."""
+        async def cancel_tasks():
+            tasks = [task for task in asyncio.all_tasks() if task is not asyncio.current_task()]
+            for task in tasks:
+                task.cancel()
+            await asyncio.gather(*tasks, return_exceptions=True)
+
+        asyncio.run_coroutine_threadsafe(cancel_tasks(), self._loop).result()
+        self._loop.call_soon_threadsafe(self._loop.stop)
+        self._thread.join()
+        self._loop.close()
+
+
+class _Handler(BaseHTTPRequestHandler):
+    """
+    POST /normalize  {"text": str} atau {"texts": [str, ...]}, opsional "stages": str atau [str, ...]
+    GET  /stats      statistik layanan (lihat `NormalizationService.stats`)
+    GET  /health     {"status": "ok"}
+    """
+
+    protocol_version = "HTTP/1.1"
+    server_version = "indo-normalizer"
+
+    def address_string(self):
+        # Klien Unix socket tidak punya alamat (host, port)
+        return self.client_address[0] if isinstance(self.client_address, tuple) else "unix"
+
+    def log_message(self, format, *args):
+        if self.server.verbose:
+            super().log_message(format, *args)
+
+    def _send(self, status, body):
+        data = json.dumps(body, ensure_ascii=False).encode("utf-8")
+        self.send_response(status)
+        self.send_header("Content-Type", "application/json; charset=utf-8")
+        self.send_header("Content-Length", str(len(data)))
+        self.end_headers()
+        self.wfile.write(data)
+
+    def do_GET(self):
+        if self.path == "/health":
+            self._send(200, {"status": "ok"})
+        elif self.path == "/stats":
+            self._send(200, self.server.service.stats())
+        else:
+            self._send(404, {"error": f"unknown path {self.path!r}"})
+
+    def do_POST(self):
+        try:
+            length = int(self.headers.get("Content-Length") or 0)
+            if length < 0:
+                raise ValueError
+        except ValueError:
+            # Tanpa panjang yang valid, sisa body tidak bisa dipisahkan dari permintaan berikutnya
+            self.close_connection = True
+            self._send(400, {"error": "invalid Content-Length header"})
+            return
+        body = self.rfile.read(length)
+        if self.path != "/normalize":
+            self._send(404, {"error": f"unknown path {self.path!r}"})
+            return
+        try:
+            texts, stages, single = _parse_request(body)
+        except ValueError as e:
+            self._send(400, {"error": str(e)})
+            return
+        try:
+            results = self.server.service.normalize(texts, stages) if texts else []
+        except QueueFullError as e:
+            self._send(503, {"error": str(e)})
+            return
+        except Exception as e:
+            self._send(500, {"error": f"{type(e).__name__}: {e}"})
+            return
+
+        results = [{"normalized_text": text, "counts": dict(counts)} for text, counts in results]
+        self._send(200, results[0] if single else {"results": results})
+
+
+def _parse_request(body):
+    """
+    Memvalidasi body POST /normalize dan mengembalikan (list teks, stages, True jika "text").
+    Semua input yang tidak valid menghasilkan ValueError (HTTP 400), sebelum normalisasi dimulai.
+    """
+    request = json.loads(body or b"null")
+    if not isinstance(request, dict) or ("text" in request) == ("texts" in request):
+        raise ValueError('expected a JSON object with either "text" or "texts"')
+    single = "text" in request
+    if single and not isinstance(request["text"], str):
+        raise ValueError('"text" must be a string')
+    texts = [request["text"]] if single else request["texts"]
+    if not isinstance(texts, list) or not all(isinstance(text, str) for text in texts):
+        raise ValueError('"texts" must be a list of strings')
+    stages = request.get("stages")
+    if stages is not None:
+        # Satu nama tahap boleh dikirim sebagai string, seperti di `Normalizer.normalize_text`
+        if not isinstance(stages, (str, list)) or not all(isinstance(stage, str) for stage in stages):
+            raise ValueError('"stages" must be a stage name or a list of stage names')
+        stages = select_stages(stages)
+    return texts, stages, single
+
+
+class NormalizationServer(ThreadingHTTPServer):
+    """Server HTTP (TCP) untuk `NormalizationService`; satu thread per koneksi."""
+
+    daemon_threads = True
+
+    def __init__(self, address, service, verbose=False):
+        self.service = service
+        self.verbose = verbose
+        super().__init__(address, _Handler)
+
+
+class UnixNormalizationServer(socketserver.ThreadingMixIn, socketserver.UnixStreamServer):
+    """Server HTTP lewat Unix domain socket untuk `NormalizationService`."""
+
+    daemon_threads = True
+
+    def __init__(self, path, service, verbose=False):
+        self.service = service
+        self.verbose = verbose
+        with contextlib.suppress(FileNotFoundError):
+            os.unlink(path)
+        super().__init__(path, _Handler)
+
+    def server_close(self):
+        super().server_close()
+        with contextlib.suppress(FileNotFoundError):
+            os.unlink(self.server_address)
+
+
+def build_parser():
+    parser = argparse.ArgumentParser(
+        prog="python -m indo_normalizer.serve",
+        description="Serve Indonesian text normalization over HTTP with request micro-batching.",
+    )
+    parser.add_argument("--host", default="127.0.0.1", help="address to listen on (default: 127.0.0.1)")
+    parser.add_argument("--port", type=int, default=8080, help="TCP port (default: 8080)")
+    parser.add_argument("--unix", metavar="PATH", help="listen on this Unix domain socket instead of TCP")
+    parser.add_argument("-w", "--workers", type=int, default=1,
+                        help="worker processes for normalization (default: 1, run in threads)")
+    parser.add_argument("--max-batch-size", type=int, default=64, help="texts per micro-batch (default: 64)")
+    parser.add_argument("--max-wait", type=float, default=0.002,
+                        help="seconds to wait for a micro-batch to fill (default: 0.002)")
+    parser.add_argument("--max-queue", type=int, default=1024,
+                        help="pending requests before answering 503 (default: 1024)")
+    parser.add_argument("--cache-size", type=int, help="enable a token cache with this many entries")
+    parser.add_argument("--store", metavar="PATH", help="persistent SQLite token store")
+    parser.add_argument("--max-rank", type=int,
+                        help="only search the N most frequent corpus words for abbreviations and typos")
+    parser.add_argument("--instrument", action="store_true", help="include per-stage timings in /stats")
+    parser.add_argument("-v", "--verbose", action="store_true", help="log every request to stderr")
+    return parser
+
+
+def main(argv=None):
+    parser = build_parser()
+    args = parser.parse_args(argv)
+    if args.workers < 1:
+        parser.error("--workers must be >= 1")
+
+    normalizer = Normalizer(cache_size=args.cache_size, max_rank=args.max_rank, store=args.store,
+                            instrument=args.instrument)
+    if args.workers > 1:
+        # Setiap worker mendapat salinan Normalizer sekali per proses, termasuk cache dan penyimpanannya
+        executor = WorkerPool(normalizer, args.workers)
+    else:
+        executor = None
+        # Korpus dimuat sebelum permintaan pertama agar permintaan itu tidak menanggung waktu muat
+        with contextlib.redirect_stdout(sys.stderr):
+            normalizer._ensure_corpus()
+    service = NormalizationService(normalizer, executor, args.max_batch_size, args.max_wait, args.max_queue,
+                                   concurrency=args.workers)
+    if args.unix:
+        server = UnixNormalizationServer(args.unix, service, args.verbose)
+        where = args.unix
+    else:
+        server = NormalizationServer((args.host, args.port), service, args.verbose)
+        where = "http://%s:%d" % server.server_address[:2]
+    print(f"indo-normalizer serving on {where}", file=sys.stderr)
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        server.server_close()
+        service.close()
+        if executor is not None:
+            executor.shutdown()
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,398 @@
+import argparse
+import array
+import collections.abc
+import hashlib
+import json
+import mmap
+import os
+import struct
+import sys
+
+from .corpora import read_common_words, read_slang_map
+from .indexes import AbbreviationIndex, TypoIndex, WordMasks, word_prefixes
+
+# Format file snapshot:
+#   header  : MAGIC (8 byte) | FORMAT_VERSION (uint32) | panjang metadata (uint32)
+#   metadata: JSON (sumber + offset setiap section, relatif terhadap awal data, SHA-256 data)
+#   data    : section biner, masing-masing rata 8 byte (kata UTF-8 + offset uint32, peta slang,
+#             bitmask kata untuk indeks singkatan dan typo, prefiks kata untuk normalisasi leet)
+MAGIC = b"INDONORM"
+FORMAT_VERSION = 5
+_HEADER = struct.Struct("<8sII")
+_ALIGN = 8
+
+SNAPSHOT_FILENAME = "corpus.snapshot"
+
+
+class SnapshotError(Exception):
+    """Dilempar ketika file snapshot rusak atau formatnya tidak dikenali."""
+
+
+def file_digest(path):
+    """SHA-256 isi file, dipakai untuk mendeteksi snapshot yang basi."""
+    with open(path, "rb") as f:
+        return hashlib.sha256(f.read()).hexdigest()
+
+
+class MappedWords(collections.abc.Sequence):
+    """
+    Kata korpus (urutan korpus) yang dibaca langsung dari halaman snapshot yang di-mmap:
+    teks UTF-8 dan offset uint32 tidak disalin ke memori proses, sehingga dipakai bersama
+    lewat page cache OS oleh semua proses di host yang sama. Setiap akses mendekode satu kata.
+    """
+
+    __slots__ = ('_data', '_offsets')
+
+    def __init__(self, data, offsets):
+        self._data = data
+        self._offsets = offsets
+
+    def __len__(self):
+        return len(self._offsets) - 1
+
+    def __getitem__(self, index):
+        if isinstance(index, slice):
+            return [self[i] for i in range(*index.indices(len(self)))]
+        if index < 0:
+            index += len(self)
+        if not 0 <= index < len(self):
+            raise IndexError("word index out of range")
+        return str(self._data[self._offsets[index]:self._offsets[index + 1]], "utf-8")
+
+    def __reduce__(self):
+        # Salinan di proses lain tidak punya mmap ini
+        return tuple, (tuple(self),)
+
+
+class MappedMasks(collections.abc.Sequence):
+    """
+    Deretan bitmask berukuran tetap di snapshot yang di-mmap. Setiap akses membentuk int
+    sementara dari halaman yang dipakai bersama; tidak ada salinan permanen per proses.
+    """
+
+    __slots__ = ('_view', '_size', '_count')
+
+    def __init__(self, view, size, count):
+        if len(view) != size * count:
+            raise SnapshotError(f"mask section has {len(view)} bytes, expected {size * count}")
+        self._view = view
+        self._size = size
+        self._count = count
+
+    def __len__(self):
+        return self._count
+
+    def __getitem__(self, index):
+        if isinstance(index, slice):
+            return [self[i] for i in range(*index.indices(self._count))]
+        if index < 0:
+            index += self._count
+        if not 0 <= index < self._count:
+            raise IndexError("mask index out of range")
+        size = self._size
+        return int.from_bytes(self._view[index * size:(index + 1) * size], "little")
+
+
+class _KeyedMasks(collections.abc.Mapping):
+    """Bitmask (karakter, jumlah) -> int di atas `MappedMasks`; hanya tabel kuncinya yang ada di memori proses."""
+
+    def __init__(self, keys, masks):
+        self._positions = {key: position for position, key in enumerate(keys)}
+        self._masks = masks
+
+    def __getitem__(self, key):
+        return self._masks[self._positions[key]]
+
+    def __iter__(self):
+        return iter(self._positions)
+
+    def __len__(self):
+        return len(self._positions)
+
+
+def _write(output_path, words, slang_map, masks, max_distance, prefixes, sources):
+    """Menulis snapshot secara atomik dari korpus dan indeks yang sudah dibangun."""
+    words = list(words)
+    for text in list(slang_map) + list(slang_map.values()) + words:
+        if "\n" in text:
+            raise ValueError(f"corpus entries must not contain newlines: {text!r}")
+
+    length_upto, char_masks = masks.state()
+    mask_bytes = (len(words) + 7) // 8
+
+    sections = {}
+    chunks = []
+    offset = 0
+
+    def add(name, data):
+        nonlocal offset
+        # Section rata 8 byte agar bisa di-cast langsung (memoryview.cast) dari mmap
+        padding = -offset % _ALIGN
+        if padding:
+            chunks.append(b"\0" * padding)
+            offset += padding
+        sections[name] = [offset, len(data)]
+        chunks.append(data)
+        offset += len(data)
+
+    encoded = [word.encode("utf-8") for word in words]
+    offsets = array.array("I", [0])
+    for data in encoded:
+        offsets.append(offsets[-1] + len(data))
+    add("words", b"".join(encoded))
+    add("word_offsets", offsets.tobytes())
+    add("slang_keys", "\n".join(slang_map.keys()).encode("utf-8"))
+    add("slang_values", "\n".join(slang_map.values()).encode("utf-8"))
+    add("length_masks", b"".join(mask.to_bytes(mask_bytes, "little") for mask in length_upto))
+    char_keys = sorted(char_masks)
+    add("char_masks", b"".join(char_masks[key].to_bytes(mask_bytes, "little") for key in char_keys))
+    add("prefixes", "\n".join(sorted(prefixes)).encode("utf-8"))
+
+    metadata = {
+        "data_sha256": hashlib.sha256(b"".join(chunks)).hexdigest(),
+        "sources": sources,
+        "byteorder": sys.byteorder,
+        "sections": sections,
+        "word_count": len(words),
+        "slang_count": len(slang_map),
+        "mask_bytes": mask_bytes,
+        "length_mask_count": len(length_upto),
+        "char_keys": [[char, count] for char, count in char_keys],
+        "typo_max_distance": max_distance,
+    }
+    metadata_bytes = json.dumps(metadata).encode("utf-8")
+    # Spasi di akhir JSON membuat awal bagian data juga rata 8 byte
+    metadata_bytes += b" " * (-(_HEADER.size + len(metadata_bytes)) % _ALIGN)
+
+    directory = os.path.dirname(os.path.abspath(output_path))
+    os.makedirs(directory, exist_ok=True)
+    temp_path = f"{output_path}.{os.getpid()}.tmp"
+    try:
+        with open(temp_path, "wb") as f:
+            f.write(_HEADER.pack(MAGIC, FORMAT_VERSION, len(metadata_bytes)))
+            f.write(metadata_bytes)
+            for chunk in chunks:
+                f.write(chunk)
+        os.replace(temp_path, output_path)
+    except BaseException:
+        if os.path.exists(temp_path):
+            os.remove(temp_path)
+        raise
+    return output_path
+
+
+def build_snapshot(common_words_path, slangs_csv_path, output_path):
+    """
+    Mengompilasi common_words.txt dan slangs.csv, beserta bitmask indeks singkatan dan typo,
+    serta prefiks kata untuk normalisasi leet, menjadi satu file snapshot biner di
+    `output_path`. File ditulis secara atomik.
+    """
+    sources = {"common_words": file_digest(common_words_path), "slangs": file_digest(slangs_csv_path)}
+    words = read_common_words(common_words_path)
+    slang_map = read_slang_map(slangs_csv_path)
+    abbreviation_index = AbbreviationIndex(words)
+    max_distance = TypoIndex(words, masks=abbreviation_index.masks).state()
+    return _write(output_path, words, slang_map, abbreviation_index.masks, max_distance,
+                  word_prefixes(words), sources)
+
+
+def write_corpus(corpus, common_words_path, slangs_csv_path, output_path, sources=None):
+    """
+    Menulis snapshot dari Corpus yang sudah dibangun dari `common_words_path` dan
+    `slangs_csv_path`, tanpa membaca ulang file maupun membangun ulang indeks.
+    `sources` adalah digest file (lihat `file_digest`) saat korpus dibaca; None = hitung sekarang.
+    """
+    if sources is None:
+        sources = {"common_words": file_digest(common_words_path), "slangs": file_digest(slangs_csv_path)}
+    return _write(output_path, corpus.words, corpus.slang_map, corpus.abbreviation_index.masks,
+                  corpus.typo_index.state(), corpus.prefixes, sources)
+
+
+class Snapshot:
+    """
+    File snapshot yang di-memory-map dan diverifikasi sekali saat dibuka. Daftar kata dan
+    bitmask indeks dibaca langsung dari halaman mmap (lihat `MappedWords`, `MappedMasks`),
+    sehingga dipakai bersama oleh semua proses di host yang sama; mmap tetap terbuka selama
+    masih ada indeks yang memakainya. Set keanggotaan (kata, prefiks) dan peta slang tetap
+    dibentuk per proses karena dipakai di jalur panas sebagai hash lookup.
+    """
+
+    def __init__(self, path):
+        self.path = path
+        with open(path, "rb") as f:
+            self._mm = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        try:
+            if len(self._mm) < _HEADER.size:
+                raise SnapshotError(f"'{path}' is too small to be a snapshot")
+            magic, version, metadata_length = _HEADER.unpack_from(self._mm, 0)
+            if magic != MAGIC:
+                raise SnapshotError(f"'{path}' is not a corpus snapshot")
+            self.version = version
+            start = _HEADER.size
+            self.metadata = json.loads(self._mm[start:start + metadata_length].decode("utf-8")) if version == FORMAT_VERSION else {}
+            self._data_start = start + metadata_length
+            if version == FORMAT_VERSION:
+                self._verify()
+        except Exception:
+            self.close()
+            raise
+
+    def _verify(self):
+        """Memastikan setiap section berada di dalam file dan isi data sesuai checksum-nya."""
+        data_length = len(self._mm) - self._data_start
+        try:
+            sections = self.metadata["sections"]
+            expected_digest = self.metadata["data_sha256"]
+        except (TypeError, KeyError) as e:
+            raise SnapshotError(f"'{self.path}' has incomplete metadata") from e
+        if data_length < 0:
+            raise SnapshotError(f"'{self.path}' is truncated")
+        for name, (offset, length) in sections.items():
+            if offset < 0 or length < 0 or offset + length > data_length:
+                raise SnapshotError(f"section '{name}' of '{self.path}' lies outside the file (truncated?)")
+        data = memoryview(self._mm)[self._data_start:]
+        try:
+            digest = hashlib.sha256(data).hexdigest()
+        finally:
+            data.release()
+        if digest != expected_digest:
+            raise SnapshotError(f"'{self.path}' is corrupt (checksum mismatch)")
+
+    def close(self):
+        """Menutup mmap jika tidak ada lagi view yang memakainya; jika masih ada, mmap dilepas bersama view terakhir."""
+        try:
+            self._mm.close()
+        except BufferError:
+            pass
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
+
+    def is_current(self, source, source_path):
+        """True jika snapshot berformat terbaru dan dibuat dari isi `source_path` saat ini."""
+        if self.version != FORMAT_VERSION or self.metadata.get("byteorder") != sys.byteorder:
+            return False
+        try:
+            return self.metadata["sources"][source] == file_digest(source_path)
+        except OSError:
+            return False
+
+    def _section(self, name):
+        offset, length = self.metadata["sections"][name]
+        start = self._data_start + offset
+        return memoryview(self._mm)[start:start + length]
+
+    def _lines(self, name):
+        section = self._section(name)
+        try:
+            text = str(section, "utf-8")
+        finally:
+            section.release()
+        return text.split("\n") if text else []
+
+    def common_words(self):
+        """
+        Mengembalikan (kata urutan korpus, AbbreviationIndex, TypoIndex, set prefiks kata).
+        Kata dan bitmask indeks tetap berada di mmap.
+        """
+        metadata = self.metadata
+        offsets = self._section("word_offsets").cast("I")
+        if len(offsets) != metadata["word_count"] + 1 or offsets[-1] > metadata["sections"]["words"][1]:
+            raise SnapshotError(f"word offsets of '{self.path}' do not match its word list")
+        words = MappedWords(self._section("words"), offsets)
+
+        size = metadata["mask_bytes"]
+        # Bitmask panjang hanya beberapa puluh dan dipakai di setiap lookup, jadi di-decode sekali
+        # per proses; bitmask (karakter, jumlah), yang jauh lebih banyak, tetap dibaca dari mmap
+        length_upto = list(MappedMasks(self._section("length_masks"), size, metadata["length_mask_count"]))
+        char_keys = [tuple(key) for key in metadata["char_keys"]]
+        char_masks = _KeyedMasks(char_keys, MappedMasks(self._section("char_masks"), size, len(char_keys)))
+        masks = WordMasks.from_state(length_upto, char_masks)
+
+        abbreviation_index = AbbreviationIndex(words, masks)
+        typo_index = TypoIndex.from_state(words, metadata["typo_max_distance"], masks)
+
+        prefixes = frozenset(self._lines("prefixes"))
+
+        return words, abbreviation_index, typo_index, prefixes
+
+    def slang_map(self):
+        """Mengembalikan dict slang -> formal."""
+        return dict(zip(self._lines("slang_keys"), self._lines("slang_values")))
+
+
+def _decode(snapshot, read):
+    """Menjalankan `read`; snapshot yang isinya tidak bisa didekode diabaikan dengan peringatan."""
+    try:
+        return read()
+    except (ValueError, KeyError, TypeError, IndexError, SnapshotError) as e:
+        print(f"WARNING: Cannot read snapshot '{snapshot.path}': {e}. Loading text corpus instead.")
+        return None
+
+
+def load(snapshot_path, common_words_path=None, slangs_csv_path=None):
+    """
+    Membuka dan memverifikasi snapshot sekali, lalu mengambil bagian untuk sumber yang
+    diberikan. Mengembalikan (bagian kata, peta slang): bagian kata berupa (kata,
+    AbbreviationIndex, TypoIndex, set prefiks). Masing-masing None jika path sumbernya None,
+    atau snapshot tidak ada, rusak, atau basi untuk sumber itu sehingga pemanggil harus
+    memuat file teks.
+    """
+    if not snapshot_path or not os.path.exists(snapshot_path):
+        return None, None
+    try:
+        snapshot = Snapshot(snapshot_path)
+    except (OSError, ValueError, SnapshotError) as e:
+        print(f"WARNING: Cannot read snapshot '{snapshot_path}': {e}. Loading text corpus instead.")
+        return None, None
+
+    parts = []
+    try:
+        for source, source_path, read in (("common_words", common_words_path, snapshot.common_words),
+                                          ("slangs", slangs_csv_path, snapshot.slang_map)):
+            if source_path is None:
+                parts.append(None)
+            elif not snapshot.is_current(source, source_path):
+                print(f"WARNING: Snapshot '{snapshot_path}' is stale for '{source_path}'. Loading text corpus instead.")
+                parts.append(None)
+            else:
+                parts.append(_decode(snapshot, read))
+    finally:
+        # Kata dan bitmask yang sudah diambil tetap memakai mmap ini
+        snapshot.close()
+    return tuple(parts)
+
+
+def load_common_words(snapshot_path, common_words_path):
+    """
+    (kata, AbbreviationIndex, TypoIndex, set prefiks) dari snapshot, atau None jika snapshot
+    tidak ada atau basi sehingga pemanggil harus memuat file teks.
+    """
+    return load(snapshot_path, common_words_path=common_words_path)[0]
+
+
+def load_slang_map(snapshot_path, slangs_csv_path):
+    """Peta slang dari snapshot, atau None jika snapshot tidak ada atau basi."""
+    return load(snapshot_path, slangs_csv_path=slangs_csv_path)[1]
+
+
+def main(argv=None):
+    corpus_dir = os.path.join(os.path.dirname(os.path.abspath(__file__)), "corpus")
+    parser = argparse.ArgumentParser(
+        prog="python -m indo_normalizer.snapshot",
+        description="Compile the normalizer corpora and their indexes into a binary snapshot.",
+    )
+    parser.add_argument("--common-words", default=os.path.join(corpus_dir, "common_words.txt"))
+    parser.add_argument("--slangs", default=os.path.join(corpus_dir, "slangs.csv"))
+    parser.add_argument("-o", "--output", default=os.path.join(corpus_dir, SNAPSHOT_FILENAME))
+    args = parser.parse_args(argv)
+
+    path = build_snapshot(args.common_words, args.slangs, args.output)
+    print(f"Snapshot '{path}' berhasil dibuat. ({os.path.getsize(path)} byte)")
+
+
+if __name__ == "__main__":
+    main()
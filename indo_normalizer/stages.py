@@ -0,0 +1,37 @@
+# Tahap pipeline yang bisa dipilih, sesuai urutan eksekusinya.
+# Tokenisasi selalu dijalankan; tokenisasi ulang hanya jika ada tahap 1 yang aktif.
+LEET_STAGES = frozenset(('repetitions', 'leet', 'forced_leet'))       # tahap 1
+LEXICAL_STAGES = frozenset(('abbreviation', 'slang', 'typo'))         # tahap 2
+ALL_STAGES = LEET_STAGES | LEXICAL_STAGES
+
+
+def select_stages(stages=None) -> frozenset:
+    """
+    Mengubah pilihan tahap menjadi frozenset nama tahap yang aktif.
+
+    Args:
+        stages (iterable of str): Nama tahap yang dijalankan (lihat ALL_STAGES), misalnya
+            `ALL_STAGES - {'abbreviation', 'typo'}`. None = semua tahap.
+
+    Raises:
+        ValueError: Jika ada nama tahap yang tidak dikenal.
+    """
+    if stages is None:
+        return ALL_STAGES
+    if isinstance(stages, str):
+        stages = (stages,)
+    selected = frozenset(stages)
+    unknown = selected - ALL_STAGES
+    if unknown:
+        raise ValueError(f"unknown stage(s) {sorted(unknown)}, expected a subset of {sorted(ALL_STAGES)}")
+    return selected
+
+# Kunci counts hasil normalize_text, sesuai urutan tahap yang menghasilkannya
+COUNT_KEYS = (
+    'double_letters_words',  # repetitions
+    'known_leet_words',      # leet
+    'random_leet_words',     # forced_leet
+    'abbreviated_words',     # abbreviation
+    'slangs',                # slang
+    'typo_words',            # typo
+)
@@ -0,0 +1,239 @@
+import os
+import sqlite3
+import threading
+import time
+
+# AUTOINCREMENT: id versi yang sudah dihapus tidak pernah dipakai ulang, sehingga id yang
+# masih di-cache proses lain tidak bisa menunjuk ke versi korpus yang berbeda
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS versions (
+    id INTEGER PRIMARY KEY AUTOINCREMENT,
+    version TEXT NOT NULL UNIQUE,
+    last_used REAL NOT NULL
+);
+CREATE TABLE IF NOT EXISTS tokens (
+    version_id INTEGER NOT NULL,
+    namespace TEXT NOT NULL,
+    token TEXT NOT NULL,
+    result TEXT NOT NULL,
+    changes TEXT NOT NULL,
+    PRIMARY KEY (version_id, namespace, token)
+) WITHOUT ROWID;
+"""
+
+
+def _migrate(connection):
+    """
+    Database dari versi sebelumnya memakai id versi tanpa AUTOINCREMENT, yang bisa dipakai
+    ulang setelah versi dihapus. Karena isinya hanya cache, tabel lama dibuang dan dibuat ulang.
+    """
+    connection.execute("BEGIN IMMEDIATE")
+    try:
+        row = connection.execute("SELECT sql FROM sqlite_master WHERE type = 'table' AND name = 'versions'").fetchone()
+        if row is not None and "AUTOINCREMENT" not in row[0].upper():
+            connection.execute("DROP TABLE IF EXISTS tokens")
+            connection.execute("DROP TABLE versions")
+        connection.execute("COMMIT")
+    except BaseException:
+        connection.execute("ROLLBACK")
+        raise
+
+
+def _register_version(connection, version, now):
+    """Mendaftarkan (atau menandai dipakai) versi korpus di dalam transaksi yang sedang berjalan dan mengembalikan id-nya."""
+    connection.execute(
+        "INSERT INTO versions (version, last_used) VALUES (?, ?) "
+        "ON CONFLICT (version) DO UPDATE SET last_used = excluded.last_used",
+        (version, now),
+    )
+    return connection.execute("SELECT id FROM versions WHERE version = ?", (version,)).fetchone()[0]
+
+
+class TokenStore:
+    """
+    Penyimpanan persisten (SQLite) hasil resolusi token, dipakai bersama oleh beberapa
+    run dan beberapa proses worker di satu host.
+
+    Setiap entri dikunci dengan versi korpus (hash isi `common_words.txt` dan `slangs.csv`,
+    lihat `Corpus.version`), konfigurasi tahap, dan token mentah. Hasil yang tidak mengubah
+    token (misalnya pencarian typo yang tidak menemukan apa pun) ikut disimpan, sehingga
+    pemindaian yang mahal tidak diulang. Jika korpus berubah, versinya berubah sehingga
+    entri lama tidak pernah terpakai lagi; entri versi yang tidak dipakai selama
+    `retention_days` hari dihapus otomatis.
+
+    Database memakai mode WAL: banyak proses bisa membaca bersamaan, dan penulisan
+    dikumpulkan lalu ditulis per transaksi (lihat `flush`). Setiap flush juga memperbarui
+    waktu terakhir versi dipakai; jika versi itu sudah dihapus proses lain, versi didaftarkan
+    ulang dengan id baru.
+
+    Args:
+        path (str): Path file database; dibuat jika belum ada.
+        retention_days (float): Umur maksimum entri versi korpus yang tidak lagi dipakai.
+        flush_every (int): Jumlah entri baru yang ditampung sebelum ditulis otomatis.
+        timeout (float): Detik menunggu jika database sedang dikunci proses lain.
+    """
+
+    def __init__(self, path, retention_days: float = 7.0, flush_every: int = 1024, timeout: float = 30.0):
+        self.path = os.fspath(path)
+        self.retention_days = retention_days
+        self.flush_every = flush_every
+        self.timeout = timeout
+        self._local = threading.local()
+        self._lock = threading.Lock()
+        self._version_ids = {}
+        self._versions = {}
+        self.hits = 0
+        self.misses = 0
+        # Buka sekali di sini agar path yang salah langsung ketahuan
+        self._connection()
+
+    def __getstate__(self):
+        # Koneksi SQLite tidak bisa di-pickle; salinan (misalnya di worker) membuka koneksinya sendiri
+        return {'path': self.path, 'retention_days': self.retention_days,
+                'flush_every': self.flush_every, 'timeout': self.timeout}
+
+    def __setstate__(self, state):
+        self.__init__(**state)
+
+    def _connection(self):
+        """Koneksi milik thread (dan proses) ini; dibuka ulang setelah fork."""
+        local = self._local
+        if getattr(local, 'pid', None) != os.getpid():
+            connection = sqlite3.connect(self.path, timeout=self.timeout, isolation_level=None)
+            connection.execute("PRAGMA journal_mode=WAL")
+            connection.execute("PRAGMA synchronous=NORMAL")
+            _migrate(connection)
+            connection.executescript(_SCHEMA)
+            local.connection = connection
+            local.pending = {}
+            local.pid = os.getpid()
+        return local.connection
+
+    def _version_id(self, version):
+        """Id versi korpus di database; menandai versi ini dipakai dan menghapus versi yang kedaluwarsa."""
+        version_id = self._version_ids.get(version)
+        if version_id is not None:
+            return version_id
+        connection = self._connection()
+        now = time.time()
+        with self._lock:
+            connection.execute("BEGIN IMMEDIATE")
+            try:
+                version_id = _register_version(connection, version, now)
+                expired = [row[0] for row in connection.execute(
+                    "SELECT id FROM versions WHERE last_used < ?", (now - self.retention_days * 86400,)
+                )]
+                for expired_id in expired:
+                    connection.execute("DELETE FROM tokens WHERE version_id = ?", (expired_id,))
+                    connection.execute("DELETE FROM versions WHERE id = ?", (expired_id,))
+                connection.execute("COMMIT")
+            except BaseException:
+                connection.execute("ROLLBACK")
+                raise
+            self._version_ids[version] = version_id
+            self._versions[version_id] = version
+        return version_id
+
+    def get(self, version_id, namespace, token):
+        """Mengembalikan (token hasil, tuple perubahan) yang tersimpan, atau None."""
+        connection = self._connection()
+        key = (version_id, namespace, token)
+        value = self._local.pending.get(key)
+        if value is None:
+            row = connection.execute(
+                "SELECT result, changes FROM tokens WHERE version_id = ? AND namespace = ? AND token = ?", key
+            ).fetchone()
+            if row is not None:
+                value = (row[0], tuple(row[1].split(",")) if row[1] else ())
+        with self._lock:
+            if value is None:
+                self.misses += 1
+            else:
+                self.hits += 1
+        return value
+
+    def put(self, version_id, namespace, token, value):
+        """Menampung satu hasil resolusi; ditulis ke database saat `flush`."""
+        self._connection()
+        pending = self._local.pending
+        pending[(version_id, namespace, token)] = value
+        if len(pending) >= self.flush_every:
+            self.flush()
+
+    def flush(self):
+        """Menulis semua entri yang masih ditampung oleh thread ini dalam satu transaksi."""
+        connection = self._connection()
+        pending = self._local.pending
+        if not pending:
+            return
+        now = time.time()
+        renamed = {}
+        connection.execute("BEGIN IMMEDIATE")
+        try:
+            for version_id in {key[0] for key in pending}:
+                updated = connection.execute(
+                    "UPDATE versions SET last_used = ? WHERE id = ?", (now, version_id)
+                ).rowcount
+                if not updated:
+                    # Versi ini sudah dihapus (kedaluwarsa atau `clear`) oleh proses lain
+                    renamed[version_id] = _register_version(connection, self._versions[version_id], now)
+            rows = [(renamed.get(version_id, version_id), namespace, token, result, ",".join(changes))
+                    for (version_id, namespace, token), (result, changes) in pending.items()]
+            # Proses lain mungkin sudah menulis token yang sama dengan hasil yang sama
+            connection.executemany(
+                "INSERT OR IGNORE INTO tokens (version_id, namespace, token, result, changes) VALUES (?, ?, ?, ?, ?)",
+                rows,
+            )
+            connection.execute("COMMIT")
+        except BaseException:
+            connection.execute("ROLLBACK")
+            raise
+        pending.clear()
+        if renamed:
+            with self._lock:
+                for old_id, new_id in renamed.items():
+                    version = self._versions[old_id]
+                    self._version_ids[version] = new_id
+                    self._versions[new_id] = version
+
+    def wrap(self, version, namespace, resolve):
+        """
+        Membungkus fungsi resolusi token `resolve` dengan penyimpanan ini, untuk korpus
+        `version` dan konfigurasi tahap `namespace`.
+        """
+        self._version_id(version)
+
+        def stored(token):
+            # Id dibaca ulang setiap kali karena bisa berganti setelah `flush` (lihat di atas)
+            version_id = self._version_id(version)
+            result = self.get(version_id, namespace, token)
+            if result is None:
+                result = resolve(token)
+                self.put(version_id, namespace, token, result)
+            return result
+
+        return stored
+
+    def stats(self) -> dict:
+        """Statistik penyimpanan: hits, misses, dan jumlah entri di database (semua versi)."""
+        count = self._connection().execute("SELECT COUNT(*) FROM tokens").fetchone()[0]
+        return {'hits': self.hits, 'misses': self.misses, 'size': count}
+
+    def clear(self):
+        """Menghapus semua entri dari database dan mereset statistik."""
+        connection = self._connection()
+        self._local.pending.clear()
+        with self._lock:
+            connection.execute("DELETE FROM tokens")
+            connection.execute("DELETE FROM versions")
+            self._version_ids.clear()
+            self._versions.clear()
+            self.hits = 0
+            self.misses = 0
+
+    def close(self):
+        """Menulis entri yang tertampung dan menutup koneksi thread ini."""
+        if getattr(self._local, 'pid', None) == os.getpid():
+            self.flush()
+            self._local.connection.close()
+            del self._local.pid
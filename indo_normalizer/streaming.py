@@ -0,0 +1,81 @@
+import itertools
+import queue
+import threading
+
+# Penanda akhir input di antrean prefetch
+_DONE = object()
+
+
+class _Failure:
+    """Membungkus exception dari thread pembaca agar bisa dilempar ulang di thread pemanggil."""
+
+    def __init__(self, error):
+        self.error = error
+
+
+def iter_batches(iterable, size):
+    """Membagi `iterable` menjadi list berisi paling banyak `size` item, tanpa membaca lebih jauh."""
+    iterator = iter(iterable)
+    while True:
+        batch = list(itertools.islice(iterator, size))
+        if not batch:
+            return
+        yield batch
+
+
+def iter_micro_batches(iterable, size, prefetch):
+    """
+    Membaca `iterable` di thread latar belakang ke antrean berkapasitas `prefetch` item,
+    lalu menghasilkan batch berisi item yang sudah tersedia (paling banyak `size`).
+
+    Batch tidak menunggu sampai penuh: begitu ada input, batch dibentuk dari apa yang
+    sudah masuk antrean, sehingga sumber yang lambat (misalnya consumer message queue)
+    tetap diproses segera. Exception dari `iterable` dilempar ulang di thread pemanggil.
+    """
+    items = queue.Queue(maxsize=prefetch)
+    stop = threading.Event()
+
+    def put(item):
+        # put dengan timeout agar thread berhenti jika generator ditutup lebih awal
+        while not stop.is_set():
+            try:
+                items.put(item, timeout=0.1)
+                return True
+            except queue.Full:
+                continue
+        return False
+
+    def read():
+        try:
+            for item in iterable:
+                if not put(item):
+                    return
+            put(_DONE)
+        except BaseException as e:
+            put(_Failure(e))
+
+    reader = threading.Thread(target=read, name="indo-normalizer-prefetch", daemon=True)
+    reader.start()
+    try:
+        while True:
+            batch = []
+            item = items.get()
+            while True:
+                if item is _DONE:
+                    if batch:
+                        yield batch
+                    return
+                if isinstance(item, _Failure):
+                    if batch:
+                        yield batch
+                    raise item.error
+                batch.append(item)
+                if len(batch) >= size:
+                    break
+                try:
+                    item = items.get_nowait()
+                except queue.Empty:
+                    break
+            yield batch
+    finally:
+        stop.set()
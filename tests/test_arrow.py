@@ -0,0 +1,98 @@
+import os
+import tempfile
+import unittest
+from unittest import mock
+
+from indo_normalizer import Normalizer, parallel
+from indo_normalizer.stages import COUNT_KEYS
+
+try:
+    import pyarrow as pa
+    import pyarrow.parquet as pq
+    from indo_normalizer.arrow import normalize_array, normalize_parquet, normalize_record_batch
+except ImportError:
+    pa = None
+
+TEXTS = ["H4loooo, akU k3ren bgt!", None, "yg bgt", "", "yg bgt", "saya kerjain tugas kompurer", "gw mkn"]
+
+
+@unittest.skipIf(pa is None, "pyarrow is not installed")
+class TestArrow(unittest.TestCase):
+
+    @classmethod
+    def setUpClass(cls):
+        cls.normalizer = Normalizer()
+        # Hasil yang diharapkan dihitung per baris dengan normalize_text; null tetap null dengan counts 0
+        cls.expected_text = []
+        cls.expected_counts = {key: [] for key in COUNT_KEYS}
+        for text in TEXTS:
+            normalized, counts = cls.normalizer.normalize_text(text) if text is not None else (None, {})
+            cls.expected_text.append(normalized)
+            for key in COUNT_KEYS:
+                cls.expected_counts[key].append(counts.get(key, 0))
+
+    def test_normalize_array(self):
+        """Array dan ChunkedArray dinormalisasi per potongan dengan hasil yang sama seperti per baris."""
+        chunked = pa.chunked_array([TEXTS[:3], TEXTS[3:]], type=pa.large_string())
+        for array in (pa.array(TEXTS), chunked):
+            with self.subTest(type=type(array).__name__):
+                table = normalize_array(array, self.normalizer, batch_size=2)
+                self.assertEqual(table.column_names, ["normalized_text", *COUNT_KEYS])
+                self.assertEqual(table["normalized_text"].to_pylist(), self.expected_text)
+                for key in COUNT_KEYS:
+                    self.assertEqual(table[key].to_pylist(), self.expected_counts[key])
+        self.assertEqual(normalize_array(chunked, self.normalizer).schema.field("normalized_text").type,
+                         pa.large_string())
+        self.assertEqual(normalize_array(pa.array([], type=pa.string()), self.normalizer).num_rows, 0)
+
+    def test_normalize_record_batch(self):
+        """Kolom hasil ditambahkan setelah kolom asli."""
+        batch = pa.RecordBatch.from_pydict({"id": list(range(len(TEXTS))), "teks": TEXTS})
+        result = normalize_record_batch(batch, "teks", self.normalizer)
+        self.assertEqual(result.schema.names[:3], ["id", "teks", "teks_normalized"])
+        self.assertEqual(result.column("teks_normalized").to_pylist(), self.expected_text)
+        self.assertEqual(result.column("teks_slangs").to_pylist(), self.expected_counts["slangs"])
+        with self.assertRaises(KeyError):
+            normalize_record_batch(batch, "tidak_ada", self.normalizer)
+
+    def test_normalize_parquet(self):
+        """File Parquet dibaca dan ditulis per record batch."""
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            input_path = os.path.join(tmp_dir, "input.parquet")
+            output_path = os.path.join(tmp_dir, "output.parquet")
+            pq.write_table(pa.table({"id": list(range(len(TEXTS))), "teks": TEXTS}), input_path)
+
+            rows = normalize_parquet(input_path, output_path, "teks", self.normalizer, batch_size=3)
+            self.assertEqual(rows, len(TEXTS))
+            table = pq.read_table(output_path)
+            self.assertEqual(table["id"].to_pylist(), list(range(len(TEXTS))))
+            self.assertEqual(table["teks_normalized"].to_pylist(), self.expected_text)
+            for key in COUNT_KEYS:
+                self.assertEqual(table[f"teks_{key}"].to_pylist(), self.expected_counts[key])
+
+            pq.write_table(pa.table({"teks": pa.array([], type=pa.string())}), input_path)
+            self.assertEqual(normalize_parquet(input_path, output_path, "teks", self.normalizer), 0)
+            self.assertIn("teks_typo_words", pq.read_table(output_path).column_names)
+
+    def test_workers_share_one_pool_per_call(self):
+        """Dengan workers > 1, satu WorkerPool dipakai untuk semua batch dalam satu panggilan."""
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            input_path = os.path.join(tmp_dir, "input.parquet")
+            output_path = os.path.join(tmp_dir, "output.parquet")
+            pq.write_table(pa.table({"teks": TEXTS}), input_path)
+
+            with mock.patch.object(parallel, "WorkerPool", wraps=parallel.WorkerPool) as pools:
+                normalize_parquet(input_path, output_path, "teks", self.normalizer, batch_size=2, workers=2)
+                table = normalize_array(pa.array(TEXTS), self.normalizer, batch_size=2, workers=2)
+            self.assertEqual(pools.call_count, 2)
+            self.assertEqual(pq.read_table(output_path)["teks_normalized"].to_pylist(), self.expected_text)
+            self.assertEqual(table["normalized_text"].to_pylist(), self.expected_text)
+
+        # Pool yang sudah ada dipakai apa adanya
+        with parallel.WorkerPool(self.normalizer, 2) as pool:
+            table = normalize_array(pa.array(TEXTS), batch_size=2, pool=pool)
+        self.assertEqual(table["typo_words"].to_pylist(), self.expected_counts["typo_words"])
+
+
+if __name__ == '__main__':
+    unittest.main()
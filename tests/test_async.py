@@ -0,0 +1,108 @@
+import unittest
+import asyncio
+import threading
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+
+from indo_normalizer import Normalizer
+from indo_normalizer.aio import AsyncBatcher, QueueFullError
+from indo_normalizer.parallel import WorkerPool
+
+
+class BlockingNormalizer(Normalizer):
+    """Normalizer yang menahan normalize_many sampai diizinkan, untuk menguji antrean async."""
+
+    def __init__(self):
+        super().__init__()
+        self.release = threading.Event()
+        self.batches = []
+
+    def normalize_many(self, texts, **kwargs):
+        self.release.wait(5)
+        self.batches.append(list(texts))
+        return super().normalize_many(texts, **kwargs)
+
+
+class TestAsyncNormalizer(unittest.IsolatedAsyncioTestCase):
+
+    @classmethod
+    def setUpClass(cls):
+        cls.normalizer = Normalizer()
+
+    async def test_anormalize_text_matches_normalize_text(self):
+        """Uji hasil API async identik dengan normalize_text, termasuk untuk banyak permintaan bersamaan."""
+        texts = ["yg penting kamu bgt lagi males", "aku k3ren pake h4lo", "", "saya kerjain tugas kompurer"] * 10
+        expected = [self.normalizer.normalize_text(text) for text in texts]
+        results = await asyncio.gather(*(self.normalizer.anormalize_text(text) for text in texts))
+        self.assertEqual(list(results), expected)
+        self.assertEqual(await self.normalizer.anormalize_many(texts), expected)
+        self.assertEqual(await self.normalizer.anormalize_many([]), [])
+
+    async def test_requests_are_coalesced(self):
+        """Permintaan yang datang bersamaan digabung menjadi micro-batch."""
+        normalizer = BlockingNormalizer()
+        normalizer.release.set()
+        with ThreadPoolExecutor(1) as executor:
+            normalizer.configure_async(executor=executor, max_batch_size=8, max_wait=0.05)
+            await asyncio.gather(*(normalizer.anormalize_text(f"yg bgt {i}") for i in range(20)))
+        self.assertEqual([len(batch) for batch in normalizer.batches], [8, 8, 4])
+
+    async def test_configure_async_stages(self):
+        """Tahap yang diatur lewat configure_async dipakai untuk setiap micro-batch."""
+        text = "yg penting kamu bgt lagi males, saya kerjain tugas kompurer"
+        expected = self.normalizer.normalize_text(text, stages=['abbreviation'])
+        normalizer = Normalizer()
+        with ThreadPoolExecutor(1) as executor:
+            batcher = normalizer.configure_async(executor=executor, stages=['abbreviation'])
+            self.assertEqual(batcher.stages, frozenset({'abbreviation'}))
+            self.assertEqual(await normalizer.anormalize_text(text), expected)
+            self.assertEqual(await normalizer.anormalize_many([text]), [expected])
+        self.assertNotEqual(expected, self.normalizer.normalize_text(text))
+        with self.assertRaises(ValueError):
+            normalizer.configure_async(stages=['tidak_ada'])
+
+    async def test_queue_sheds_load(self):
+        """Saat antrean penuh, permintaan baru langsung ditolak dengan QueueFullError."""
+        normalizer = BlockingNormalizer()
+        with ThreadPoolExecutor(1) as executor:
+            normalizer.configure_async(executor=executor, max_batch_size=1, max_wait=0, max_queue=3)
+            requests = [asyncio.ensure_future(normalizer.anormalize_text("yg bgt")) for _ in range(6)]
+            await asyncio.sleep(0.05)
+            rejected = [request for request in requests if request.done() and isinstance(request.exception(), QueueFullError)]
+            self.assertEqual(len(rejected), 3)
+            normalizer.release.set()
+            results = await asyncio.gather(*requests, return_exceptions=True)
+        self.assertEqual([result for result in results if not isinstance(result, QueueFullError)],
+                         [("yang banget", {'abbreviated_words': 2})] * 3)
+        self.assertEqual(len(normalizer.batches), 3)
+
+    async def test_worker_pool_keeps_cache_and_metrics(self):
+        """Dengan WorkerPool, cache token worker terpakai antar batch dan metrik sampai ke proses induk."""
+        texts = ["yg penting kamu bgt lagi males", "aku k3ren pake h4lo", "saya kerjain tugas kompurer"]
+        expected = [self.normalizer.normalize_text(text) for text in texts]
+        normalizer = Normalizer(cache_size=1000, instrument=True)
+        with WorkerPool(normalizer, 1) as pool:
+            normalizer.configure_async(executor=pool)
+            for _ in range(3):
+                self.assertEqual(await normalizer.anormalize_many(texts), expected)
+            cache, store = pool.worker_stats()
+        self.assertGreater(cache['hits'], 0)
+        self.assertIsNone(store)
+        self.assertEqual(normalizer.stage_metrics()['texts'], 3 * len(texts))
+
+    def test_plain_process_pool_rejected(self):
+        """ProcessPoolExecutor biasa dan WorkerPool milik Normalizer lain ditolak."""
+        with ProcessPoolExecutor(1) as executor:
+            with self.assertRaises(ValueError):
+                AsyncBatcher(self.normalizer, executor)
+        with WorkerPool(Normalizer(), 1) as pool:
+            with self.assertRaises(ValueError):
+                AsyncBatcher(self.normalizer, pool)
+
+    async def test_errors_propagate(self):
+        """Exception dari normalisasi diteruskan ke pemanggil."""
+        with self.assertRaises(TypeError):
+            await self.normalizer.anormalize_many([123, "yg"])
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,62 @@
+import unittest
+import io
+import json
+import os
+import tempfile
+import contextlib
+import configparser
+
+import indo_normalizer
+from indo_normalizer import benchmark
+
+
+class TestBenchmark(unittest.TestCase):
+
+    def test_synthetic_corpus_is_reproducible(self):
+        """Korpus sintetis dengan seed yang sama selalu menghasilkan teks yang sama."""
+        words = ['aku', 'kamu', 'tidak', 'bisa', 'makan']
+        slang_map = {'gw': 'saya', 'gk': 'tidak'}
+        for kind in benchmark.KINDS:
+            with self.subTest(kind=kind):
+                texts = benchmark.synthetic_corpus(kind, 5, words, slang_map, seed=1)
+                self.assertEqual(len(texts), 5)
+                self.assertEqual(texts, benchmark.synthetic_corpus(kind, 5, words, slang_map, seed=1))
+                self.assertNotEqual(texts, benchmark.synthetic_corpus(kind, 5, words, slang_map, seed=2))
+        with self.assertRaises(ValueError):
+            benchmark.synthetic_corpus('panjang', 5, words, slang_map)
+
+    def test_measure_reports_latency_and_memory(self):
+        """measure mengembalikan throughput, persentil latensi, dan puncak memori."""
+        result = benchmark.measure(lambda item: [item] * 1000, list(range(50)), tokens=100)
+        self.assertEqual(result['items'], 50)
+        self.assertGreater(result['items_per_s'], 0)
+        self.assertLessEqual(result['p50_us'], result['p99_us'])
+        self.assertLessEqual(result['p99_us'], result['max_us'])
+        self.assertGreater(result['peak_memory_kb'], 0)
+
+    def test_main_writes_and_compares_json(self):
+        """CLI menyimpan hasil ke JSON dan bisa membandingkannya dengan hasil sebelumnya."""
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            path = os.path.join(tmp_dir, 'bench.json')
+            with contextlib.redirect_stdout(io.StringIO()):
+                benchmark.main(['-n', '3', '-o', path])
+            with open(path, encoding='utf-8') as f:
+                report = json.load(f)
+            self.assertIn('normalize_text[short]', report['results'])
+            self.assertIn('typo_stage', report['results'])
+            self.assertEqual(report['metadata']['count'], 3)
+            self.assertEqual(report['metadata']['indo_normalizer_version'], indo_normalizer.__version__)
+
+            with contextlib.redirect_stdout(io.StringIO()) as output:
+                benchmark.main(['-n', '3', '--compare', path])
+            self.assertIn('normalize_text[url]', output.getvalue())
+
+    def test_version_is_single_sourced(self):
+        """Versi package di setup.cfg diambil dari indo_normalizer.__version__, jadi hasil benchmark memakai versi rilis."""
+        config = configparser.ConfigParser()
+        config.read(os.path.join(os.path.dirname(__file__), '..', 'setup.cfg'))
+        self.assertEqual(config['metadata']['version'], 'attr: indo_normalizer.__version__')
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,87 @@
+import unittest
+import io
+import json
+import os
+import subprocess
+import sys
+import tempfile
+import contextlib
+
+from indo_normalizer import cli
+
+ROOT = os.path.join(os.path.dirname(__file__), '..')
+
+
+class TestCli(unittest.TestCase):
+
+    def setUp(self):
+        self.tmp_dir = tempfile.TemporaryDirectory()
+
+    def tearDown(self):
+        self.tmp_dir.cleanup()
+
+    def write(self, name, content):
+        path = os.path.join(self.tmp_dir.name, name)
+        with open(path, 'w', encoding='utf-8', newline='') as f:
+            f.write(content)
+        return path
+
+    def run_cli(self, argv):
+        output = os.path.join(self.tmp_dir.name, 'output')
+        with contextlib.redirect_stderr(io.StringIO()) as errors:
+            code = cli.main(argv + ['-o', output])
+        with open(output, encoding='utf-8', newline='') as f:
+            return code, f.read(), errors.getvalue()
+
+    def test_text_lines(self):
+        """Setiap baris teks dinormalisasi, termasuk baris kosong, dengan counts opsional."""
+        path = self.write('input.txt', "yg bgt\n\r\naku k3ren\n")
+        code, output, _ = self.run_cli([path, '-b', '1'])
+        self.assertEqual(code, 0)
+        self.assertEqual(output, "yang banget\n\naku kEren\n")
+
+        code, output, _ = self.run_cli([path, '--counts'])
+        first = output.splitlines()[0].split('\t')
+        self.assertEqual(first[0], 'yang banget')
+        self.assertEqual(json.loads(first[1]), {'abbreviated_words': 2})
+
+    def test_csv_column(self):
+        """Kolom CSV dinormalisasi ke kolom baru; kolom lain dipertahankan."""
+        path = self.write('input.csv', 'id;teks\n1;"yg bgt; gaje"\n2;h4lo\n')
+        code, output, _ = self.run_cli([path, '-f', 'csv', '--column', 'teks', '--delimiter', ';', '--counts'])
+        self.assertEqual(code, 0)
+        lines = output.splitlines()
+        self.assertEqual(lines[0], 'id;teks;teks_normalized;teks_counts')
+        self.assertTrue(lines[1].startswith('1;"yg bgt; gaje";"yang banget; enggak jelas";'))
+        self.assertTrue(lines[2].startswith('2;h4lo;hAlo;'))
+
+    def test_jsonl_field_with_workers(self):
+        """Field JSONL dinormalisasi dengan process pool; urutan output sama dengan input."""
+        texts = ["yg bgt", "aku k3ren", None, "gaje"] * 5
+        path = self.write('input.jsonl', "".join(json.dumps({'id': i, 'text': t}) + "\n" for i, t in enumerate(texts)))
+        code, output, _ = self.run_cli([path, '-f', 'jsonl', '--field', 'text', '-w', '2', '-b', '3'])
+        self.assertEqual(code, 0)
+        records = [json.loads(line) for line in output.splitlines()]
+        self.assertEqual([record['id'] for record in records], list(range(len(texts))))
+        self.assertEqual(records[0]['text_normalized'], 'yang banget')
+        self.assertEqual(records[2]['text_normalized'], '')
+
+    def test_invalid_input(self):
+        """Field yang hilang dilaporkan ke stderr dengan kode keluar bukan nol."""
+        path = self.write('input.jsonl', '{"id": 1}\n')
+        code, _, errors = self.run_cli([path, '-f', 'jsonl', '--field', 'text'])
+        self.assertEqual(code, 1)
+        self.assertIn("missing field 'text'", errors)
+
+    def test_module_entry_point(self):
+        """`python -m indo_normalizer` membaca stdin dan hanya menulis hasil ke stdout."""
+        result = subprocess.run(
+            [sys.executable, '-m', 'indo_normalizer'], input="yg bgt\n".encode('utf-8'),
+            cwd=ROOT, capture_output=True,
+        )
+        self.assertEqual(result.returncode, 0, result.stderr)
+        self.assertEqual(result.stdout.decode('utf-8'), "yang banget\n")
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,111 @@
+import contextlib
+import io
+import os
+import pickle
+import tempfile
+import unittest
+
+from indo_normalizer import Normalizer
+from indo_normalizer.corpora import Corpus, load_corpus
+
+
+class TestCorpus(unittest.TestCase):
+
+    def setUp(self):
+        self.tmp_dir = tempfile.TemporaryDirectory()
+        self.common_words_path = self._write('common_words.txt', 'saya\nmakan\nnasi\ngoreng\n')
+
+    def tearDown(self):
+        self.tmp_dir.cleanup()
+
+    def _write(self, name, content):
+        path = os.path.join(self.tmp_dir.name, name)
+        with open(path, 'w', encoding='utf-8') as f:
+            f.write(content)
+        return path
+
+    def _load(self, slangs_csv_path):
+        with contextlib.redirect_stdout(io.StringIO()):
+            return load_corpus(self.common_words_path, slangs_csv_path)
+
+    def test_normalizers_with_different_corpora(self):
+        """Dua Normalizer dengan peta slang berbeda berjalan berdampingan tanpa saling memengaruhi."""
+        first = Normalizer(corpus=self._load(self._write('a.csv', 'slang,formal\ngw,saya\n')))
+        second = Normalizer(corpus=self._load(self._write('b.csv', 'slang,formal\ngw,aku\n')))
+        self.assertEqual(first.normalize_text('gw makan')[0], 'saya makan')
+        self.assertEqual(second.normalize_text('gw makan')[0], 'aku makan')
+        self.assertNotEqual(first.corpus.version, second.corpus.version)
+
+    def test_registry_shares_corpus(self):
+        """Sumber yang sama dimuat sekali dan dipakai bersama."""
+        slangs_csv_path = self._write('slangs.csv', 'slang,formal\ngw,saya\n')
+        self.assertIs(self._load(slangs_csv_path), self._load(slangs_csv_path))
+        self.assertIs(Normalizer().corpus, Normalizer().corpus)
+
+    def test_corpus_is_immutable(self):
+        """Korpus tidak bisa diubah setelah dibuat."""
+        corpus = Corpus(['saya', 'makan'], {'gw': 'saya'})
+        with self.assertRaises(AttributeError):
+            corpus.words = ()
+        with self.assertRaises(TypeError):
+            corpus.slang_map['gue'] = 'saya'
+        self.assertEqual(corpus.version, Corpus(['saya', 'makan'], {'gw': 'saya'}).version)
+
+    def test_pickle(self):
+        """Korpus dari file di-pickle sebagai referensi registry; korpus lain disalin isinya."""
+        corpus = self._load(self._write('slangs.csv', 'slang,formal\ngw,saya\n'))
+        self.assertIs(pickle.loads(pickle.dumps(corpus)), corpus)
+
+        in_memory = Corpus(['saya', 'makan'], {'gw': 'saya'})
+        copy = pickle.loads(pickle.dumps(Normalizer(corpus=in_memory)))
+        self.assertEqual(copy.corpus.version, in_memory.version)
+        self.assertEqual(copy.normalize_text('gw makan')[0], 'saya makan')
+
+
+    def test_in_memory_sources(self):
+        """Normalizer bisa dibangun dari list kata dan dict slang, tanpa file."""
+        normalizer = Normalizer(common_words=['saya', 'makan', 'nasi'], slangs={'GW': 'Saya'})
+        self.assertEqual(normalizer.normalize_text('gw makan nasi')[0], 'saya makan nasi')
+        self.assertEqual(normalizer.corpus.words, ('saya', 'makan', 'nasi'))
+        self.assertEqual(dict(normalizer.corpus.slang_map), {'gw': 'saya'})
+
+    def test_layered_sources(self):
+        """Lapisan override menambah kata dan menimpa slang dari korpus dasar, berurutan."""
+        base = self._write('base.csv', 'slang,formal\ngw,saya\nmkn,makan\n')
+        normalizer = Normalizer(common_words=self.common_words_path, slangs=base, overrides=[
+            {'common_words': ['aku', 'saya']},
+            {'slangs': [('gw', 'aku')]},
+        ])
+        with contextlib.redirect_stdout(io.StringIO()):
+            corpus = normalizer.corpus
+        self.assertEqual(corpus.words, ('saya', 'makan', 'nasi', 'goreng', 'aku'))
+        self.assertEqual(dict(corpus.slang_map), {'gw': 'aku', 'mkn': 'makan'})
+        self.assertEqual(normalizer.normalize_text('gw mkn')[0], 'aku makan')
+
+        with self.assertRaises(ValueError):
+            Normalizer(common_words=['saya'], overrides=[{'slang': {'gw': 'saya'}}]).corpus
+        with self.assertRaises(ValueError):
+            Normalizer(corpus=Corpus(['saya'], {}), slangs={'gw': 'saya'})
+
+    def test_reload(self):
+        """reload membaca ulang file dan menggantikan korpus (serta cache token) tanpa membuat Normalizer baru."""
+        slangs_csv_path = self._write('slangs.csv', 'slang,formal\ngw,saya\n')
+        normalizer = Normalizer(cache_size=100, common_words=self.common_words_path, slangs=slangs_csv_path)
+        with contextlib.redirect_stdout(io.StringIO()):
+            old_corpus = normalizer.corpus
+            self.assertEqual(normalizer.normalize_text('gw makan')[0], 'saya makan')
+
+            self._write('slangs.csv', 'slang,formal\ngw,aku\n')
+            new_corpus = normalizer.reload().result(timeout=10)
+        self.assertIs(normalizer.corpus, new_corpus)
+        self.assertNotEqual(old_corpus.version, new_corpus.version)
+        self.assertEqual(normalizer.normalize_text('gw makan')[0], 'aku makan')
+        # Korpus lama tetap utuh bagi panggilan yang masih memakainya
+        self.assertEqual(old_corpus.slang_map['gw'], 'saya')
+
+        with self.assertRaises(ValueError):
+            Normalizer(corpus=Corpus(['saya'], {})).reload()
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,91 @@
+import unittest
+from unittest import mock
+
+from indo_normalizer import Normalizer, parallel
+from indo_normalizer.columnar import normalize_column
+from indo_normalizer.stages import COUNT_KEYS
+
+try:
+    import pandas as pd
+except ImportError:
+    pd = None
+
+try:
+    import polars as pl
+except ImportError:
+    pl = None
+
+import indo_normalizer.dataframe  # noqa: F401 (mendaftarkan namespace `indo`)
+
+TEXTS = ["H4loooo, akU k3ren bgt!", None, "yg bgt", "", "yg bgt", "saya kerjain tugas kompurer"]
+
+
+class TestNormalizeColumn(unittest.TestCase):
+
+    @classmethod
+    def setUpClass(cls):
+        cls.normalizer = Normalizer()
+
+    def test_matches_normalize_text(self):
+        """Hasil per kolom identik dengan normalize_text per baris; nilai kosong menjadi None."""
+        normalized, counts = normalize_column(TEXTS, self.normalizer)
+        self.assertEqual(set(counts), set(COUNT_KEYS))
+        for i, text in enumerate(TEXTS):
+            with self.subTest(text=text):
+                if text is None:
+                    self.assertIsNone(normalized[i])
+                    self.assertTrue(all(counts[key][i] == 0 for key in COUNT_KEYS))
+                    continue
+                expected_text, expected_counts = self.normalizer.normalize_text(text)
+                self.assertEqual(normalized[i], expected_text)
+                self.assertEqual({key: counts[key][i] for key in COUNT_KEYS},
+                                 {key: expected_counts.get(key, 0) for key in COUNT_KEYS})
+
+    @unittest.skipIf(pd is None, "pandas is not installed")
+    def test_pandas_accessor(self):
+        """Series.indo.normalize mengembalikan kolom teks dan counts dengan index yang sama."""
+        series = pd.Series(TEXTS, index=range(10, 10 + len(TEXTS)), name="teks")
+        frame = series.indo.normalize(self.normalizer)
+        self.assertEqual(list(frame.columns), ["normalized_text", *COUNT_KEYS])
+        self.assertEqual(list(frame.index), list(series.index))
+        normalized, counts = normalize_column(TEXTS, self.normalizer)
+        self.assertEqual(frame["normalized_text"].tolist(), normalized)
+        self.assertEqual(frame["slangs"].tolist(), counts["slangs"])
+        self.assertEqual(str(frame["typo_words"].dtype), "int64")
+
+        only_text = series.indo.normalize(self.normalizer, counts=False)
+        self.assertEqual(only_text.tolist(), normalized)
+        self.assertEqual(only_text.name, "teks")
+
+    @unittest.skipIf(pl is None, "polars is not installed")
+    def test_polars_expression(self):
+        """pl.col(...).indo.normalize menghasilkan Struct berisi teks dan counts."""
+        frame = pl.DataFrame({"teks": TEXTS})
+        result = frame.with_columns(pl.col("teks").indo.normalize(self.normalizer).alias("hasil")).unnest("hasil")
+        normalized, counts = normalize_column(TEXTS, self.normalizer)
+        self.assertEqual(result["normalized_text"].to_list(), normalized)
+        for key in COUNT_KEYS:
+            self.assertEqual(result[key].to_list(), counts[key])
+
+    @unittest.skipIf(pl is None, "polars is not installed")
+    def test_polars_workers_share_one_pool(self):
+        """Dengan workers > 1, semua batch frame streaming memakai satu WorkerPool milik ekspresi."""
+        texts = [text for text in TEXTS if text is not None]
+        frame = pl.concat([pl.LazyFrame({"teks": texts}) for _ in range(4)])
+        expression = pl.col("teks").indo.normalize(self.normalizer, workers=2).alias("hasil")
+        batches = []
+
+        def counting_normalize_column(texts, *args, **kwargs):
+            batches.append(len(texts))
+            return normalize_column(texts, *args, **kwargs)
+
+        with mock.patch.object(indo_normalizer.dataframe, "normalize_column", counting_normalize_column), \
+                mock.patch.object(parallel, "WorkerPool", wraps=parallel.WorkerPool) as pools:
+            result = frame.select(expression).unnest("hasil").collect(engine="streaming")
+        self.assertGreater(len(batches), 1)
+        self.assertEqual(pools.call_count, 1)
+        self.assertEqual(result["normalized_text"].to_list(), normalize_column(texts * 4, self.normalizer)[0])
+
+
+if __name__ == '__main__':
+    unittest.main()
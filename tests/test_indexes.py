@@ -0,0 +1,173 @@
+import unittest
+import os
+import random
+import time
+
+from indo_normalizer.functions import is_abbreviation, is_typo, normalize_leet
+from indo_normalizer.indexes import AbbreviationIndex, TypoIndex, word_prefixes
+
+CORPUS_DIR = os.path.join(os.path.dirname(__file__), '..', 'indo_normalizer', 'corpus')
+
+
+def load_common_words():
+    with open(os.path.join(CORPUS_DIR, 'common_words.txt'), encoding='utf-8') as f:
+        return [line.strip().lower() for line in f if line.strip()]
+
+
+class TestAbbreviationIndex(unittest.TestCase):
+
+    @classmethod
+    def setUpClass(cls):
+        cls.words = load_common_words()
+        cls.index = AbbreviationIndex(cls.words)
+
+    def linear_scan(self, abbr):
+        for word in self.words:
+            if is_abbreviation(abbr, word):
+                return word
+        return None
+
+    def test_same_result_as_linear_scan(self):
+        """Indeks harus mengembalikan kecocokan pertama yang sama dengan pemindaian linear."""
+        tokens = ['yg', 'bgt', 'kyknya', 'btw', 'dll', 'blm', 'Yg', 'YG', 'tdk', 'gmn',
+                  'kmrn', 'sy', 'a', 'x', 'qwrtz', ', ', ' ', 'ngaku"', 'b2', 's3ndiri']
+        for token in tokens:
+            with self.subTest(token=token):
+                match, _ = self.index.lookup(token)
+                self.assertEqual(match, self.linear_scan(token))
+
+    def test_reports_candidates_checked(self):
+        """Jumlah kandidat yang diperiksa jauh lebih kecil dari ukuran korpus."""
+        match, checked = self.index.lookup('bgt')
+        self.assertEqual(match, 'banget')
+        self.assertGreaterEqual(checked, 1)
+        self.assertLess(checked, len(self.words))
+
+    def test_empty_index(self):
+        """Indeks kosong tidak pernah menemukan kecocokan."""
+        self.assertEqual(AbbreviationIndex([]).lookup('yg'), (None, 0))
+
+    def test_max_rank(self):
+        """max_rank membatasi pencarian ke kata-kata pertama korpus, sama seperti memotong korpus."""
+        for max_rank in (0, 10, 500, 5000):
+            truncated = self.words[:max_rank]
+            for token in ('yg', 'bgt', 'kyknya', 'kmrn', 'tdk'):
+                with self.subTest(max_rank=max_rank, token=token):
+                    match, _ = self.index.lookup(token, max_rank)
+                    self.assertEqual(match, next((w for w in truncated if is_abbreviation(token, w)), None))
+        self.assertEqual(self.index.lookup('bgt', len(self.words)), self.index.lookup('bgt'))
+
+
+class TestTypoIndex(unittest.TestCase):
+
+    @classmethod
+    def setUpClass(cls):
+        cls.words = load_common_words()
+        cls.index = TypoIndex(cls.words)
+
+    def linear_scan(self, word):
+        for target in self.words:
+            if is_typo(word, target):
+                return target
+        return None
+
+    def test_same_result_as_linear_scan(self):
+        """Indeks harus mengembalikan kata pertama berjarak 1-2 yang sama dengan pemindaian linear."""
+        tokens = ['kompurer', 'kerjain', 'jempyut', 'qwrtzxv', 'bangt', 'kyknya',
+                  'a', 'xx', 'mnyebalkan', 'pengennya', 'zzzzzzzzzzzzzzzzzzzzzzzzzzzz']
+        for token in tokens:
+            with self.subTest(token=token):
+                match, _ = self.index.lookup(token)
+                self.assertEqual(match, self.linear_scan(token))
+
+    def test_reports_candidates_checked(self):
+        """Filter karakter menyisakan jauh lebih sedikit kandidat daripada jendela panjang kata."""
+        for token in ('qwrtzxv', 'kompurer', 'mnyebalkan'):
+            with self.subTest(token=token):
+                window = sum(abs(len(word) - len(token)) <= 2 for word in self.words)
+                candidates = self.index.candidates(token)
+                _, checked = self.index.lookup(token)
+                self.assertLessEqual(checked, len(candidates))
+                self.assertLess(len(candidates), window // 20)
+        self.assertEqual(self.index.lookup('qwrtzxv'), (None, len(self.index.candidates('qwrtzxv'))))
+
+    def test_filter_keeps_every_match(self):
+        """Semua kata berjarak 1-2 lolos filter karakter (filter tidak pernah membuang kecocokan)."""
+        rng = random.Random(20240601)
+        for _ in range(200):
+            target = rng.choice(self.words)
+            chars = list(target)
+            for _ in range(rng.randint(1, 2)):
+                position = rng.randrange(len(chars) + 1)
+                operation = rng.choice('isdt')
+                if operation == 'i':
+                    chars.insert(position, rng.choice('abcdefghijklmnopqrstuvwxyz'))
+                elif chars and position < len(chars):
+                    if operation == 's':
+                        chars[position] = rng.choice('abcdefghijklmnopqrstuvwxyz')
+                    elif operation == 'd':
+                        del chars[position]
+                    elif position + 1 < len(chars):
+                        chars[position], chars[position + 1] = chars[position + 1], chars[position]
+            token = "".join(chars)
+            with self.subTest(token=token):
+                candidates = set(self.index.candidates(token))
+                for word in self.words:
+                    if abs(len(word) - len(token)) <= 2 and is_typo(token, word):
+                        self.assertIn(word, candidates)
+
+    def test_empty_index(self):
+        """Indeks kosong tidak pernah menemukan kecocokan."""
+        self.assertEqual(TypoIndex([]).lookup('kompurer'), (None, 0))
+
+    def test_max_rank(self):
+        """max_rank membatasi kandidat ke kata-kata pertama korpus, sama seperti memotong korpus."""
+        for max_rank in (0, 10, 500, 5000):
+            truncated = self.words[:max_rank]
+            for token in ('kompurer', 'kerjain', 'bangt', 'qwrtzxv'):
+                with self.subTest(max_rank=max_rank, token=token):
+                    match, checked = self.index.lookup(token, max_rank)
+                    self.assertEqual(match, next((w for w in truncated if is_typo(token, w)), None))
+                    self.assertLessEqual(checked, max_rank)
+
+
+class TestLeetPruning(unittest.TestCase):
+
+    @classmethod
+    def setUpClass(cls):
+        cls.words = load_common_words()
+        cls.word_set = set(cls.words)
+        cls.prefixes = word_prefixes(cls.words)
+
+    def test_word_prefixes(self):
+        """Set prefiks berisi semua prefiks tidak kosong, termasuk kata utuh."""
+        self.assertEqual(word_prefixes(['aku', 'ada']), {'a', 'ak', 'aku', 'ad', 'ada'})
+
+    def test_same_result_as_full_search(self):
+        """Penelusuran yang dipangkas prefiks menghasilkan kata yang sama dengan penelusuran penuh."""
+        tokens = ['k3ren', 'g4j3', 's4raninnn', 'bag1', '4d4', 'ada2', 'l4g12', 'J3MpyUt',
+                  '1n1', '!n!', '0r4ng', '5aya', '7alan', 'ΣΙ5', 'x1x1', '12345', '2']
+        rng = random.Random(20240503)
+        for _ in range(500):
+            tokens.append("".join(rng.choice("aiklno1!04@5$7s2") for _ in range(rng.randint(1, 8))))
+        for token in tokens:
+            with self.subTest(token=token):
+                self.assertEqual(normalize_leet(token, self.word_set, self.prefixes),
+                                 normalize_leet(token, self.word_set))
+
+    def test_adversarial_token_is_bounded(self):
+        """Token panjang penuh simbol leet selesai cepat berkat pemangkasan dan batas ekspansi."""
+        token = "1!1!0" * 40
+        start = time.perf_counter()
+        self.assertEqual(normalize_leet(token, self.word_set, self.prefixes, 10_000), token)
+        self.assertEqual(normalize_leet(token, self.word_set, None, 10_000), token)
+        self.assertLess(time.perf_counter() - start, 5)
+
+    def test_expansion_cap_keeps_found_candidates(self):
+        """Jika batas ekspansi tercapai, hanya kandidat yang sudah ditemukan yang dipakai."""
+        self.assertEqual(normalize_leet('k3ren', self.word_set, max_expansions=1), 'k3ren')
+        self.assertEqual(normalize_leet('k3ren', self.word_set, max_expansions=100), 'kEren')
+
+
+if __name__ == '__main__':
+    unittest.main()
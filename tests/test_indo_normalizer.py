@@ -1,6 +1,24 @@
 import unittest
 import os
+import itertools
+import multiprocessing
+import threading
+import pickle
+import subprocess
+import sys
 from indo_normalizer import Normalizer
+from indo_normalizer.parallel import WorkerError
+from indo_normalizer.stages import ALL_STAGES
+
+
+class CrashingNormalizer(Normalizer):
+    """Normalizer yang mematikan proses worker, untuk menguji penanganan kegagalan worker."""
+
+    def normalize_many(self, texts, workers=1, **kwargs):
+        if workers == 1:
+            # Hanya terjadi di dalam worker: proses induk selalu memanggil dengan workers > 1
+            os._exit(1)
+        return super().normalize_many(texts, workers=workers, **kwargs)
 
 class TestIndoNormalizer(unittest.TestCase):
 
@@ -87,6 +105,23 @@ class TestIndoNormalizer(unittest.TestCase):
         self.assertEqual(normalized_text, expected_text)
         self.assertGreaterEqual(counts.get('typo_words', 0), 1)
 
+    def test_max_rank(self):
+        """Uji max_rank: kata di luar batas frekuensi tidak lagi dipakai untuk koreksi."""
+        text = "saya kerjain tugas kompurer"
+        rank = self.normalizer.corpus.words.index('komputer')
+        self.assertEqual(Normalizer(max_rank=rank + 1).normalize_text(text)[0], "saya kerjain tugas komputer")
+        # Kata di luar batas tetap dikenali sebagai kata baku, hanya tidak dipakai sebagai koreksi
+        self.assertEqual(Normalizer(max_rank=rank).normalize_text(text)[0], "saya kerjain tugas kompurer")
+
+    def test_token_cache_respects_search_limits(self):
+        """Uji mengubah max_rank setelah cache terisi tidak mengembalikan hasil dari batas lama."""
+        text = "saya kerjain tugas kompurer"
+        rank = self.normalizer.corpus.words.index('komputer')
+        cached = Normalizer(cache_size=100, max_rank=rank + 1)
+        self.assertEqual(cached.normalize_many([text])[0][0], "saya kerjain tugas komputer")
+        cached.max_rank = rank
+        self.assertEqual(cached.normalize_many([text])[0][0], "saya kerjain tugas kompurer")
+
     def test_normalize_text_combined(self):
         """Uji kombinasi berbagai jenis normalisasi dalam satu kalimat."""
         text = "H4loooo, akU k3ren bgt! g4j3 kyknya btw ini masssaaa aku s4raninnn kamu n4nti JEMpyUt aku yaa. pusinggg bgt!"
@@ -118,6 +153,45 @@ class TestIndoNormalizer(unittest.TestCase):
         slang_count = self.normalizer.count_slangs(text)
         self.assertEqual(slang_count, 2)
 
+    def test_analyze(self):
+        """Uji analyze mengembalikan teks dan seluruh statistik yang sama dengan pemanggilan terpisah."""
+        texts = [
+            "Aku 4L@y bgt, m3mang. Ini t3ks uji.",
+            "lagi gaje, btw mau kemana? nyebur?",
+            "H4loooo, akU k3ren bgt! g4j3 kyknya btw ini masssaaa aku s4raninnn kamu n4nti JEMpyUt aku yaa. pusinggg bgt!",
+            "saya kerjain tugas kompurer",
+            "",
+        ]
+        for text in texts:
+            with self.subTest(text=text):
+                result = self.normalizer.analyze(text)
+                normalized_text, counts = self.normalizer.normalize_text(text)
+                self.assertEqual(result['normalized_text'], normalized_text)
+                self.assertEqual(result['counts'], dict(counts))
+                self.assertEqual(result['alay_count'], self.normalizer.count_alays(text))
+                self.assertEqual(result['slang_count'], self.normalizer.count_slangs(text))
+
+    def test_stage_selection(self):
+        """Uji tahap yang dinonaktifkan tidak dijalankan dan tidak muncul di counts."""
+        text = "H4loooo, akU k3ren bgt! g4j3 kyknya btw saya kerjain tugas kompurer"
+        quick = Normalizer(stages=ALL_STAGES - {'abbreviation', 'typo'}, cache_size=1000)
+        normalized_text, counts = quick.normalize_text(text)
+        self.assertEqual(normalized_text, "HAlo, akU kEren bgt! enggak jelas kyknya btw saya kerjain tugas kompurer")
+        self.assertNotIn('abbreviated_words', counts)
+        self.assertNotIn('typo_words', counts)
+        self.assertIn('slangs', counts)
+
+        # Konfigurasi per panggilan menimpa konfigurasi Normalizer; cache tidak mencampur hasilnya
+        self.assertEqual(quick.normalize_text(text, stages=ALL_STAGES), self.normalizer.normalize_text(text))
+        self.assertEqual(quick.normalize_text(text), (normalized_text, counts))
+        self.assertEqual(quick.normalize_many([text, text], stages=['slang'])[0],
+                         self.normalizer.normalize_text(text, stages=['slang']))
+        self.assertEqual(self.normalizer.normalize_text(text, stages=[]), (text, {}))
+        self.assertEqual(self.normalizer.normalize_text("ada2 aja", stages=['leet'])[0], "ada-ada aja")
+
+        with self.assertRaises(ValueError):
+            Normalizer(stages=['typo', 'stemming'])
+
     def test_empty_string_inputs(self):
         """Uji semua fungsi dengan input string kosong."""
         self.assertEqual(self.normalizer.text_to_words(""), [])
@@ -127,5 +201,171 @@ class TestIndoNormalizer(unittest.TestCase):
         self.assertEqual(self.normalizer.count_alays(""), 0)
         self.assertEqual(self.normalizer.count_slangs(""), 0)
 
+    def test_normalize_many_matches_normalize_text(self):
+        """Uji normalize_many menghasilkan output identik dengan normalize_text per item."""
+        texts = [
+            "H4loooo, akU k3ren bgt! g4j3 kyknya btw ini masssaaa aku s4raninnn kamu n4nti JEMpyUt aku yaa. pusinggg bgt!",
+            "yg penting kamu bgt lagi males",
+            "",
+            "yg penting kamu bgt lagi males",
+            "Aku 4L@y bgt, m3mang. Ini t3ks uji.",
+        ]
+        expected = [self.normalizer.normalize_text(text) for text in texts]
+        self.assertEqual(self.normalizer.normalize_many(texts), expected)
+
+    def test_normalize_many_accepts_iterables(self):
+        """Uji normalize_many menerima generator dan mempertahankan urutan input."""
+        texts = ["saya kerjain tugas kompurer", "tungguuuuuuuu pusinggg aku yaaaaa"]
+        results = self.normalizer.normalize_many(text for text in texts)
+        self.assertEqual([text for text, _ in results], ["saya kerjain tugas komputer", "tunggu pusing aku ya"])
+        self.assertEqual(self.normalizer.normalize_many([]), [])
+
+    def test_normalize_stream(self):
+        """Uji normalize_stream menghasilkan output identik dan berurutan, tanpa membaca seluruh input."""
+        texts = ["yg penting kamu bgt lagi males", "aku k3ren pake h4lo", "", "saya kerjain tugas kompurer"] * 5
+        expected = [self.normalizer.normalize_text(text) for text in texts]
+        self.assertEqual(list(self.normalizer.normalize_stream(iter(texts), batch_size=3)), expected)
+        self.assertEqual(list(self.normalizer.normalize_stream(texts, batch_size=3, prefetch=4)), expected)
+        self.assertEqual(list(self.normalizer.normalize_stream(texts, batch_size=3, workers=2)), expected)
+
+        # Stream tanpa akhir: hanya batch yang sedang diproses yang dibaca dari input
+        consumed = []
+        endless = (consumed.append(i) or "yg bgt" for i in itertools.count())
+        first = list(itertools.islice(self.normalizer.normalize_stream(endless, batch_size=10), 5))
+        self.assertEqual(first, [("yang banget", {'abbreviated_words': 2})] * 5)
+        self.assertEqual(len(consumed), 10)
+
+        with self.assertRaises(ValueError):
+            self.normalizer.normalize_stream(texts, batch_size=0)
+
+    def test_normalize_stream_prefetch(self):
+        """Dengan prefetch, teks yang sudah tersedia diproses tanpa menunggu batch penuh."""
+        released = threading.Event()
+
+        def slow_source():
+            yield "yg bgt"
+            released.wait(5)
+            yield "aku k3ren"
+            raise OSError("sumber terputus")
+
+        stream = self.normalizer.normalize_stream(slow_source(), batch_size=100, prefetch=10)
+        self.assertEqual(next(stream)[0], "yang banget")
+        released.set()
+        self.assertEqual(next(stream)[0], "aku kEren")
+        with self.assertRaises(OSError):
+            next(stream)
+
+    def test_normalize_stream_parallel_slow_source(self):
+        """Dengan workers > 1, hasil batch yang selesai dihasilkan tanpa menunggu sumber yang lambat."""
+        for prefetch, batch_size in [(10, 100), (0, 1)]:
+            with self.subTest(prefetch=prefetch, batch_size=batch_size):
+                released = threading.Event()
+                resumed = threading.Event()
+
+                def slow_source():
+                    yield "yg bgt"
+                    released.wait(10)
+                    resumed.set()
+                    yield "aku k3ren"
+
+                stream = self.normalizer.normalize_stream(slow_source(), batch_size=batch_size,
+                                                          prefetch=prefetch, workers=2)
+                self.assertEqual(next(stream)[0], "yang banget")
+                # Hasil pertama tidak menunggu sumber melanjutkan atau batch terisi penuh
+                self.assertFalse(resumed.is_set())
+                released.set()
+                self.assertEqual([text for text, _ in stream], ["aku kEren"])
+
+    def test_normalize_many_parallel(self):
+        """Uji normalize_many dengan process pool menghasilkan output identik dan berurutan."""
+        texts = ["yg penting kamu bgt lagi males", "aku k3ren pake h4lo", "", "saya kerjain tugas kompurer"] * 5
+        expected = [self.normalizer.normalize_text(text) for text in texts]
+        results = self.normalizer.normalize_many(iter(texts), workers=2, chunksize=3)
+        self.assertEqual(results, expected)
+
+    def test_normalize_many_parallel_propagates_errors(self):
+        """Uji error di dalam worker diteruskan ke pemanggil."""
+        with self.assertRaises(TypeError):
+            self.normalizer.normalize_many(["aku", 123], workers=2, chunksize=1)
+
+    @unittest.skipUnless('fork' in multiprocessing.get_all_start_methods(), "start method 'fork' tidak tersedia")
+    def test_normalize_many_parallel_worker_crash(self):
+        """Uji worker yang mati dilaporkan sebagai WorkerError."""
+        crashing = CrashingNormalizer()
+        with self.assertRaises(WorkerError):
+            crashing.normalize_many(["aku", "kamu"], workers=2, chunksize=1, start_method='fork')
+
+    @unittest.skipUnless('fork' in multiprocessing.get_all_start_methods(), "start method 'fork' tidak tersedia")
+    def test_normalize_many_parallel_fork_loads_corpus_in_parent(self):
+        """Uji korpus dimuat di proses induk sebelum worker 'fork' dibuat, sehingga diwarisi worker."""
+        normalizer = Normalizer()
+        self.assertIsNone(normalizer._corpus)
+        normalizer.normalize_many(["yg bgt", "aku"], workers=2, chunksize=1, start_method='fork')
+        self.assertIsNotNone(normalizer._corpus)
+
+    def test_token_cache(self):
+        """Uji cache token menghasilkan output identik dan mencatat hits, misses, dan evictions."""
+        cached = Normalizer(cache_size=4)
+        text = "yg penting kamu bgt lagi males, yg penting bgt"
+        expected = self.normalizer.normalize_text(text)
+        self.assertEqual(cached.normalize_text(text), expected)
+        self.assertEqual(cached.normalize_text(text), expected)
+
+        stats = cached.cache_stats()
+        self.assertGreater(stats['hits'], 0)
+        self.assertGreater(stats['misses'], 0)
+        self.assertGreater(stats['evictions'], 0)
+        self.assertLessEqual(stats['size'], 4)
+
+        cached.clear_cache()
+        self.assertEqual(cached.cache_stats()['size'], 0)
+        self.assertIsNone(self.normalizer.cache_stats())
+
+    def test_stage_metrics(self):
+        """Uji instrumentasi mencatat waktu, pemanggilan, dan perbandingan korpus tanpa mengubah output."""
+        exported = []
+        instrumented = Normalizer(metrics_callback=exported.append)
+        text = "H4loooo, akU k3ren bgt! g4j3 kyknya btw kompurer x1x1"
+        self.assertEqual(instrumented.normalize_text(text), self.normalizer.normalize_text(text))
+
+        self.assertEqual(len(exported), 1)
+        self.assertEqual(instrumented.last_metrics, exported[0])
+        stages = exported[0]['stages']
+        self.assertEqual(exported[0]['texts'], 1)
+        self.assertEqual(stages['tokenize']['calls'], 1)
+        self.assertEqual(stages['retokenize']['calls'], 1)
+        for stage in ('repetitions', 'leet', 'forced_leet', 'abbreviation', 'slang', 'typo'):
+            self.assertGreater(stages[stage]['calls'], 0, stage)
+            self.assertGreaterEqual(stages[stage]['seconds'], 0.0, stage)
+        self.assertGreater(stages['abbreviation']['comparisons'], 0)
+        self.assertGreater(stages['typo']['comparisons'], 0)
+
+        # Agregat per Normalizer menjumlahkan semua panggilan, termasuk normalize_many (satu panggilan per batch)
+        instrumented.normalize_many([text, text])
+        self.assertEqual(len(exported), 2)
+        self.assertEqual(instrumented.stage_metrics()['texts'], 3)
+        instrumented.reset_metrics()
+        self.assertEqual(instrumented.stage_metrics()['texts'], 0)
+
+        # Nonaktif secara default; callback tidak ikut di-pickle ke proses worker
+        self.assertIsNone(self.normalizer.stage_metrics())
+        self.assertIsNone(pickle.loads(pickle.dumps(instrumented)).metrics_callback)
+
+    def test_lazy_loading_without_pandas(self):
+        """Uji membuat Normalizer tidak membaca korpus dan tidak mengimpor pandas."""
+        code = (
+            "import sys\n"
+            "from indo_normalizer import Normalizer\n"
+            "n = Normalizer()\n"
+            "from indo_normalizer import corpora\n"
+            "assert n._corpus is None and not corpora._REGISTRY\n"
+            "assert n.normalize_text('yg bgt')[0] == 'yang banget'\n"
+            "assert n._corpus is not None and len(corpora._REGISTRY) == 1\n"
+            "assert 'pandas' not in sys.modules\n"
+        )
+        root = os.path.join(os.path.dirname(__file__), '..')
+        result = subprocess.run([sys.executable, '-c', code], cwd=root, capture_output=True, text=True)
+        self.assertEqual(result.returncode, 0, result.stderr)
+
 if __name__ == '__main__':
     unittest.main(argv=['first-arg-is-ignored'], exit=False)
\ No newline at end of file
@@ -0,0 +1,115 @@
+import http.client
+import os
+import tempfile
+import threading
+import unittest
+from concurrent.futures import ThreadPoolExecutor
+
+from indo_normalizer import Normalizer
+from indo_normalizer.client import NormalizerClient
+from indo_normalizer.parallel import WorkerPool
+from indo_normalizer.serve import NormalizationServer, NormalizationService, UnixNormalizationServer
+
+TEXTS = ["H4loooo, akU k3ren bgt!", "yg bgt kyknya", "", "saya kerjain tugas kompurer"]
+
+
+class TestServe(unittest.TestCase):
+
+    @classmethod
+    def setUpClass(cls):
+        cls.normalizer = Normalizer()
+        cls.expected = [cls.normalizer.normalize_text(text) for text in TEXTS]
+        cls.service = NormalizationService(cls.normalizer, max_wait=0.01)
+        cls.server = NormalizationServer(("127.0.0.1", 0), cls.service)
+        threading.Thread(target=cls.server.serve_forever, daemon=True).start()
+        cls.client = NormalizerClient("http://127.0.0.1:%d" % cls.server.server_address[1])
+
+    @classmethod
+    def tearDownClass(cls):
+        cls.client.close()
+        cls.server.shutdown()
+        cls.server.server_close()
+        cls.service.close()
+
+    def test_same_results_as_normalizer(self):
+        """Klien mengembalikan hasil yang sama dengan Normalizer lokal, tunggal maupun batch."""
+        self.assertEqual([self.client.normalize_text(text) for text in TEXTS],
+                         [(text, dict(counts)) for text, counts in self.expected])
+        self.assertEqual(self.client.normalize_many(TEXTS), [(text, dict(counts)) for text, counts in self.expected])
+        self.assertEqual(self.client.normalize_text("akU k3ren bgt", stages=["leet"]),
+                         self.normalizer.normalize_text("akU k3ren bgt", stages=["leet"]))
+
+    def test_concurrent_requests(self):
+        """Permintaan dari banyak thread digabung menjadi micro-batch tanpa mencampur hasil."""
+        texts = [f"yg bgt {i} kyknya" for i in range(40)]
+        with ThreadPoolExecutor(8) as executor:
+            results = list(executor.map(self.client.normalize_text, texts))
+        self.assertEqual(results, [self.normalizer.normalize_text(text) for text in texts])
+        stats = self.client.stats()
+        self.assertGreaterEqual(stats['requests'], 40)
+        self.assertGreater(stats['latency_ms']['p99'], 0)
+        self.assertEqual(stats['queue'], 0)
+
+    def test_bad_requests(self):
+        """Input yang tidak valid menghasilkan ValueError di klien (HTTP 400)."""
+        with self.assertRaises(ValueError):
+            self.client.normalize_text("yg", stages=["tidak_ada"])
+        with self.assertRaises(ValueError):
+            self.client._request("POST", "/normalize", {"texts": [1, 2]})
+        self.assertEqual(self.client.normalize_text("yg bgt")[0], "yang banget")
+
+    def test_invalid_input_types(self):
+        """Tipe input yang salah ditolak dengan HTTP 400 sebelum normalisasi dan tidak dihitung sebagai error."""
+        errors = self.client.stats()['errors']
+        for body in [{"text": 5}, {"text": None}, {"texts": "yg bgt"}, {"texts": {"a": "yg"}},
+                     {"text": "yg", "stages": 5}, {"text": "yg", "stages": [["leet"]]},
+                     {"text": "yg", "stages": {"leet": 1}}, {"texts": ["yg"], "stages": [1]}]:
+            with self.subTest(body=body):
+                with self.assertRaises(ValueError):
+                    self.client._request("POST", "/normalize", body)
+        self.assertEqual(self.client.stats()['errors'], errors)
+        self.assertEqual(self.client.normalize_text("akU k3ren", stages="leet"),
+                         self.normalizer.normalize_text("akU k3ren", stages="leet"))
+
+        connection = http.client.HTTPConnection("127.0.0.1", self.server.server_address[1])
+        try:
+            connection.putrequest("POST", "/normalize")
+            connection.putheader("Content-Length", "banyak")
+            connection.endheaders()
+            self.assertEqual(connection.getresponse().status, 400)
+        finally:
+            connection.close()
+
+    def test_worker_pool_stats(self):
+        """Dengan WorkerPool, /stats melaporkan cache dan metrik tahap dari proses worker."""
+        normalizer = Normalizer(cache_size=1000, instrument=True)
+        with WorkerPool(normalizer, 2) as pool:
+            service = NormalizationService(normalizer, pool, max_wait=0.01, concurrency=2)
+            try:
+                for _ in range(3):
+                    self.assertEqual(service.normalize(TEXTS), self.expected)
+                stats = service.stats()
+            finally:
+                service.close()
+        self.assertGreater(stats['cache']['hits'] + stats['cache']['misses'], 0)
+        # Teks kosong tidak melewati pipeline sehingga tidak tercatat
+        self.assertEqual(stats['stages']['texts'], 3 * len([text for text in TEXTS if text]))
+
+    def test_unix_socket(self):
+        """Server juga bisa melayani lewat Unix domain socket."""
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            path = os.path.join(tmp_dir, "normalizer.sock")
+            server = UnixNormalizationServer(path, self.service)
+            threading.Thread(target=server.serve_forever, daemon=True).start()
+            client = NormalizerClient(unix_socket=path)
+            try:
+                self.assertEqual(client.normalize_many(TEXTS), [(text, dict(counts)) for text, counts in self.expected])
+            finally:
+                client.close()
+                server.shutdown()
+                server.server_close()
+            self.assertFalse(os.path.exists(path))
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,150 @@
+import unittest
+import io
+import os
+import shutil
+import tempfile
+import contextlib
+import pickle
+from unittest import mock
+
+from indo_normalizer import snapshot
+from indo_normalizer.corpora import Corpus, bundled_paths, read_common_words, read_slang_map
+from indo_normalizer.indexes import AbbreviationIndex, TypoIndex, word_prefixes
+
+CORPUS_DIR = os.path.join(os.path.dirname(__file__), '..', 'indo_normalizer', 'corpus')
+
+
+class TestSnapshot(unittest.TestCase):
+
+    def setUp(self):
+        self.tmp_dir = tempfile.mkdtemp()
+        self.common_words_path = os.path.join(self.tmp_dir, 'common_words.txt')
+        self.slangs_csv_path = os.path.join(self.tmp_dir, 'slangs.csv')
+        self.snapshot_path = os.path.join(self.tmp_dir, 'corpus.snapshot')
+        shutil.copy(os.path.join(CORPUS_DIR, 'common_words.txt'), self.common_words_path)
+        shutil.copy(os.path.join(CORPUS_DIR, 'slangs.csv'), self.slangs_csv_path)
+        snapshot.build_snapshot(self.common_words_path, self.slangs_csv_path, self.snapshot_path)
+
+    def tearDown(self):
+        shutil.rmtree(self.tmp_dir)
+
+    def test_roundtrip_matches_text_corpus(self):
+        """Snapshot menghasilkan korpus dan indeks yang sama dengan file teks."""
+        words, abbreviation_index, typo_index, prefixes = snapshot.load_common_words(self.snapshot_path, self.common_words_path)
+        expected_words = read_common_words(self.common_words_path)
+        self.assertEqual(list(words), expected_words)
+        self.assertEqual(abbreviation_index.state(), AbbreviationIndex(expected_words).state())
+        self.assertEqual(prefixes, word_prefixes(expected_words))
+        for token in ['yg', 'bgt', 'kompurer', 'jempyut', 'qwrtzxv']:
+            self.assertEqual(abbreviation_index.lookup(token), AbbreviationIndex(expected_words).lookup(token))
+            self.assertEqual(typo_index.lookup(token), TypoIndex(expected_words).lookup(token))
+
+        slang_map = snapshot.load_slang_map(self.snapshot_path, self.slangs_csv_path)
+        self.assertEqual(slang_map, read_slang_map(self.slangs_csv_path))
+
+    def test_missing_snapshot_falls_back(self):
+        """Snapshot yang tidak ada mengembalikan None (pemanggil memuat file teks)."""
+        os.remove(self.snapshot_path)
+        self.assertIsNone(snapshot.load_common_words(self.snapshot_path, self.common_words_path))
+        self.assertIsNone(snapshot.load_slang_map(self.snapshot_path, self.slangs_csv_path))
+
+    def test_stale_snapshot_falls_back(self):
+        """Snapshot diabaikan jika file sumbernya berubah setelah snapshot dibuat."""
+        with open(self.slangs_csv_path, 'a', encoding='utf-8') as f:
+            f.write("gpp,tidak apa-apa\n")
+        with contextlib.redirect_stdout(io.StringIO()) as output:
+            self.assertIsNone(snapshot.load_slang_map(self.snapshot_path, self.slangs_csv_path))
+        self.assertIn('stale', output.getvalue())
+        # Bagian common_words masih sesuai sumbernya
+        self.assertIsNotNone(snapshot.load_common_words(self.snapshot_path, self.common_words_path))
+
+    def test_corrupt_snapshot_falls_back(self):
+        """File yang bukan snapshot diabaikan dengan peringatan."""
+        with open(self.snapshot_path, 'wb') as f:
+            f.write(b'bukan snapshot sama sekali')
+        with contextlib.redirect_stdout(io.StringIO()) as output:
+            self.assertIsNone(snapshot.load_common_words(self.snapshot_path, self.common_words_path))
+        self.assertIn('WARNING', output.getvalue())
+
+    def test_truncated_snapshot_falls_back(self):
+        """Snapshot yang terpotong tidak dipakai sebagian, melainkan diabaikan dengan peringatan."""
+        size = os.path.getsize(self.snapshot_path)
+        with open(self.snapshot_path, 'r+b') as f:
+            f.truncate(size * 9 // 10)
+        with contextlib.redirect_stdout(io.StringIO()) as output:
+            self.assertIsNone(snapshot.load_common_words(self.snapshot_path, self.common_words_path))
+            self.assertIsNone(snapshot.load_slang_map(self.snapshot_path, self.slangs_csv_path))
+        self.assertIn('WARNING', output.getvalue())
+
+    def test_flipped_byte_falls_back(self):
+        """Satu byte yang berubah di bagian data terdeteksi lewat checksum."""
+        with open(self.snapshot_path, 'r+b') as f:
+            f.seek(-100, os.SEEK_END)
+            byte = f.read(1)
+            f.seek(-100, os.SEEK_END)
+            f.write(bytes([byte[0] ^ 0xFF]))
+        with contextlib.redirect_stdout(io.StringIO()) as output:
+            self.assertIsNone(snapshot.load_common_words(self.snapshot_path, self.common_words_path))
+        self.assertIn('corrupt', output.getvalue())
+
+    def test_corpus_from_corrupt_snapshot_uses_text_files(self):
+        """Corpus.from_files kembali ke file teks jika snapshot rusak, bukan melempar error."""
+        size = os.path.getsize(self.snapshot_path)
+        with open(self.snapshot_path, 'r+b') as f:
+            f.truncate(size * 9 // 10)
+        with contextlib.redirect_stdout(io.StringIO()):
+            corpus = Corpus.from_files(self.common_words_path, self.slangs_csv_path, self.snapshot_path)
+        self.assertEqual(list(corpus.words), read_common_words(self.common_words_path))
+        self.assertEqual(dict(corpus.slang_map), read_slang_map(self.slangs_csv_path))
+
+    def test_words_and_masks_stay_mapped(self):
+        """Kata dan bitmask karakter dari snapshot dibaca dari mmap, bukan disalin ke list/dict."""
+        words, abbreviation_index, typo_index, _ = snapshot.load_common_words(self.snapshot_path, self.common_words_path)
+        self.assertIsInstance(words, snapshot.MappedWords)
+        self.assertIsInstance(abbreviation_index.masks._char_masks, snapshot._KeyedMasks)
+        self.assertIs(typo_index.masks, abbreviation_index.masks)
+        self.assertEqual(words[-1], read_common_words(self.common_words_path)[-1])
+        # Salinan di proses lain berupa tuple biasa
+        self.assertEqual(pickle.loads(pickle.dumps(words)), tuple(words))
+
+        with contextlib.redirect_stdout(io.StringIO()):
+            corpus = Corpus.from_files(self.common_words_path, self.slangs_csv_path, self.snapshot_path)
+        self.assertIsInstance(corpus.words, snapshot.MappedWords)
+        self.assertIn(words[0], corpus.word_set)
+
+    def test_load_opens_snapshot_once(self):
+        """Corpus.from_files membuka dan memverifikasi snapshot sekali untuk kata dan slang."""
+        with mock.patch.object(snapshot, 'Snapshot', wraps=snapshot.Snapshot) as opened:
+            with contextlib.redirect_stdout(io.StringIO()) as output:
+                Corpus.from_files(self.common_words_path, self.slangs_csv_path, self.snapshot_path)
+        self.assertEqual(opened.call_count, 1)
+        self.assertEqual(output.getvalue().count('dari snapshot'), 2)
+
+    def test_cache_snapshot_built_on_first_load(self):
+        """Snapshot di folder cache dibuat saat pemuatan pertama dan dipakai oleh pemuatan berikutnya."""
+        cache_dir = os.path.join(self.tmp_dir, 'cache')
+        cache_path = os.path.join(cache_dir, snapshot.SNAPSHOT_FILENAME)
+        with mock.patch.dict(os.environ, {'INDO_NORMALIZER_CACHE_DIR': cache_dir}):
+            if not os.path.exists(os.path.join(CORPUS_DIR, snapshot.SNAPSHOT_FILENAME)):
+                self.assertEqual(bundled_paths()[2], cache_path)
+
+            with contextlib.redirect_stdout(io.StringIO()) as output:
+                first = Corpus.from_files(self.common_words_path, self.slangs_csv_path, cache_path)
+            self.assertNotIn('dari snapshot', output.getvalue())
+            self.assertTrue(os.path.exists(cache_path))
+
+            with contextlib.redirect_stdout(io.StringIO()) as output:
+                second = Corpus.from_files(self.common_words_path, self.slangs_csv_path, cache_path)
+            self.assertEqual(output.getvalue().count('dari snapshot'), 2)
+            self.assertEqual(second.version, first.version)
+
+            # Snapshot cache yang basi ditulis ulang dari file teks
+            with open(self.slangs_csv_path, 'a', encoding='utf-8') as f:
+                f.write("gpp,tidak apa-apa\n")
+            with contextlib.redirect_stdout(io.StringIO()):
+                Corpus.from_files(self.common_words_path, self.slangs_csv_path, cache_path)
+            self.assertEqual(snapshot.load_slang_map(cache_path, self.slangs_csv_path)['gpp'], 'tidak apa-apa')
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,123 @@
+import os
+import pickle
+import sqlite3
+import tempfile
+import time
+import unittest
+
+from indo_normalizer import Normalizer
+from indo_normalizer.store import TokenStore
+
+TEXTS = ["H4loooo, akU k3ren bgt!", "yg bgt kyknya", "saya kerjain tugas kompurer", "qwrtzxv zzzkkk"]
+
+
+class TestTokenStore(unittest.TestCase):
+
+    @classmethod
+    def setUpClass(cls):
+        cls.expected = Normalizer().normalize_many(TEXTS)
+
+    def setUp(self):
+        self.tmp_dir = tempfile.TemporaryDirectory()
+        self.path = os.path.join(self.tmp_dir.name, 'tokens.db')
+
+    def tearDown(self):
+        self.tmp_dir.cleanup()
+
+    def test_shared_across_runs(self):
+        """Normalizer baru dengan database yang sama memakai hasil run sebelumnya, termasuk token yang tidak berubah."""
+        first = Normalizer(store=self.path)
+        self.assertEqual(first.normalize_many(TEXTS), self.expected)
+        self.assertEqual(first.store_stats()['hits'], 0)
+        size = first.store_stats()['size']
+        self.assertGreater(size, 0)
+
+        second = Normalizer(store=TokenStore(self.path))
+        self.assertEqual([second.normalize_text(text) for text in TEXTS], self.expected)
+        stats = second.store_stats()
+        self.assertEqual((stats['misses'], stats['size']), (0, size))
+        self.assertGreaterEqual(stats['hits'], size)
+        self.assertIsNone(Normalizer().store_stats())
+
+    def test_invalidated_by_corpus_change(self):
+        """Korpus dengan isi berbeda tidak memakai hasil korpus lama."""
+        words = ['saya', 'makan', 'nasi']
+        old = Normalizer(common_words=words, slangs={'gw': 'saya'}, store=self.path)
+        self.assertEqual(old.normalize_text('gw makan')[0], 'saya makan')
+        new = Normalizer(common_words=words, slangs={'gw': 'aku'}, store=self.path)
+        self.assertEqual(new.normalize_text('gw makan')[0], 'aku makan')
+        # Pilihan tahap juga menjadi bagian dari kunci
+        self.assertEqual(new.normalize_text('gw makan', stages=['leet'])[0], 'gw makan')
+
+    def test_expired_versions_are_removed(self):
+        """Entri versi korpus yang tidak dipakai lebih lama dari retention_days dihapus."""
+        store = TokenStore(self.path, retention_days=0.5 / 86400)
+        Normalizer(common_words=['saya'], slangs={'gw': 'saya'}, store=store).normalize_text('gw')
+        time.sleep(1)
+        Normalizer(common_words=['saya'], slangs={'gw': 'aku'}, store=store).normalize_text('gw')
+        with sqlite3.connect(self.path) as connection:
+            self.assertEqual(connection.execute("SELECT COUNT(*) FROM versions").fetchone()[0], 1)
+            self.assertEqual(connection.execute("SELECT result FROM tokens WHERE namespace LIKE 'lexical%'").fetchall(),
+                             [('aku',)])
+
+    def test_flush_marks_version_used(self):
+        """Setiap flush memperbarui waktu terakhir versi korpus dipakai, sehingga versi yang aktif tidak kedaluwarsa."""
+        store = TokenStore(self.path)
+        stored = store.wrap('v1', 'ns', lambda token: (token.upper(), ()))
+        with sqlite3.connect(self.path) as connection:
+            connection.execute("UPDATE versions SET last_used = 0")
+        stored('gw')
+        store.flush()
+        with sqlite3.connect(self.path) as connection:
+            last_used = connection.execute("SELECT last_used FROM versions").fetchone()[0]
+        self.assertGreater(last_used, time.time() - 60)
+
+    def test_version_deleted_by_another_process(self):
+        """Id versi yang di-cache dan sudah dihapus proses lain didaftarkan ulang, dan id lama tidak dipakai ulang."""
+        store = TokenStore(self.path)
+        stored = store.wrap('v1', 'ns', lambda token: (token.upper(), ()))
+        stored('gw')
+        store.flush()
+        old_id = store._version_id('v1')
+
+        # Proses lain menghapus versi ini lalu mendaftarkan versi korpus lain
+        other = TokenStore(self.path)
+        other.clear()
+        other.wrap('v2', 'ns', lambda token: (token, ()))
+        with sqlite3.connect(self.path) as connection:
+            self.assertNotIn(old_id, [row[0] for row in connection.execute("SELECT id FROM versions")])
+
+        self.assertEqual(stored('gw'), ('GW', ()))
+        store.flush()
+        with sqlite3.connect(self.path) as connection:
+            rows = connection.execute(
+                "SELECT versions.version, tokens.token FROM tokens JOIN versions ON versions.id = tokens.version_id"
+            ).fetchall()
+        self.assertEqual(rows, [('v1', 'gw')])
+        self.assertNotEqual(store._version_id('v1'), old_id)
+        self.assertEqual(stored('gw'), ('GW', ()))
+        self.assertEqual(store.stats()['hits'], 1)
+
+    def test_old_schema_is_rebuilt(self):
+        """Database lama dengan id versi tanpa AUTOINCREMENT dibuat ulang."""
+        with sqlite3.connect(self.path) as connection:
+            connection.execute("CREATE TABLE versions (id INTEGER PRIMARY KEY, version TEXT NOT NULL UNIQUE, last_used REAL NOT NULL)")
+            connection.execute("INSERT INTO versions (version, last_used) VALUES ('lama', 0)")
+        TokenStore(self.path)
+        with sqlite3.connect(self.path) as connection:
+            sql = connection.execute("SELECT sql FROM sqlite_master WHERE name = 'versions'").fetchone()[0]
+            self.assertIn('AUTOINCREMENT', sql)
+            self.assertEqual(connection.execute("SELECT COUNT(*) FROM versions").fetchone()[0], 0)
+
+    def test_worker_processes(self):
+        """Beberapa proses worker membaca dan menulis database yang sama."""
+        normalizer = Normalizer(store=self.path)
+        self.assertEqual(normalizer.normalize_many(TEXTS * 4, workers=2, chunksize=2), self.expected * 4)
+        self.assertGreater(TokenStore(self.path).stats()['size'], 0)
+        copy = pickle.loads(pickle.dumps(normalizer))
+        self.assertEqual(copy.normalize_many(TEXTS), self.expected)
+        self.assertEqual(copy.store_stats()['misses'], 0)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,202 @@
+import unittest
+import random
+import re
+
+from indo_normalizer.functions import tokenize_text, retokenize, normalize_repetitions
+
+
+def reference_tokenize_text(s):
+    """
+    Implementasi tokenize_text sebelumnya (pemindaian per karakter), disalin apa adanya
+    sebagai acuan untuk uji ekuivalensi tokenizer baru.
+    """
+    ascii_symbols = "!@$"
+    tokens = []
+    n = len(s)
+
+    email_or_domain_pattern = re.compile(
+        r"\b[\w\.-]+@[\w\.-]+\.\w+\b|\b[\w\-]+\.(?:[\w\-]+\.)*[\w\-]+\b"
+    )
+    domain_spans = {m.span(): m.group() for m in email_or_domain_pattern.finditer(s)}
+
+    def is_letter(c):        return c.isalpha()
+    def is_letterlike(c):    return c.isdigit() or c in ascii_symbols
+
+    # sort by position
+    domain_pos = sorted(domain_spans.items())
+    idx = 0
+
+    while idx < n:
+        # domain/email check
+        matched = False
+        for (start, end), val in domain_pos:
+            if idx == start:
+                tokens.append(val)
+                idx = end
+                matched = True
+                break
+        if matched:
+            continue
+
+        # aturan 3: ' ! ' / ' @ ' / ' $ '
+        if idx + 2 < n and s[idx] == " " and s[idx+1] in ascii_symbols and s[idx+2] == " ":
+            tokens.append(s[idx:idx+3])
+            idx += 3
+            continue
+
+        c = s[idx]
+
+        # kandidat kata (huruf, digit, simbol)
+        if is_letter(c) or is_letterlike(c):
+            if c.isdigit() and (idx == 0 or s[idx-1] == " ") and (idx+1 == n or s[idx+1] == " "):
+                tokens.append(c)
+                idx += 1
+                continue
+            if c == "!" and idx > 0 and not s[idx-1].isspace() and (idx+1 == n or s[idx+1].isspace()):
+                tokens.append("!")
+                idx += 1
+                continue
+            j = idx
+            while j < n:
+                cj = s[j]
+                if cj == "!" and j > idx and not s[j-1].isspace() and (j+1 == n or s[j+1].isspace()):
+                    break
+                if is_letter(cj) or is_letterlike(cj):
+                    j += 1
+                else:
+                    break
+            tokens.append(s[idx:j])
+            idx = j
+            continue
+
+        # aturan 2: run spasi/punktuasi
+        j = idx
+        while j < n and not (is_letter(s[j]) or is_letterlike(s[j])):
+            j += 1
+        tokens.append(s[idx:j])
+        idx = j
+
+    return tokens
+
+
+def reference_normalize_repetitions(word):
+    """Implementasi normalize_repetitions sebelumnya (kuadratik), sebagai acuan uji ekuivalensi."""
+    result_word = ""
+    i = 0
+    while i < len(word):
+        result_word += word[i]
+        count = 1
+        while i + count < len(word) and word[i + count].lower() == word[i].lower():
+            count += 1
+        i += count if count >= 3 else 1
+    return result_word
+
+
+class TestTokenizerEquivalence(unittest.TestCase):
+
+    CASES = [
+        "",
+        " ",
+        "Halo, apa kabar?",
+        "H4loooo, akU k3ren bgt! g4j3 kyknya btw ini masssaaa aku s4raninnn kamu n4nti JEMpyUt aku yaa. pusinggg bgt!",
+        "bag1! ok",
+        "bag1!",
+        "!slam $aya @ngk4 al4y abi5",
+        "a ! b @ c $ d",
+        " ! ",
+        "1 2 3 12 a1 1a",
+        "7",
+        "email user@mail.id dan situs unimelb.edu.au ya",
+        "www.k3ren.com/abc?x=1",
+        "abc!.def",
+        "xy.ab!",
+        "_abc.com, _x",
+        "a-b.c-d e--f",
+        "wkwkwk!!! hahaha!!!",
+        "!!!???",
+        "tab\tdan\nbaris baru!\n",
+        "nbsp ! ok　!",
+        "pangkat x² dan ½ porsi, ²²² ½½",
+        "café İstanbul 東京 ١٢٣ ٤",
+        "emoji 😂😂 mantul!! 👍",
+    ]
+
+    def test_fixed_cases(self):
+        """Tokenizer baru menghasilkan token yang sama persis dengan implementasi acuan."""
+        for text in self.CASES:
+            with self.subTest(text=text):
+                self.assertEqual(tokenize_text(text), reference_tokenize_text(text))
+
+    def test_random_texts(self):
+        """Uji acak (seed tetap) dengan alfabet yang kaya kasus tepi."""
+        alphabet = list("aAbz019!@$ .,-_?\t\n") + ["²", "½", "é", "İ", "😂", " ", "١", "@mail", ".com", " ! ", " 7 "]
+        rng = random.Random(20240501)
+        for _ in range(3000):
+            text = "".join(rng.choice(alphabet) for _ in range(rng.randint(0, 40)))
+            with self.subTest(text=text):
+                self.assertEqual(tokenize_text(text), reference_tokenize_text(text))
+
+    def test_tokens_cover_input(self):
+        """Gabungan token selalu sama dengan teks input."""
+        for text in self.CASES:
+            self.assertEqual("".join(tokenize_text(text)), text)
+
+
+class TestRetokenize(unittest.TestCase):
+
+    def assertRetokenizeEquivalent(self, text, new_tokens):
+        tokens = tokenize_text(text)
+        self.assertEqual(retokenize(tokens, new_tokens), tokenize_text("".join(new_tokens)))
+
+    def test_fixed_cases(self):
+        """Tokenisasi ulang per token sama dengan tokenisasi ulang teks gabungan."""
+        self.assertRetokenizeEquivalent("ada2 bgt", ["ada-ada", " ", "bgt"])
+        self.assertRetokenizeEquivalent("bag1! ok", ["bagi", "!", " ", "ok"])
+        self.assertRetokenizeEquivalent("h4lo.", ["hAlo", "."])
+        self.assertRetokenizeEquivalent("abc!.def", ["abci", ".", "def"])
+        self.assertRetokenizeEquivalent("user@mail.id", ["useramail.id"])
+        self.assertRetokenizeEquivalent("x,_k3ren", ["x", ",_", "kEren"])
+
+    def test_random_replacements(self):
+        """Uji acak (seed tetap): token diganti string acak lalu dibandingkan dengan tokenisasi penuh."""
+        alphabet = list("aAbz019!@$ .,-_?\t\n") + ["²", "é", "😂", " ! ", ".com", ". "]
+        rng = random.Random(20240502)
+        for _ in range(3000):
+            text = "".join(rng.choice(alphabet) for _ in range(rng.randint(1, 25)))
+            tokens = tokenize_text(text)
+            new_tokens = list(tokens)
+            for _ in range(rng.randint(1, 3)):
+                i = rng.randrange(len(tokens))
+                source = alphabet if rng.random() < 0.3 else "abzAé-"
+                new_tokens[i] = "".join(rng.choice(source) for _ in range(rng.randint(1, 6)))
+            with self.subTest(text=text, new_tokens=new_tokens):
+                self.assertEqual(retokenize(tokens, new_tokens), tokenize_text("".join(new_tokens)))
+
+
+class TestRepetitions(unittest.TestCase):
+
+    def test_fixed_cases(self):
+        """Implementasi linear menghasilkan kata yang sama dengan implementasi acuan."""
+        cases = ["", "a", "aa", "aaa", "tungguuuuuuuu", "pusinggg", "yaAaA", "wkwkwk", "hahahaaaaa",
+                 "!!!", "111", "İİİ", "ΣσςΣ", "ßẞß", "aaBBBcc"]
+        for word in cases:
+            with self.subTest(word=word):
+                self.assertEqual(normalize_repetitions(word), reference_normalize_repetitions(word))
+
+    def test_random_words(self):
+        """Uji acak (seed tetap) dengan karakter yang lowercase-nya istimewa."""
+        alphabet = list("aAbBkK1!") + ["İ", "i", "ı", "Σ", "σ", "ς", "ß", "ẞ", "K"]
+        rng = random.Random(20240601)
+        for _ in range(3000):
+            word = "".join(rng.choice(alphabet) * rng.choice((1, 1, 2, 3, 4)) for _ in range(rng.randint(0, 8)))
+            with self.subTest(word=word):
+                self.assertEqual(normalize_repetitions(word), reference_normalize_repetitions(word))
+
+    def test_long_spam_token(self):
+        """Token spam yang sangat panjang tetap dinormalisasi dengan benar."""
+        self.assertEqual(normalize_repetitions("wk" * 2500), "wk" * 2500)
+        self.assertEqual(normalize_repetitions("ha" * 100 + "a" * 5000), "ha" * 100)
+
+
+if __name__ == '__main__':
+    unittest.main()